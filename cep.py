@@ -1,835 +1,151 @@
 # cep_streamlit_expanded_fixed_long_v2.py
+import io
+import os
 import streamlit as st
-import math
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle, Circle, FancyBboxPatch
+import numpy as np
 import pandas as pd
-import io
-from PIL import Image
-from reportlab.pdfgen import canvas as pdf_canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.utils import ImageReader
-
-st.set_page_config(page_title="CEP — Analysis & Design of Beam in Torsion", layout="wide")
 
-# ---------------------------
-# Visual / theme constants
-# ---------------------------
-BG_COLOR = "#2c2f33"
-FG_COLOR = "#dcdcdc"
-ACCENT_COLOR = "#4682b4"
-
-# ---------------------------
-# Bar diameter / area helpers (explicit copy)
-# ---------------------------
-BAR_DIAMETERS = {
-    3: 0.375,
-    4: 0.500,
-    5: 0.625,
-    6: 0.750,
-    7: 0.875,
-    8: 1.000,
-    9: 1.128,
-    10: 1.270,
-    11: 1.410,
-    14: 1.693,
-    18: 2.257
-}
-
-def area_of_bar_explicit(bar_number):
-    d = BAR_DIAMETERS.get(bar_number, 0)
-    if d <= 0:
-        return 0.0
-    return round((math.pi / 4) * d ** 2, 6)
-
-def area_of_bar(bar_number):
-    d = BAR_DIAMETERS.get(bar_number, 0)
-    return round((math.pi / 4) * d ** 2, 6) if d > 0 else 0.0
-
-def _bar_diameter(bar_num):
-    """Return dia in inches, fallback for unknown bar numbers."""
-    try:
-        return float(BAR_DIAMETERS.get(int(bar_num), 0.75))
-    except Exception:
-        return 0.75
-
-# ---------------------------
-# Safe parsing utilities (expanded)
-# ---------------------------
-def safe_float(value, name="value", default=None):
-    try:
-        if value is None:
-            return default
-        return float(value)
-    except Exception as e:
-        raise ValueError(f"Invalid input for {name}: {e}")
-
-def safe_int(value, name="value", default=0):
-    try:
-        if value is None or value == "":
-            return default
-        return int(float(value))
-    except Exception as e:
-        raise ValueError(f"Invalid integer input for {name}: {e}")
+from cep_core import format_value, results_table_rows
+# shared, bounded result caches (every session of this server process)
+from cep_core.cache import (
+    compute_section_geometry,
+    analysis_rectangular, analysis_T, analysis_L,
+    design_rectangular, design_T, design_L,
+    ResultCache, approx_size, clear_shared_caches, process_memory, shared_cache_stats,
+)
+from cep_core.drawing import layout_args
+from cep_core.figures import render_section_drawing
+from cep_core.flexure import flexural_design
+from cep_core.bars import CATALOGS
+from cep_core.capacity import torsion_capacity_frame
+from cep_core.check import UTILIZATION_KEYS
+from cep_core.jobs import FAILED, JobQueue, content_key
+from cep_core.optimize import optimize_design
+from cep_core.parallel import write_schedule_report
+from cep_core.records import BeamInput, merge_results
+from cep_core.schedule import count_schedule_rows, file_format, iter_schedule_chunks, run_chunk
+from cep_core.report import build_pdf_report
 
-# ---------------------------
-# Section geometry helpers
-# (explicit version + duplicate)
-# ---------------------------
-def compute_section_geometry(entries_b, entries_h, section_type, entries_tf=None):
-    cover = 0.75
-    b = float(entries_b)
-    h = float(entries_h)
-    if section_type == "T Section":
-        tf = float(entries_tf)
-        bf = b + 2 * min(4 * tf, h - tf)
-        Acp = b * h + (bf - b) * tf
-        Pcp = 2 * h + 2 * b + 2 * (bf - b)
-    elif section_type == "L Section":
-        tf = float(entries_tf)
-        bf = b + min(4 * tf, h - tf)
-        Acp = b * h + (bf - b) * tf
-        Pcp = 2 * h + 2 * b + 2 * (bf - b)
-    else:
-        Acp = h * b
-        Pcp = 2 * (h + b)
-
-    Aoh = max((b - 2 * cover - 0.25), 0) * max((h - 2 * cover - 0.25), 0)
-    Ph = 2 * max((b - 2 * cover - 0.25), 0) + 2 * max((h - 2 * cover - 0.25), 0)
-    Ao = 0.85 * Aoh
-
-    return {
-        "Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao,
-        "b": b, "h": h, "cover": cover, "bf": (bf if 'bf' in locals() else b), "tf": (entries_tf if entries_tf is not None else 0.0)
-    }
-
-def compute_section_geometry_dup(entries_b, entries_h, section_type, entries_tf=None):
-    # duplicate of compute_section_geometry to mimic long Tk file structure
-    cover = 0.75
-    b = float(entries_b)
-    h = float(entries_h)
-    if section_type == "T Section":
-        tf = float(entries_tf)
-        bf = b + 2 * min(4 * tf, h - tf)
-        Acp = b * h + (bf - b) * tf
-        Pcp = 2 * h + 2 * b + 2 * (bf - b)
-    elif section_type == "L Section":
-        tf = float(entries_tf)
-        bf = b + min(4 * tf, h - tf)
-        Acp = b * h + (bf - b) * tf
-        Pcp = 2 * h + 2 * b + 2 * (bf - b)
-    else:
-        Acp = h * b
-        Pcp = 2 * (h + b)
-    Aoh = max((b - 2 * cover - 0.25), 0) * max((h - 2 * cover - 0.25), 0)
-    Ph = 2 * max((b - 2 * cover - 0.25), 0) + 2 * max((h - 2 * cover - 0.25), 0)
-    Ao = 0.85 * Aoh
-    return {"Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao, "b": b, "h": h, "cover": cover, "bf": (bf if 'bf' in locals() else b), "tf": (entries_tf if entries_tf is not None else 0.0)}
-
-# ---------------------------
-# Stirrup selection helper (duplicated)
-# ---------------------------
-def select_stirrup_and_spacing(Ph, Ats):
-    bar_options = [3,4,5,6,7,8]
-    selected_bar = None
-    final_spacing = None
-    if Ats <= 0 or Ph <= 0:
-        return 3, max(4.0, min(12.0, Ph/8 if Ph>0 else 12.0))
-    for bar in bar_options:
-        Av = area_of_bar(bar)
-        if Ats == 0:
-            continue
-        s = (2 * Av) / Ats
-        if s <= min(Ph / 8, 12) and s >= 4:
-            selected_bar = bar
-            final_spacing = math.floor(s * 2) / 2
-            break
-    if selected_bar is None:
-        selected_bar = 3
-        s = min(Ph / 8, 12)
-        final_spacing = math.floor(s * 2) / 2
-    return selected_bar, final_spacing
-
-def select_stirrup_and_spacing_dup(Ph, Ats):
-    # duplicate variant to keep code verbose
-    bar_options = [3, 4, 5, 6, 7, 8]
-    if Ats <= 0:
-        return 3, max(4.0, min(12.0, Ph/8 if Ph>0 else 12.0))
-    for bar in bar_options:
-        Av = area_of_bar_explicit(bar)
-        if Ats == 0:
-            continue
-        s = (2 * Av) / Ats
-        if 4 <= s <= min(Ph / 8 if Ph>0 else 12.0, 12.0):
-            return bar, math.floor(s * 2) / 2
-    return 3, math.floor(min(Ph / 8 if Ph>0 else 12.0, 12.0) * 2) / 2
-
-# ---------------------------
-# Core analysis functions (explicit for each section)
-# ---------------------------
-def analysis_rectangular(b, h, fc, tu_ft):
-    try:
-        cover = 0.75
-        lamda = 1.0
-        phi = 0.75
-        Acp = b * h
-        Pcp = 2 * (b + h)
-        Aoh = max((b - 2 * cover), 0) * max((h - 2 * cover), 0)
-        Ph = 2 * max((b - 2 * cover), 0) + 2 * max((h - 2 * cover), 0)
-        Ao = 0.85 * Aoh
-        sqrt_fc = math.sqrt(fc)
-        Tcr = (4 * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
-        Tth = Tcr / 4
-        # message equivalent
-        safe = tu_ft < Tth
-        return {
-            "Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao,
-            "phiTcr": phi * Tcr, "Tth": Tth, "safe": safe
-        }
-    except Exception as e:
-        raise
-
-def analysis_T(b, h, tf, fc, tu_ft):
-    try:
-        cover = 0.75
-        lamda = 1.0
-        phi = 0.75
-        x = min(h - tf, 4 * tf)
-        b_total = b + 2 * x
-        Acp = b * h + (b_total - b) * tf
-        Pcp = 2 * h + 2 * b + 2 * (b_total - b)
-        Aoh = max((b - 2 * cover), 0) * max((h - 2 * cover), 0)
-        Ph = 2 * max((b - 2 * cover), 0) + 2 * max((h - 2 * cover), 0)
-        Ao = 0.85 * Aoh
-        sqrt_fc = math.sqrt(fc)
-        Tcr = (4 * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
-        Tth = Tcr / 4
-        safe = tu_ft < Tth
-        return {"Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao, "phiTcr": phi * Tcr, "Tth": Tth, "safe": safe, "b_total": b_total, "x": x}
-    except Exception as e:
-        raise
-
-def analysis_L(b, h, tf, fc, tu_ft):
-    try:
-        cover = 0.75
-        lamda = 1.0
-        phi = 0.75
-        x = min(h - tf, 4 * tf)
-        b_total = b + x
-        Acp = b * h + (b_total - b) * tf
-        Pcp = 2 * h + 2 * b + 2 * (b_total - b)
-        Aoh = max((b - 2 * cover), 0) * max((h - 2 * cover), 0)
-        Ph = 2 * max((b - 2 * cover), 0) + 2 * max((h - 2 * cover), 0)
-        Ao = 0.85 * Aoh
-        sqrt_fc = math.sqrt(fc)
-        Tcr = (4 * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
-        Tth = Tcr / 4
-        safe = tu_ft < Tth
-        return {"Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao, "phiTcr": phi * Tcr, "Tth": Tth, "safe": safe, "b_total": b_total, "x": x}
-    except Exception as e:
-        raise
-
-# ---------------------------
-# Design functions (Rectangular/T/L) - verbose
-# ---------------------------
-def design_rectangular(b, h, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
-    vals = compute_section_geometry(b, h, "Rectangular", None)
-    # replicate code from expanded clean version
-    cover = 0.75
-    lamda = 1.0
-    phi = 0.75
-    d = h - 2.5
-    if d <= 0:
-        raise ValueError("Effective depth d <= 0.")
-    tu_in = tu_ft * 12
-    sqrt_fc = math.sqrt(fc)
-    Acp = vals["Acp"]; Pcp = vals["Pcp"]; Aoh = vals["Aoh"]; Ph = vals["Ph"]; Ao = vals["Ao"]
-    phiTcr = (4 * phi * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
-    Tth = phiTcr / 4
-    if tu_ft < Tth:
-        return {"safe": True, "phiTcr": phiTcr, "Tth": Tth}
-    demand = math.sqrt(((vu * 1000) / (b * d)) ** 2 + (tu_in * 1000 * Ph / (1.7 * (Aoh ** 2))) ** 2)
-    Vc = 2 * lamda * sqrt_fc * b * d
-    phiVc = phi * Vc / 1000
-    capacity = phi * ((Vc / (b * d)) + 8 * sqrt_fc)
-
-    results = {}
-    results["phiTcr"] = phiTcr
-    results["Tth"] = Tth
-    results["demand"] = demand
-    results["Vc"] = Vc
-    results["phiVc"] = phiVc
-    results["capacity"] = capacity
-
-    if demand <= capacity:
-        Al = (tu_in * Ph) / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
-        At_s = tu_in / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
-        term1 = (5 * sqrt_fc * Acp / (1000 * fy)) - (At_s * Ph * fyt / fy)
-        term2 = (5 * sqrt_fc * Acp / (1000 * fy)) - ((25 * b / fyt) * Ph * fyt / fy)
-        Almin = max(term1, term2)
-        if Al < Almin:
-            Al = Almin
-            results["Almin_governs"] = True
-        results["Al"] = Al
-        Vn = phiVc
-        Vs = max(0.0, (vu - Vn) / phi)
-        x = Vs / (fyt * d) if (fyt * d) != 0 else 0.0
-        Ats = x + 2 * At_s
-        Atsmin = max(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt))
-        if Ats < Atsmin:
-            Ats = Atsmin
-        results["Vn"] = Vn
-        results["Vs"] = Vs
-        results["Ats"] = Ats
-        results["Atsmin"] = Atsmin
-
-        selected_bar, final_spacing = select_stirrup_and_spacing(Ph, Ats)
-        results["stirrup_bar"] = selected_bar
-        results["stirrup_spacing"] = final_spacing
-
-        req_bottom = As_flexure + Al / 3.0
-        req_mid = Al / 3.0
-        top_bars_area = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
-        req_top = top_bars_area + Al / 3.0
-
-        area_bar_8 = area_of_bar(8)
-        area_bar_6 = area_of_bar(6)
-
-        num_bottom_bars_needed = math.ceil(req_bottom / area_bar_8) if area_bar_8>0 else 0
-        num_top_bars_needed = math.ceil(req_top / area_bar_6) if area_bar_6>0 else 0
-
-        required_per_bar = req_mid / 2 if req_mid>0 else 0.0
-        mid_bar = next((bar for bar in range(3, 13) if area_of_bar(bar) >= required_per_bar), 3)
-        area_mid = 2 * area_of_bar(mid_bar) if mid_bar else 0.0
-
-        provided_bottom_by_user = nl * area_of_bar(bar_l)
-        provided_top_by_user = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
-
-        results.update({
-            "req_bottom": req_bottom, "req_mid": req_mid, "req_top": req_top,
-            "num_bottom_bars_needed": num_bottom_bars_needed, "num_top_bars_needed": num_top_bars_needed,"mid_bar": mid_bar,
-            "area_mid": area_mid,
-            "provided_bottom_by_user": provided_bottom_by_user, "provided_top_by_user": provided_top_by_user
-        })
-    else:
-        results["demand_exceeds_capacity"] = True
-
-    return results
-
-def design_T(b, h, tf, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
-    vals = compute_section_geometry_dup(b, h, "T Section", tf)
-    cover = 0.75
-    lamda = 1.0
-    phi = 0.75
-    d = h - 2.5
-    if d <= 0:
-        raise ValueError("Effective depth d <= 0.")
-    tu_in = tu_ft * 12
-    sqrt_fc = math.sqrt(fc)
-    Acp = vals["Acp"]; Pcp = vals["Pcp"]; Aoh = vals["Aoh"]; Ph = vals["Ph"]; Ao = vals["Ao"]
-    phiTcr = (4 * phi * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
-    Tth = phiTcr / 4
-    if tu_ft < Tth:
-        return {"safe": True, "phiTcr": phiTcr, "Tth": Tth}
-    demand = math.sqrt(((vu * 1000) / (b * d)) ** 2 + (tu_in * 1000 * Ph / (1.7 * (Aoh ** 2))) ** 2)
-    Vc = 2 * lamda * sqrt_fc * b * d
-    phiVc = phi * Vc / 1000
-    capacity = phi * ((Vc / (b * d)) + 8 * sqrt_fc)
-
-    results = {"phiTcr": phiTcr, "Tth": Tth, "demand": demand, "Vc": Vc, "phiVc": phiVc, "capacity": capacity}
-
-    if demand <= capacity:
-        Al = (tu_in * Ph) / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
-        At_s = tu_in / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
-        term1 = (5 * sqrt_fc * Acp / (1000 * fy)) - (At_s * Ph * fyt / fy)
-        term2 = (5 * sqrt_fc * Acp / (1000 * fy)) - ((25 * b / fyt) * Ph * fyt / fy)
-        Almin = max(term1, term2)
-        if Al < Almin:
-            Al = Almin
-            results["Almin_governs"] = True
-        results["Al"] = Al
-        Vn = phiVc
-        Vs = max(0.0, (vu - Vn) / phi)
-        x = Vs / (fyt * d) if (fyt * d) != 0 else 0.0
-        Ats = x + 2 * At_s
-        Atsmin = max(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt))
-        if Ats < Atsmin:
-            Ats = Atsmin
-        results.update({"Vn": Vn, "Vs": Vs, "Ats": Ats, "Atsmin": Atsmin})
-
-        selected_bar, final_spacing = select_stirrup_and_spacing_dup(Ph, Ats)
-        results["stirrup_bar"] = selected_bar
-        results["stirrup_spacing"] = final_spacing
-
-        req_bottom = As_flexure + Al / 3.0
-        req_mid = Al / 3.0
-        top_bars_area = nt * area_of_bar_explicit(bar_top) if (nt > 0 and bar_top > 0) else 0.0
-        req_top = top_bars_area + Al / 3.0
-
-        area_bar_8 = area_of_bar_explicit(8)
-        area_bar_6 = area_of_bar_explicit(6)
-
-        num_bottom_bars_needed = math.ceil(req_bottom / area_bar_8) if area_bar_8>0 else 0
-        num_top_bars_needed = math.ceil(req_top / area_bar_6) if area_bar_6>0 else 0
-
-        required_per_bar = req_mid / 2 if req_mid>0 else 0.0
-        mid_bar = next((bar for bar in range(3, 13) if area_of_bar_explicit(bar) >= required_per_bar), 3)
-        area_mid = 2 * area_of_bar_explicit(mid_bar) if mid_bar else 0.0
-
-        provided_bottom_by_user = nl * area_of_bar(bar_l)
-        provided_top_by_user = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
-
-        results.update({
-            "req_bottom": req_bottom, "req_mid": req_mid, "req_top": req_top,
-            "num_bottom_bars_needed": num_bottom_bars_needed, "num_top_bars_needed": num_top_bars_needed,
-            "mid_bar": mid_bar, "area_mid": area_mid, "provided_bottom_by_user": provided_bottom_by_user,
-            "provided_top_by_user": provided_top_by_user
-        })
-    else:
-        results["demand_exceeds_capacity"] = True
-
-    return results
-
-def design_L(b, h, tf, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
-    vals = compute_section_geometry(b, h, "L Section", tf)
-    cover = 0.75
-    lamda = 1.0
-    phi = 0.75
-    d = h - 2.5
-    if d <= 0:
-        raise ValueError("Effective depth d <= 0.")
-    tu_in = tu_ft * 12
-    sqrt_fc = math.sqrt(fc)
-    Acp = vals["Acp"]; Pcp = vals["Pcp"]; Aoh = vals["Aoh"]; Ph = vals["Ph"]; Ao = vals["Ao"]
-    phiTcr = (4 * phi * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
-    Tth = phiTcr / 4
-    if tu_ft < Tth:
-        return {"safe": True, "phiTcr": phiTcr, "Tth": Tth}
-    demand = math.sqrt(((vu * 1000) / (b * d)) ** 2 + (tu_in * 1000 * Ph / (1.7 * (Aoh ** 2))) ** 2)
-    Vc = 2 * lamda * sqrt_fc * b * d
-    phiVc = phi * Vc / 1000
-    capacity = phi * ((Vc / (b * d)) + 8 * sqrt_fc)
-
-    results = {"phiTcr": phiTcr, "Tth": Tth, "demand": demand, "Vc": Vc, "phiVc": phiVc, "capacity": capacity}
-
-    if demand <= capacity:
-        Al = (tu_in * Ph) / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
-        At_s = tu_in / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
-        term1 = (5 * sqrt_fc * Acp / (1000 * fy)) - (At_s * Ph * fyt / fy)
-        term2 = (5 * sqrt_fc * Acp / (1000 * fy)) - ((25 * b / fyt) * Ph * fyt / fy)
-        Almin = max(term1, term2)
-        if Al < Almin:
-            Al = Almin
-            results["Almin_governs"] = True
-        results["Al"] = Al
-        Vn = phiVc
-        Vs = max(0.0, (vu - Vn) / phi)
-        x = Vs / (fyt * d) if (fyt * d) != 0 else 0.0
-        Ats = x + 2 * At_s
-        Atsmin = max(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt))
-        if Ats < Atsmin:
-            Ats = Atsmin
-        results.update({"Vn": Vn, "Vs": Vs, "Ats": Ats, "Atsmin": Atsmin})
-
-        selected_bar, final_spacing = select_stirrup_and_spacing(Ph, Ats)
-        results["stirrup_bar"] = selected_bar
-        results["stirrup_spacing"] = final_spacing
-
-        req_bottom = As_flexure + Al / 3.0
-        req_mid = Al / 3.0
-        top_bars_area = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
-        req_top = top_bars_area + Al / 3.0
-
-        area_bar_8 = area_of_bar(8)
-        area_bar_6 = area_of_bar(6)
-
-        num_bottom_bars_needed = math.ceil(req_bottom / area_bar_8) if area_bar_8>0 else 0
-        num_top_bars_needed = math.ceil(req_top / area_bar_6) if area_bar_6>0 else 0
-
-        required_per_bar = req_mid / 2 if req_mid>0 else 0.0
-        mid_bar = next((bar for bar in range(3, 13) if area_of_bar(bar) >= required_per_bar), 3)
-        area_mid = 2 * area_of_bar(mid_bar) if mid_bar else 0.0
-
-        provided_bottom_by_user = nl * area_of_bar(bar_l)
-        provided_top_by_user = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
-
-        results.update({
-            "req_bottom": req_bottom, "req_mid": req_mid, "req_top": req_top,
-            "num_bottom_bars_needed": num_bottom_bars_needed, "num_top_bars_needed": num_top_bars_needed,
-            "mid_bar": mid_bar, "area_mid": area_mid, "provided_bottom_by_user": provided_bottom_by_user,
-            "provided_top_by_user": provided_top_by_user
-        })
-    else:
-        results["demand_exceeds_capacity"] = True
-
-    return results
+st.set_page_config(page_title="CEP — Analysis & Design of Beam in Torsion", layout="wide")
 
 # ---------------------------
-# Drawing helpers (improved & consolidated)
+# Shared caches
+# Streamlit reruns the script on every widget change. Results, drawings, optimizer
+# runs and reports live in server-wide caches (LRU, capped by entries or bytes),
+# keyed on the inputs that change them only; display settings (theme) are never part
+# of a key, so flipping them reuses everything. Session state keeps ids and small
+# records only, never PNG / PDF bytes.
 # ---------------------------
-
-def _draw_circle(ax, cx, cy, r, edge='black', face='#2B7ABF', zorder=5):
-    """Unified circle drawer used by layouts (keeps signature same)."""
-    c = Circle((cx, cy), r, edgecolor=edge, facecolor=face, linewidth=1.2, zorder=zorder)
-    ax.add_patch(c)
-
-def _draw_double_arrow(ax, x1, y1, x2, y2, text, rot=0, txt_offset=(0,0)):
-    """Draws dimension arrow with small rounded text background for readability."""
-    ax.annotate('', xy=(x1, y1), xytext=(x2, y2),
-                arrowprops=dict(arrowstyle='<->', color='black', lw=1.1))
-    tx = (x1 + x2) / 2 + txt_offset[0]
-    ty = (y1 + y2) / 2 + txt_offset[1]
-    # small white bbox for contrast
-    ax.text(tx, ty, text, ha='center', va='center', rotation=rot, fontsize=9,
-            bbox=dict(boxstyle="round,pad=0.12", fc="white", ec="none"))
-
-def _draw_callout_arrow(ax, tail_x, tail_y, head_x, head_y, label, tail_offset=(6,-6)):
-    """Red callout arrow used for reinforcement labels (keeps signature same)."""
-    ax.annotate('', xy=(head_x, head_y), xytext=(tail_x, tail_y),
-                arrowprops=dict(arrowstyle='->', color='red', lw=1.6))
-    ax.text(tail_x + tail_offset[0], tail_y + tail_offset[1], label, fontsize=10, color='black')
-
-def draw_rectangular_layout(b, h, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
-    """
-    Improved rectangular section plotting while preserving original signature.
-    - Places top longitudinals inside flange-like inner area.
-    - Places 2 mid bars left/right (if mid_bar>0).
-    - Places bottom bars as dense row.
-    """
-    fig, ax = plt.subplots(figsize=(10,6))
-    scale = 12.0  # pixels per inch
-    width = b * scale
-    height = h * scale
-
-    # Outer thick border (same visual weight as before)
-    outer_thickness = 6
-    outer = FancyBboxPatch((0,0), width, height,
-                           boxstyle="round,pad=0.02", linewidth=outer_thickness,
-                           edgecolor='black', facecolor='#e6e6e6')
-    ax.add_patch(outer)
-
-    # Inner clear area (respect cover and small margins so bars don't touch outer border)
-    cover = 0.75  # in
-    cover_px = cover * scale
-    margin_px = 10
-    inner_left = cover_px + margin_px
-    inner_right = width - cover_px - margin_px
-    inner_bottom = cover_px + margin_px
-    inner_top = height - cover_px - margin_px
-    inner_width = inner_right - inner_left
-    inner_height = inner_top - inner_bottom
-
-    # Draw inner rectangle (thin border) where bars sit
-    inner = Rectangle((inner_left, inner_bottom), inner_width, inner_height,
-                      linewidth=3, edgecolor='#333333', facecolor='#ffffff')
-    ax.add_patch(inner)
-
-    # draw cover annotation (as before)
-    cover_arrow_x1 = 2
-    ax.annotate('', xy=(cover_arrow_x1, inner_top - inner_height/2), xytext=(inner_left, inner_top - inner_height/2),
-                arrowprops=dict(arrowstyle='<->', color='black', lw=1.2))
-    ax.text((cover_arrow_x1 + inner_left)/2, inner_top - inner_height/2 + 8, f"cover = {cover:.2f} in", fontsize=9, ha='center')
-
-    # circle radius for rebars
-    r_px = 10
-
-    # Top bars (distributed along inner width near top)
-    top_coords = []
-    if num_top > 0 and inner_width > 2*r_px:
-        if num_top > 1:
-            spacing_top = (inner_width - 2*r_px - 4) / (num_top - 1)
-        else:
-            spacing_top = 0
-        y_top = inner_top - r_px - 6
-        for i in range(num_top):
-            cx = inner_left + r_px + 2 + i * spacing_top
-            _draw_circle(ax, cx, y_top, r_px)
-            top_coords.append((cx, y_top))
-
-    # Mid bars: place left & right at mid-height but within clear zone not flange
-    y_mid = inner_bottom + inner_height / 2
-    mid_coords = []
-    if mid_bar and mid_bar > 0:
-        mid_left = (inner_left + r_px + 8, y_mid)
-        mid_right = (inner_right - r_px - 8, y_mid)
-        _draw_circle(ax, *mid_left, r_px)
-        _draw_circle(ax, *mid_right, r_px)
-        mid_coords = [mid_left, mid_right]
-
-    # Bottom bars: dense row along bottom
-    bottom_coords = []
-    if num_bottom > 0 and inner_width > 2*r_px:
-        if num_bottom > 1:
-            spacing_bottom = (inner_width - 2*r_px - 4) / (num_bottom - 1)
-        else:
-            spacing_bottom = 0
-        y_bottom = inner_bottom + r_px + 6
-        for i in range(num_bottom):
-            cx = inner_left + r_px + 2 + i * spacing_bottom
-            _draw_circle(ax, cx, y_bottom, r_px)
-            bottom_coords.append((cx, y_bottom))
-
-    # dimension arrows: b and h (kept similar)
-    _draw_double_arrow(ax, 0, height + 18, width, height + 18, f"b = {b:.2f} in")
-    _draw_double_arrow(ax, -48, 0, -48, height, f"h = {h:.2f} in", rot=90)
-
-    # labels & callouts (to right)
-    labels_x = width + 80
-    if top_coords:
-        tx, ty = top_coords[0]
-        _draw_callout_arrow(ax, labels_x, ty + 4, tx + r_px + 5, ty, f"{num_top} × #{6} (top)")
-    if mid_coords:
-        _draw_callout_arrow(ax, labels_x, y_mid + 2, mid_coords[1][0] + r_px + 5, y_mid, f"2 × #{mid_bar} (mid)")
-    if stirrup_bar and stirrup_bar > 0:
-        _draw_callout_arrow(ax, labels_x, y_mid - 30, inner_right + 5, y_mid - inner_height/6,
-                         f"#{stirrup_bar} stirrups @ {stirrup_spacing:.2f} in c/c")
-    if bottom_coords:
-        bx, by = bottom_coords[0]
-        _draw_callout_arrow(ax, labels_x, by - 30, bx + r_px + 5, by, f"{num_bottom} × #{8} (bottom)")
-
-    # optionally show spacing between bottom bars
-    if show_bar_spacing and len(bottom_coords) > 1:
-        x_first = bottom_coords[0][0]
-        x_last = bottom_coords[-1][0]
-        spacing_in = (x_last - x_first) / (len(bottom_coords)-1) / scale if len(bottom_coords) > 1 else 0
-        _draw_double_arrow(ax, x_first, y_bottom - 25, x_last, y_bottom - 25, f"{spacing_in:.2f} in spacing")
-
-    ax.set_xlim(-160, width + 260)
-    ax.set_ylim(-80, height + 120)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    return fig
-
-def draw_T_layout(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
-    """
-    Improved T-section plotting: flange top shows flange longitudinal bars,
-    web interior shows mid/bottom bars; hollow/cover calculations adjusted so
-    flange bars draw properly in the flange zone (like the sample image).
-    """
-    fig, ax = plt.subplots(figsize=(11,7))
-    scale = 12.0
-    bf = (b + 2 * min(4 * tf, h - tf))
-    Bf_px = bf * scale
-    Tf_px = tf * scale
-    Bw_px = b * scale
-    D_px = h * scale
-
-    base_x = 40
-    base_y = 40
-
-    # flange geometry
-    flange_left = base_x
-    flange_right = base_x + Bf_px
-    flange_top = base_y + D_px - Tf_px
-    flange_bottom = base_y + D_px
-
-    # web geometry
-    web_left = base_x + (Bf_px - Bw_px) / 2
-    web_bottom = base_y
-    web_height = D_px - Tf_px
-
-    # draw flange and web outlines
-    ax.add_patch(Rectangle((flange_left, flange_top), Bf_px, Tf_px, edgecolor='black', facecolor='#e6e6e6', linewidth=4))
-    ax.add_patch(Rectangle((web_left, web_bottom), Bw_px, web_height, edgecolor='black', facecolor='#ffffff', linewidth=4))
-
-    # compute inner clear/hollow area where bars are placed (respect cover)
-    cover = 0.75
-    cover_px = cover * scale
-    hollow_left = web_left + cover_px
-    hollow_right = web_left + Bw_px - cover_px
-    # allow hollow_top to extend into flange so flange bars can be drawn inside flange region
-    hollow_bottom = web_bottom + cover_px
-    hollow_top = flange_bottom - cover_px
-    hollow_w = hollow_right - hollow_left
-    hollow_h = hollow_top - hollow_bottom
-
-    # draw inner border where bars lie
-    ax.add_patch(Rectangle((hollow_left, hollow_bottom), hollow_w, hollow_h, edgecolor='#333333', facecolor='#ffffff', linewidth=3))
-
-    # labels for bf and h
-    ax.text((flange_left + flange_right)/2, flange_bottom + 16, f"bf = {bf:.2f} in   tf = {tf:.2f} in", ha='center', fontsize=9)
-    _draw_double_arrow(ax, -60, web_bottom, -60, flange_bottom, f"h = {h:.2f} in", rot=90)
-
-    r_px = 10
-
-    # Top flange bars (distributed within hollow width but within flange region visually)
-    top_coords = []
-    if num_top > 0 and hollow_w > 2*r_px:
-        if num_top > 1:
-            spacing_top = (hollow_w - 2*r_px - 4) / (num_top - 1)
+OPTIMIZE_CACHE_BYTES = 64 * 1024 * 1024
+CHECK_CACHE_BYTES = 128 * 1024 * 1024
+REPORT_CACHE_BYTES = 256 * 1024 * 1024
+REPORT_WORKERS = 2
+REPORT_POLL_SECONDS = 1.0
+# the admin view (cache sizes, memory) is shown for ?admin=<CEP_ADMIN_TOKEN>
+ADMIN_TOKEN = os.environ.get("CEP_ADMIN_TOKEN")
+
+def calculate(mode, section, b, h, tf, fc, tu, design_args=()):
+    """Geometry merged with the analysis / design results; design_args as for design_* after tu (Design mode)."""
+    vals = compute_section_geometry(b, h, section, tf)
+    if mode == "Analysis":
+        if section == "Rectangular Section":
+            out = analysis_rectangular(b, h, fc, tu)
+        elif section == "T Section":
+            out = analysis_T(b, h, tf, fc, tu)
         else:
-            spacing_top = 0
-        # place top bars slightly below flange top (so they appear inside flange)
-        y_top = flange_top + Tf_px/2
-        # clamp so they stay inside the hollow visualization
-        y_top = min(y_top, hollow_top - r_px - 2)
-        for i in range(num_top):
-            cx = hollow_left + r_px + 2 + i * spacing_top
-            _draw_circle(ax, cx, y_top, r_px)
-            top_coords.append((cx, y_top))
-
-    # Mid bars inside web (left & right)
-    mid_coords = []
-    y_mid = hollow_bottom + hollow_h / 2
-    if mid_bar and mid_bar > 0:
-        mid_left = (max(hollow_left, web_left + r_px + 6), y_mid)
-        mid_right = (min(hollow_right, web_left + Bw_px - r_px - 6), y_mid)
-        _draw_circle(ax, *mid_left, r_px)
-        _draw_circle(ax, *mid_right, r_px)
-        mid_coords = [mid_left, mid_right]
-
-    # Bottom bars (dense row near bottom of hollow)
-    bottom_coords = []
-    if num_bottom > 0 and hollow_w > 2*r_px:
-        if num_bottom > 1:
-            spacing_bottom = (hollow_w - 2*r_px - 4) / (num_bottom - 1)
+            out = analysis_L(b, h, tf, fc, tu)
+    else:  # Design
+        fy, fyt, vu, bar_l, nl, As_flexure, nt, bar_top = design_args
+        if section == "Rectangular Section":
+            out = design_rectangular(b, h, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top)
+        elif section == "T Section":
+            out = design_T(b, h, tf, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top)
         else:
-            spacing_bottom = 0
-        y_bottom = hollow_bottom + r_px + 6
-        for i in range(num_bottom):
-            cx = hollow_left + r_px + 2 + i * spacing_bottom
-            _draw_circle(ax, cx, y_bottom, r_px)
-            bottom_coords.append((cx, y_bottom))
+            out = design_L(b, h, tf, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top)
+    # Merge geometry & outputs for table
+    return merge_results(vals, out)
 
-    # labels/callouts (to right of flange)
-    label_x = flange_right + 80
-    if top_coords:
-        tx, ty = top_coords[-1]  # point to rightmost flange bar like sample
-        _draw_callout_arrow(ax, label_x, ty + 6, tx + r_px + 3, ty, f"({num_top})#{6} top longitudinal bars")
-    if mid_coords:
-        # right mid bar
-        _draw_callout_arrow(ax, label_x, y_mid, mid_coords[1][0] + r_px + 3, y_mid, f"2#({mid_bar}) top longitudinal bars")
-    if bottom_coords:
-        bx, by = bottom_coords[len(bottom_coords)//2]
-        _draw_callout_arrow(ax, label_x, by - 18, bx + r_px + 3, by, f"({num_bottom})#{8} bottom longitudinal bars")
-    if stirrup_bar and stirrup_bar > 0:
-        _draw_callout_arrow(ax, label_x, y_mid - 36, hollow_right + 6, y_mid - hollow_h/4, f"#{stirrup_bar} stirrups @ {stirrup_spacing:.1f} in c/c")
+@st.cache_resource
+def optimize_cache():
+    return ResultCache("optimize", maxsize=OPTIMIZE_CACHE_BYTES, getsizeof=approx_size)
 
-    # optionally show bottom spacing numeric
-    if show_bar_spacing and len(bottom_coords) > 1:
-        x_first = bottom_coords[0][0]
-        x_last = bottom_coords[-1][0]
-        spacing_in = (x_last - x_first) / (len(bottom_coords)-1) / scale if len(bottom_coords) > 1 else 0
-        _draw_double_arrow(ax, x_first, hollow_bottom - 28, x_last, hollow_bottom - 28, f"{spacing_in:.2f} in spacing")
+def optimize(*args, **kwargs):
+    """optimize_design through the shared optimizer cache (the result is shared: read it only)."""
+    key = content_key("optimize", args, kwargs)
+    return optimize_cache().get_or_compute(key, lambda: optimize_design(*args, **kwargs))
 
-    ax.set_xlim(-160, flange_right + 260)
-    ax.set_ylim(-100, flange_bottom + 120)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    return fig
+@st.cache_resource
+def check_cache():
+    return ResultCache("checks", maxsize=CHECK_CACHE_BYTES, getsizeof=approx_size)
 
-def draw_L_layout(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+def check_schedule(key, data, fmt):
     """
-    L-section plotting: flange drawn on left; flange top longitudinals appear under flange;
-    mid and bottom bars inside web clear area. Signatures preserved.
+    Reinforcement check of an uploaded schedule, with each member's largest Tu, through
+    the shared check cache (read it only).
     """
-    fig, ax = plt.subplots(figsize=(11,7))
-    scale = 12.0
-    bf = (b + min(4 * tf, h - tf))
-    bf_px = bf * scale
-    Tf_px = tf * scale
-    Bw_px = b * scale
-    D_px = h * scale
-
-    base_x = 40
-    base_y = 40
-
-    # flange on LEFT
-    flange_left = base_x
-    flange_right = base_x + bf_px
-    flange_top = base_y + D_px - Tf_px
-    flange_bottom = base_y + D_px
-
-    # web to right of flange
-    web_left = flange_right - Bw_px
-    web_bottom = base_y
-    web_height = D_px - Tf_px
-
-    # draw flange and web
-    ax.add_patch(Rectangle((flange_left, flange_top), bf_px, Tf_px, edgecolor='black', facecolor='#e6e6e6', linewidth=4))
-    ax.add_patch(Rectangle((web_left, web_bottom), Bw_px, web_height, edgecolor='black', facecolor='#ffffff', linewidth=4))
-
-    # inner clear/hollow where rebars are placed (respect cover)
-    cover = 0.75
-    cover_px = cover * scale
-    hollow_left = web_left + cover_px
-    hollow_right = web_left + Bw_px - cover_px
-    hollow_top = flange_bottom - cover_px
-    hollow_bottom = web_bottom + cover_px
-    hollow_w = hollow_right - hollow_left
-    hollow_h = hollow_top - hollow_bottom
-
-    # draw inner area
-    ax.add_patch(Rectangle((hollow_left, hollow_bottom), hollow_w, hollow_h, edgecolor='#333333', facecolor='#ffffff', linewidth=3))
-
-    # dims text
-    ax.text((flange_left + flange_right)/2, flange_bottom + 16, f"bf = {bf:.2f} in   tf = {tf:.2f} in", ha='center', fontsize=9)
-    _draw_double_arrow(ax, -60, web_bottom, -60, flange_bottom, f"h = {h:.2f} in", rot=90)
-
-    r_px = 10
-
-    # Top bars under flange (distributed across hollow width)
-    top_coords = []
-    if num_top > 0 and hollow_w > 2*r_px:
-        if num_top > 1:
-            spacing_top = (hollow_w - 2*r_px - 4) / (num_top - 1)
-        else:
-            spacing_top = 0
-        y_top = flange_top + Tf_px/2
-        y_top = min(y_top, hollow_top - r_px - 2)
-        for i in range(num_top):
-            cx = hollow_left + r_px + 2 + i * spacing_top
-            _draw_circle(ax, cx, y_top, r_px)
-            top_coords.append((cx, y_top))
-
-    # Mid bars inside web
-    y_mid = hollow_bottom + hollow_h / 2
-    mid_coords = []
-    if mid_bar and mid_bar > 0:
-        mid_left = (hollow_left + r_px + 6, y_mid)
-        mid_right = (hollow_right - r_px - 6, y_mid)
-        _draw_circle(ax, *mid_left, r_px)
-        _draw_circle(ax, *mid_right, r_px)
-        mid_coords = [mid_left, mid_right]
-
-    # Bottom bars along web bottom
-    bottom_coords = []
-    if num_bottom > 0 and hollow_w > 2*r_px:
-        if num_bottom > 1:
-            spacing_bottom = (hollow_w - 2*r_px - 4) / (num_bottom - 1)
+    def checked(chunk):
+        out = run_chunk(chunk, "check")
+        out[["Tu_capacity", "Tu_almin", "Tu_max"]] = torsion_capacity_frame(chunk)[["Tu_capacity", "Tu_almin", "Tu_max"]]
+        return out
+
+    def run():
+        return pd.concat([checked(chunk) for chunk in iter_schedule_chunks(io.BytesIO(data), fmt=fmt)],
+                         ignore_index=True)
+    return check_cache().get_or_compute(key, run)
+
+@st.cache_resource
+def report_jobs():
+    """Server-wide background report builder; finished PDFs are cached by content (see cep_core.jobs)."""
+    return JobQueue(workers=REPORT_WORKERS, max_bytes=REPORT_CACHE_BYTES)
+
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def report_progress(job_id):
+    """Polls a pending job without rerunning the page; reruns the page once it has finished."""
+    job = report_jobs().get(job_id)
+    if job is None or not job.pending:
+        st.rerun()
+    st.progress(job.fraction, text=f"{job.label}: {job.describe()}")
+
+def report_job_panel(state_key, file_name):
+    """Progress, error or download button for the report job whose id is in session_state[state_key]."""
+    job_id = st.session_state.get(state_key)
+    job = report_jobs().get(job_id) if job_id else None
+    if job is None:
+        return
+    if job.pending:
+        report_progress(job_id)
+    elif job.status == FAILED:
+        st.error(f"{job.label} failed — {job.error}")
+    else:
+        report_bytes = report_jobs().result(job_id)
+        if report_bytes is None:
+            st.warning(f"{job.label} is no longer cached — generate it again.")
         else:
-            spacing_bottom = 0
-        y_bottom = hollow_bottom + r_px + 6
-        for i in range(num_bottom):
-            cx = hollow_left + r_px + 2 + i * spacing_bottom
-            _draw_circle(ax, cx, y_bottom, r_px)
-            bottom_coords.append((cx, y_bottom))
+            st.download_button(f"Download {job.label}", data=report_bytes, file_name=file_name,
+                               mime="application/pdf", key=f"{state_key}_download")
+
+def admin_panel():
+    """Shared cache sizes and process memory, for whoever runs the server."""
+    memory = process_memory()
+    rss = f"{memory['rss'] / 2**20:,.0f} MB" if memory["rss"] else "n/a"
+    st.metric("Server process memory (RSS)", rss, help=f"Peak: {memory['peak'] / 2**20:,.0f} MB")
+    stats = pd.DataFrame(shared_cache_stats())
+    stats["MB"] = stats["bytes"] / 2**20
+    st.dataframe(stats[["name", "size", "MB", "maxsize", "unit", "hits", "misses", "evictions", "hit_rate"]],
+                 hide_index=True, width='stretch')
+    jobs = report_jobs().stats()["jobs"]
+    st.caption("Report jobs: " + ", ".join(f"{status} {n}" for status, n in jobs.items()))
+    st.caption(f"This session's state: {approx_size(st.session_state.to_dict()) / 1024:,.1f} KB")
+    if st.button("Clear shared caches", key="admin_clear"):
+        clear_shared_caches()
+        st.rerun()
 
-    # callout labels (outside to the right)
-    label_x = flange_right + 80
-    if top_coords:
-        tx, ty = top_coords[-1]
-        _draw_callout_arrow(ax, label_x, ty + 6, tx + r_px + 3, ty, f"{num_top} × #{6} (top)")
-    if mid_coords:
-        _draw_callout_arrow(ax, label_x, y_mid, mid_coords[1][0] + r_px + 3, y_mid, f"2 × #{mid_bar} (mid)")
-    if bottom_coords:
-        bx, by = bottom_coords[0]
-        _draw_callout_arrow(ax, label_x, by - 18, bx + r_px + 3, by, f"{num_bottom} × #{8} (bottom)")
-    if stirrup_bar and stirrup_bar > 0:
-        _draw_callout_arrow(ax, label_x, y_mid - 36, hollow_right + 6, y_mid - hollow_h/4, f"#{stirrup_bar} stirrups @ {stirrup_spacing:.2f} in c/c")
-
-    # optionally annotate bottom spacing
-    if show_bar_spacing and len(bottom_coords) > 1:
-        x_first = bottom_coords[0][0]
-        x_last = bottom_coords[-1][0]
-        spacing_in = (x_last - x_first) / (len(bottom_coords)-1) / scale if len(bottom_coords) > 1 else 0
-        _draw_double_arrow(ax, x_first, hollow_bottom - 28, x_last, hollow_bottom - 28, f"{spacing_in:.2f} in spacing")
-
-    ax.set_xlim(-160, flange_right + 260)
-    ax.set_ylim(-100, flange_bottom + 120)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    return fig
+# ---------------------------
+# Visual / theme constants
+# ---------------------------
+BG_COLOR = "#2c2f33"
+FG_COLOR = "#dcdcdc"
+ACCENT_COLOR = "#4682b4"
 
 # ---------------------------
 # Streamlit UI — Professional polished layout (sidebar mode, theme toggle, results table)
@@ -846,7 +162,7 @@ def set_theme(theme):
 # Sidebar controls
 with st.sidebar:
     st.markdown("## CEP — Controls", unsafe_allow_html=True)
-    mode = st.radio("Mode", ["Analysis", "Design"], index=0)
+    mode = st.radio("Mode", ["Analysis", "Design", "Optimize"], index=0)
     st.markdown("---")
     theme_choice = st.selectbox("Theme", ["Dark", "Light"], index=0 if st.session_state["theme"]=="dark" else 1)
     if theme_choice == "Dark":
@@ -934,8 +250,8 @@ with left_col:
     tu = st.number_input("Tu (kips-ft)", value=0.0, step=0.5, format="%.3f", key="tu")
     fc = st.number_input("f'c (psi)", value=4000.0, step=100.0, format="%.1f", key="fc")
 
-    # Show design-only material inputs only when Design mode is selected
-    if mode == "Design":
+    # Show design-only material inputs only when Design / Optimize mode is selected
+    if mode in ("Design", "Optimize"):
         fy = st.number_input("fy (ksi)", value=60.0, step=1.0, format="%.3f", key="fy")
         fyt = st.number_input("fyt (ksi)", value=60.0, step=1.0, format="%.3f", key="fyt")
     else:
@@ -944,8 +260,23 @@ with left_col:
         fyt = 60.0
 
     st.markdown('<div class="section-header">Geometry (inches)</div>', unsafe_allow_html=True)
-    h = st.number_input("Beam height h (in)", value=12.0, step=0.5, format="%.3f", key="h")
-    b = st.number_input("Beam or web width b (in)", value=8.0, step=0.5, format="%.3f", key="b")
+    if mode == "Optimize":
+        # search ranges instead of a single section
+        g1, g2, g3 = st.columns(3)
+        b_min = g1.number_input("b min", value=8.0, step=0.5, format="%.2f", key="opt_b_min")
+        b_max = g2.number_input("b max", value=24.0, step=0.5, format="%.2f", key="opt_b_max")
+        b_step = g3.number_input("b step", value=0.5, min_value=0.125, step=0.125, format="%.3f", key="opt_b_step")
+        h_min = g1.number_input("h min", value=12.0, step=0.5, format="%.2f", key="opt_h_min")
+        h_max = g2.number_input("h max", value=40.0, step=0.5, format="%.2f", key="opt_h_max")
+        h_step = g3.number_input("h step", value=0.5, min_value=0.125, step=0.125, format="%.3f", key="opt_h_step")
+        if want_section in ("T Section", "L Section"):
+            tf_min = g1.number_input("tf min", value=2.0, step=0.5, format="%.2f", key="opt_tf_min")
+            tf_max = g2.number_input("tf max", value=8.0, step=0.5, format="%.2f", key="opt_tf_max")
+            tf_step = g3.number_input("tf step", value=0.5, min_value=0.125, step=0.125, format="%.3f", key="opt_tf_step")
+        h, b = h_max, b_max
+    else:
+        h = st.number_input("Beam height h (in)", value=12.0, step=0.5, format="%.3f", key="h")
+        b = st.number_input("Beam or web width b (in)", value=8.0, step=0.5, format="%.3f", key="b")
 
     # use tf from sidebar if section type needs it
     tf = tf_sidebar
@@ -957,7 +288,38 @@ with left_col:
         bar_l = st.selectbox("Longitudinal bar # (bottom)", [3,4,5,6,7,8,9,10], index=3, key="bar_l")
         nt = st.number_input("No. of top longitudinal bars (Nt)", min_value=0, value=0, step=1, key="nt")
         bar_top = st.selectbox("Top longitudinal bar #", [3,4,5,6,7,8,9,10], index=3, key="bar_top")
+        As_flexure = None
+        if st.checkbox("Design As_flexure from the factored moment Mu", value=False, key="flexure_from_mu"):
+            mu = st.number_input("Factored moment Mu (kip-ft)", min_value=0.0, value=50.0, step=1.0, format="%.2f", key="mu")
+            try:
+                flex = flexural_design(want_section, b, h, tf, fc, fy, mu)
+            except ValueError as e:
+                st.warning(f"Cannot design for Mu: {e}")
+            else:
+                if flex["flexure_exceeds"][0]:
+                    st.warning("Mu needs compression steel or a deeper section (eps_t < 0.005); enter As_flexure instead.")
+                else:
+                    As_flexure = float(flex["As_flexure"][0])
+                    note = ", T-beam action below the flange" if flex["web_compression"][0] else ""
+                    st.caption(f"As_flexure = {As_flexure:.4f} in² (a = {flex['a'][0]:.3f} in{note}; "
+                               f"As,min = {flex['As_min'][0]:.4f} in²)")
+        if As_flexure is None:
+            As_flexure = st.number_input("Area of steel required for flexure As_flexure (in²)", value=0.5, step=0.01, format="%.4f", key="As_flexure")
+    elif mode == "Optimize":
+        # bar sizes are searched; only the flexural demand and the user's top bars are inputs
+        nl = 0
+        bar_l = 8
+        nt = st.number_input("No. of top longitudinal bars (Nt)", min_value=0, value=0, step=1, key="nt")
+        bar_top = st.selectbox("Top longitudinal bar #", [3,4,5,6,7,8,9,10], index=3, key="bar_top")
         As_flexure = st.number_input("Area of steel required for flexure As_flexure (in²)", value=0.5, step=0.01, format="%.4f", key="As_flexure")
+        bar_series = st.selectbox("Bar series", list(CATALOGS), index=0, key="opt_catalog",
+                                  format_func=lambda name: CATALOGS[name].name)
+        objective = st.selectbox("Minimize", ["Steel volume", "Cost"], index=0, key="opt_objective")
+        if objective == "Cost":
+            steel_price = st.number_input("Steel price ($/lb)", value=1.0, step=0.05, format="%.2f", key="opt_steel_price")
+            concrete_price = st.number_input("Concrete price ($/ft³)", value=6.0, step=0.5, format="%.2f", key="opt_concrete_price")
+        else:
+            steel_price, concrete_price = 1.0, 0.0
     else:
         # dummy defaults for analysis mode
         nl = 0
@@ -985,50 +347,41 @@ with right_col:
 
 # --- Run calculations (using your existing compute/design functions) ---
 calculated = None
-if run_calc:
+if run_calc and mode == "Optimize":
     try:
-        vals = compute_section_geometry(b, h, want_section, tf)
-        st.session_state["last_inputs"] = {"b": b, "h": h, "tf": tf, "section": want_section,
-                                           "nl": nl, "bar_l": bar_l, "nt": nt, "bar_top": bar_top,
-                                           "As_flexure": As_flexure, "vu": vu, "tu": tu, "fc": fc, "fy": fy, "fyt": fyt, "mode": mode}
-        if mode == "Analysis":
-            if want_section == "Rectangular Section":
-                out = analysis_rectangular(b, h, fc, tu)
-            elif want_section == "T Section":
-                out = analysis_T(b, h, tf, fc, tu)
-            else:
-                out = analysis_L(b, h, tf, fc, tu)
-        else:  # Design
-            if want_section == "Rectangular Section":
-                out = design_rectangular(b, h, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top)
-            elif want_section == "T Section":
-                out = design_T(b, h, tf, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top)
+        tf_grid = None
+        if want_section in ("T Section", "L Section"):
+            tf_grid = np.arange(tf_min, tf_max + tf_step / 2, tf_step)
+        opt = optimize(want_section, fc, fy, fyt, tu, vu, As_flexure,
+                       np.arange(b_min, b_max + b_step / 2, b_step), np.arange(h_min, h_max + h_step / 2, h_step),
+                       tf_grid, nt, bar_top, objective="cost" if objective == "Cost" else "steel",
+                       steel_price=steel_price, concrete_price=concrete_price, catalog=bar_series)
+        stats = opt["stats"]
+        with result_placeholder.container():
+            st.markdown("**Optimized designs (best first)**")
+            st.caption(f"{stats['candidates']:,} sections / {stats['layouts']:,} bar layouts searched — "
+                       f"{stats['pruned_capacity']:,} fail demand ≤ capacity, {stats['safe']:,} below Tth, "
+                       f"{stats['feasible']:,} feasible")
+            if opt["best"] is None:
+                st.error("No candidate passes — widen the search ranges.")
             else:
-                out = design_L(b, h, tf, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top)
-
-        # Merge geometry & outputs for table
-        merged = {**vals, **out}
+                st.dataframe(opt["candidates"], width='stretch')
+    except Exception as e:
+        result_placeholder.error(f"Optimization error: {e}")
+elif run_calc:
+    try:
+        st.session_state["last_inputs"] = BeamInput(b=b, h=h, tf=tf, section=want_section,
+                                                    nl=nl, bar_l=bar_l, nt=nt, bar_top=bar_top,
+                                                    As_flexure=As_flexure, vu=vu, tu=tu, fc=fc, fy=fy, fyt=fyt, mode=mode)
+        design_args = () if mode == "Analysis" else (fy, fyt, vu, bar_l, nl, As_flexure, nt, bar_top)
+        merged = calculate(mode, want_section, b, h, tf, fc, tu, design_args)
         # Flatten and filter numeric/key results to present professionally
-        keys_order = ["b","h","tf","Acp","Pcp","Aoh","Ph","Ao","phiTcr","Tth","Vc","phiVc","capacity","Al","Ats","Atsmin",
-                      "stirrup_bar","stirrup_spacing","req_bottom","req_mid","req_top","num_bottom_bars_needed","num_top_bars_needed","mid_bar"]
-        rows = []
-        for k in keys_order:
-            if k in merged:
-                rows.append((k, merged[k]))
+        rows = results_table_rows(merged)
 
         # Create DataFrame for display
         df = pd.DataFrame(rows, columns=["Parameter","Value"])
         # pretty formatting for numeric
-        def fmt(v):
-            try:
-                if isinstance(v, float):
-                    return f"{v:.4f}"
-                else:
-                    return str(v)
-            except:
-                return str(v)
-
-        df["Value"] = df["Value"].apply(fmt)
+        df["Value"] = df["Value"].apply(format_value)
         # Save to session for drawing use
         st.session_state["last_calc"] = merged
         calculated = merged
@@ -1051,7 +404,7 @@ if run_calc:
         calculated = None
 
 # Drawing logic (draw only if user asked)
-last_figure_bytes = None
+drawing_args = None
 if draw_checkbox:
     # prefer using last saved calc if available
     out = st.session_state.get("last_calc") or calculated
@@ -1068,334 +421,101 @@ if draw_checkbox:
 
         # choose layout function based on section
         st.markdown('<div class="section-header">Cross-section Layout</div>', unsafe_allow_html=True)
-        fig = None
         show_bar_spacing = st.checkbox("Annotate spacing between longitudinal bars", value=False, key="draw_spacing")
-        if want_section == "Rectangular Section":
-            num_top = out.get("num_top_bars_needed") if out.get("num_top_bars_needed") else st.session_state["last_inputs"].get("nt",0)
-            # if Analysis mode override set above, num_top will be 0
-            num_top = 0 if (mode == "Analysis") else num_top
-            num_bottom = out.get("num_bottom_bars_needed") if out.get("num_bottom_bars_needed") else st.session_state["last_inputs"].get("nl",0)
-            num_bottom = 0 if (mode == "Analysis") else num_bottom
-            fig = draw_rectangular_layout(out["b"], out["h"], num_top, num_bottom, out.get("mid_bar",0), out.get("stirrup_bar",0), out.get("stirrup_spacing",0.0), show_bar_spacing)
-        elif want_section == "T Section":
-            num_top = out.get("num_top_bars_needed") if out.get("num_top_bars_needed") else st.session_state["last_inputs"].get("nt",0)
-            num_top = 0 if (mode == "Analysis") else num_top
-            num_bottom = out.get("num_bottom_bars_needed") if out.get("num_bottom_bars_needed") else st.session_state["last_inputs"].get("nl",0)
-            num_bottom = 0 if (mode == "Analysis") else num_bottom
-            tf_draw = out.get("tf") if out.get("tf") else (tf if tf else 1.0)
-            fig = draw_T_layout(out["b"], out["h"], tf_draw, num_top, num_bottom, out.get("mid_bar",0), out.get("stirrup_bar",0), out.get("stirrup_spacing",0.0), show_bar_spacing)
-        else:  # L
-            num_top = out.get("num_top_bars_needed") if out.get("num_top_bars_needed") else st.session_state["last_inputs"].get("nt",0)
-            num_top = 0 if (mode == "Analysis") else num_top
-            num_bottom = out.get("num_bottom_bars_needed") if out.get("num_bottom_bars_needed") else st.session_state["last_inputs"].get("nl",0)
-            num_bottom = 0 if (mode == "Analysis") else num_bottom
-            tf_draw = out.get("tf") if out.get("tf") else (tf if tf else 1.0)
-            fig = draw_L_layout(out["b"], out["h"], tf_draw, num_top, num_bottom, out.get("mid_bar",0), out.get("stirrup_bar",0), out.get("stirrup_spacing",0.0), show_bar_spacing)
-
-        if fig is not None:
-            draw_placeholder.pyplot(fig)
-            # save figure to bytes so it can be embedded in PDF
-            buf = io.BytesIO()
-            fig.tight_layout()
-            fig.savefig(buf, format='png', dpi=150)
-            buf.seek(0)
-            last_figure_bytes = buf.read()
+        draw_args = layout_args(out, st.session_state["last_inputs"], mode)
+        tf_draw = out.get("tf") or tf
+        # PNG for the page, scene (vector) for the PDF report and the SVG download; rendered once per drawing
+        drawing_args = (want_section, out["b"], out["h"], tf_draw, draw_args["num_top"], draw_args["num_bottom"],
+                        draw_args["mid_bar"], draw_args["stirrup_bar"], draw_args["stirrup_spacing"], show_bar_spacing)
+        _, figure_bytes, _, svg = render_section_drawing(*drawing_args)
+        draw_placeholder.image(figure_bytes)
+        st.download_button("Download drawing (SVG)", data=svg, file_name="CEP_Section.svg", mime="image/svg+xml")
 
 # --- PDF Report Generation ---
-# Button / option to generate a professional PDF report containing all inputs, step-by-step calculations and drawings
+# Button / option to generate a professional PDF report containing all inputs, step-by-step calculations and drawings.
+# Reports are built by the background job queue; the page polls progress and offers the download when done.
 if st.button("Generate professional PDF report (Download)"):
-    report_buf = io.BytesIO()
-    # create pdf
-    c = pdf_canvas.Canvas(report_buf, pagesize=A4)
-    width, height = A4
-    margin = 40
-
-    # Header
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(margin, height - margin, "CEP — Professional Calculation Report")
-    c.setFont("Helvetica", 10)
-    c.drawString(margin, height - margin - 18, f"Mode: {mode}    Section: {want_section}")
-
-    # Inputs block -> draw as a sorted table (S.No | Parameter (description) | Symbol | Value | Units)
-    y = height - margin - 48
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(margin, y, "1) Inputs & Material")
-    y -= 18
-    c.setFont("Helvetica", 9)
-
-    # ordered inputs list (description, symbol, units, value)
-    inputs_table = [
-        ("Shear force (ultimate)", "Vu", "kips", vu),
-        ("Torsion applied", "Tu", "kips-ft", tu),
-        ("Concrete compressive strength", "f'c", "psi", fc),
-        ("Steel yield strength", "fy", "ksi", fy),
-        ("Tensile strength used for stirrups", "fyt", "ksi", fyt),
-        ("Beam overall depth", "h", "in", h),
-        ("Beam/web width", "b", "in", b),
-        ("Flange thickness (for T/L sections)", "tf", "in", tf if tf is not None else 0.0),
-        ("No. of bottom longitudinal bars (Nl)", "Nl", "", nl),
-        ("Bottom bar size (bottom)", "bar_l", "#", bar_l),
-        ("No. of top longitudinal bars (Nt)", "Nt", "", nt),
-        ("Top bar size (top)", "bar_top", "#", bar_top),
-        ("Area of steel required for flexure", "As_flexure", "in^2", As_flexure),
-    ]
-
-    # Table layout for inputs
-    c.setFont("Helvetica-Bold", 10)
-    ix_sno = margin + 8
-    ix_param = margin + 40
-    ix_symbol = margin + 260
-    ix_value = margin + 360
-    ix_units = margin + 460
-    table_left_i = margin + 4
-    table_right_i = ix_units + 80
-    table_width_i = table_right_i - table_left_i
-    header_h = 16
-    row_h = 14
-
-    # header
-    c.setFillColorRGB(0.9,0.9,0.9)
-    c.rect(table_left_i, y - header_h, table_width_i, header_h, fill=1, stroke=0)
-    c.setFillColorRGB(0,0,0)
-    c.drawString(ix_sno, y - header_h + 3, "S.No")
-    c.drawString(ix_param, y - header_h + 3, "Parameter (description)")
-    c.drawString(ix_symbol, y - header_h + 3, "Symbol")
-    c.drawString(ix_value, y - header_h + 3, "Value")
-    c.drawString(ix_units, y - header_h + 3, "Units")
-    y_cursor_i = y - header_h - 4
-    c.setFont("Helvetica", 9)
-    sno_i = 1
-    for item in inputs_table:
-        if y_cursor_i < margin + 80:
-            # draw border and new page
-            c.rect(table_left_i, y_cursor_i + row_h + 4, table_width_i, (y - header_h) - (y_cursor_i + row_h + 4), fill=0, stroke=1)
-            c.showPage()
-            y = height - margin
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(margin, y, "1) Inputs & Material (continued)")
-            y -= 18
-            # redraw header
-            c.setFont("Helvetica-Bold", 10)
-            c.setFillColorRGB(0.9,0.9,0.9)
-            c.rect(table_left_i, y - header_h, table_width_i, header_h, fill=1, stroke=0)
-            c.setFillColorRGB(0,0,0)
-            c.drawString(ix_sno, y - header_h + 3, "S.No")
-            c.drawString(ix_param, y - header_h + 3, "Parameter (description)")
-            c.drawString(ix_symbol, y - header_h + 3, "Symbol")
-            c.drawString(ix_value, y - header_h + 3, "Value")
-            c.drawString(ix_units, y - header_h + 3, "Units")
-            c.setFont("Helvetica", 9)
-            y_cursor_i = y - header_h - 4
-            sno_i = 1
-
-        # alternate background
-        if sno_i % 2 == 0:
-            c.setFillColorRGB(0.98,0.98,0.98)
-            c.rect(table_left_i, y_cursor_i - row_h + 2, table_width_i, row_h, fill=1, stroke=0)
-            c.setFillColorRGB(0,0,0)
-
-        # draw row
-        desc, sym, units, val = item
-        try:
-            val_str = f"{val:.4f}" if isinstance(val, float) else str(val)
-        except:
-            val_str = str(val)
-        c.drawString(ix_sno, y_cursor_i - row_h + 4, str(sno_i))
-        c.drawString(ix_param, y_cursor_i - row_h + 4, desc)
-        c.drawString(ix_symbol, y_cursor_i - row_h + 4, sym)
-        c.drawString(ix_value, y_cursor_i - row_h + 4, val_str)
-        c.drawString(ix_units, y_cursor_i - row_h + 4, units)
-        # horizontal line
-        c.setLineWidth(0.5)
-        c.line(table_left_i, y_cursor_i - row_h + 2, table_right_i, y_cursor_i - row_h + 2)
-        y_cursor_i -= row_h + 2
-        sno_i += 1
-
-    # outer border for inputs table
-    table_bottom_i = y_cursor_i + row_h + 6
-    if table_bottom_i < margin:
-        table_bottom_i = margin + 8
-    c.setLineWidth(1)
-    c.rect(table_left_i, table_bottom_i, table_width_i, (y - header_h) - table_bottom_i, fill=0, stroke=1)
-
-    # Move y pointer to after inputs table for calculations title
-    y = table_bottom_i - 18
-
-    # Calculations block -> only include keys actually present in merged (sorted)
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(margin, y, "2) Calculations & Results (step-by-step)")
-    y -= 18
-    c.setFont("Helvetica", 9)
+    report_inputs = BeamInput(vu=vu, tu=tu, fc=fc, fy=fy, fyt=fyt, h=h, b=b, tf=tf,
+                              nl=nl, bar_l=bar_l, nt=nt, bar_top=bar_top, As_flexure=As_flexure)
     merged = st.session_state.get("last_calc") or calculated or {}
-    if not merged:
-        c.drawString(margin + 8, y, "No calculation available. Run calculation first to include detailed steps.")
-        y -= 14
-    else:
-        # param_info map (same as before)
-        param_info = {
-            "Vu": ("Shear force (ultimate)", "Vu", "kips"),
-            "Tu": ("Torsion applied", "Tu", "kips-ft"),
-            "fc": ("Concrete compressive strength", "f'c", "psi"),
-            "fy": ("Steel yield strength", "fy", "ksi"),
-            "fyt": ("Tensile strength used for stirrups", "fyt", "ksi"),
-            "h": ("Beam overall depth", "h", "in"),
-            "b": ("Beam/web width", "b", "in"),
-            "tf": ("Flange thickness (for T/L sections)", "tf", "in"),
-            "Acp": ("Gross area of section", "Acp", "in^2"),
-            "Pcp": ("Perimeter of gross section", "Pcp", "in"),
-            "Aoh": ("Hollow/clear area available", "Aoh", "in^2"),
-            "Ph": ("Perimeter of hollow/clear area", "Ph", "in"),
-            "Ao": ("Effective area for torsion calculation (0.85*Aoh)", "Ao", "in^2"),
-            "phiTcr": ("Factored cracking torsion (phi * Tcr)", "phiTcr", "kips-ft"),
-            "Tth": ("Threshold torsion (Tth)", "Tth", "kips-ft"),
-            "Vc": ("Shear strength (unfactored)", "Vc", "kips"),
-            "phiVc": ("Factored shear strength (phi*Vc)", "phiVc", "kips"),
-            "capacity": ("Combined capacity metric", "capacity", "kips"),
-            "Al": ("Required longitudinal area for torsion", "Al", "in^2"),
-            "Ats": ("Required area of transverse reinforcement", "Ats", "in^2"),
-            "Atsmin": ("Minimum transverse area required", "Atsmin", "in^2"),
-            "stirrup_bar": ("Selected stirrup bar size", "stirrup_bar", "#"),
-            "stirrup_spacing": ("Stirrup spacing (c/c)", "stirrup_spacing", "in"),
-            "req_bottom": ("Required bottom steel for flexure+torsion", "req_bottom", "in^2"),
-            "req_mid": ("Required mid steel", "req_mid", "in^2"),
-            "req_top": ("Required top steel", "req_top", "in^2"),
-            "num_bottom_bars_needed": ("No. of bottom bars needed (est.)", "num_bottom_bars_needed", ""),
-            "num_top_bars_needed": ("No. of top bars needed (est.)", "num_top_bars_needed", ""),
-            "mid_bar": ("Estimated mid bar size", "mid_bar", "#"),
-            "safe": ("Section safe in torsion (boolean)", "safe", ""),
-            "demand_exceeds_capacity": ("Demand exceeds capacity (boolean)", "demand_exceeds_capacity", ""),
-            "demand": ("Demand metric used for check", "demand", ""),
-        }
-
-        # use preferred order but include only present keys
-        preferred_order = ["Vu","Tu","fc","fy","fyt","h","b","tf",
-                           "Acp","Pcp","Aoh","Ph","Ao","phiTcr","Tth","Vc","phiVc","capacity",
-                           "Al","Ats","Atsmin","stirrup_bar","stirrup_spacing","req_bottom","req_mid","req_top",
-                           "num_bottom_bars_needed","num_top_bars_needed","mid_bar","safe","demand_exceeds_capacity","demand"]
-
-        keys_to_report = [k for k in preferred_order if (k in merged) or (k in ["Vu","Tu","fc","fy","fyt","h","b","tf"])]
-
-        # Table headings and layout calculations (for bordered table)
-        c.setFont("Helvetica-Bold", 10)
-        x_sno = margin + 8
-        x_param = margin + 40
-        x_symbol = margin + 300
-        x_units = margin + 380
-        x_value = margin + 450
-
-        table_left = margin + 4
-        table_right = x_value + 90
-        table_width = table_right - table_left
-        header_height = 18
-        row_height = 14
-        table_top = y
-        # header
-        c.setLineWidth(1)
-        c.setFillColorRGB(0.9,0.9,0.9)
-        c.rect(table_left, table_top - header_height, table_width, header_height, fill=1, stroke=0)
-        c.setFillColorRGB(0,0,0)
-        c.drawString(x_sno, table_top - header_height + 4, "S.No")
-        c.drawString(x_param, table_top - header_height + 4, "Parameter (description)")
-        c.drawString(x_symbol, table_top - header_height + 4, "Symbol")
-        c.drawString(x_units, table_top - header_height + 4, "Units")
-        c.drawString(x_value, table_top - header_height + 4, "Value")
-        y_cursor = table_top - header_height - 4
-        table_y_start = table_top - header_height
-        sno = 1
-        c.setFont("Helvetica", 9)
-
-        for key in keys_to_report:
-            # page break if needed
-            if y_cursor < margin + 60:
-                # draw border and new page
-                table_bottom = y_cursor + row_height + 4
-                c.rect(table_left, table_bottom, table_width, table_y_start - table_bottom, fill=0, stroke=1)
-                c.showPage()
-                y = height - margin
-                c.setFont("Helvetica-Bold", 12)
-                c.drawString(margin, y, "2) Calculations & Results (continued)")
-                y -= 20
-                c.setFont("Helvetica", 9)
-                table_top = y
-                c.setFillColorRGB(0.9,0.9,0.9)
-                c.rect(table_left, table_top - header_height, table_width, header_height, fill=1, stroke=0)
-                c.setFillColorRGB(0,0,0)
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(x_sno, table_top - header_height + 4, "S.No")
-                c.drawString(x_param, table_top - header_height + 4, "Parameter (description)")
-                c.drawString(x_symbol, table_top - header_height + 4, "Symbol")
-                c.drawString(x_units, table_top - header_height + 4, "Units")
-                c.drawString(x_value, table_top - header_height + 4, "Value")
-                c.setFont("Helvetica", 9)
-                y_cursor = table_top - header_height - 4
-                table_y_start = table_top - header_height
-
-            info = param_info.get(key, (key, key, ""))
-            if key in merged:
-                val = merged.get(key, "-")
-            else:
-                val = {"Vu": vu, "Tu": tu, "fc": fc, "fy": fy, "fyt": fyt, "h": h, "b": b, "tf": tf}.get(key, merged.get(key, "-"))
-            try:
-                if isinstance(val, float):
-                    val_str = f"{val:.4f}"
-                else:
-                    val_str = str(val)
-            except:
-                val_str = str(val)
+    figure_bytes = scene = None
+    if drawing_args is not None:
+        _, figure_bytes, scene, _ = render_section_drawing(*drawing_args)
+    key = content_key("beam", mode, want_section, report_inputs, merged, drawing_args)
+    report_merged = dict(merged)  # the worker must not see later edits to the session's record
+    job = report_jobs().submit(key, lambda progress: build_pdf_report(mode, want_section, report_inputs, report_merged,
+                                                                      figure_bytes, scene=scene).getvalue(),
+                               total=1, label="PDF report")
+    st.session_state["report_job"] = job.id
+report_job_panel("report_job", "CEP_Report.pdf")
+
+# Whole-schedule report: one PDF with every beam's pages and a linked summary index
+with st.expander("Schedule report (CSV / Parquet schedule → one PDF)"):
+    # a new uploader key after each submit drops the uploaded bytes from this session
+    upload_key = f"schedule_file_{st.session_state.get('schedule_uploads', 0)}"
+    schedule_file = st.file_uploader("Beam schedule", type=["csv", "parquet"], key=upload_key)
+    if st.button("Generate schedule report", key="schedule_report", disabled=schedule_file is None):
+        schedule_mode = "analysis" if mode == "Analysis" else "design"
+        schedule_bytes = schedule_file.getvalue()
+        schedule_fmt = file_format(schedule_file.name)
+
+        def build_schedule_report(progress):
+            out = io.BytesIO()
+            write_schedule_report(io.BytesIO(schedule_bytes), out, schedule_mode, input_format=schedule_fmt,
+                                  progress=progress)
+            return out.getvalue()
 
-            # alternate background
-            if sno % 2 == 0:
-                c.setFillColorRGB(0.98,0.98,0.98)
-                c.rect(table_left, y_cursor - row_height + 2, table_width, row_height, fill=1, stroke=0)
-                c.setFillColorRGB(0,0,0)
-
-            # draw text
-            c.drawString(x_sno, y_cursor - row_height + 6, str(sno))
-            # wrap param desc if needed (simple)
-            param_text = info[0]
-            max_param_chars = 36
-            if len(param_text) > max_param_chars:
-                first_part = param_text[:max_param_chars]
-                second_part = param_text[max_param_chars:]
-                c.drawString(x_param, y_cursor - row_height + 6, first_part)
-                c.drawString(x_param, y_cursor - row_height - 6, second_part)
-            else:
-                c.drawString(x_param, y_cursor - row_height + 6, param_text)
-            c.drawString(x_symbol, y_cursor - row_height + 6, info[1])
-            c.drawString(x_units, y_cursor - row_height + 6, info[2])
-            c.drawString(x_value, y_cursor - row_height + 6, val_str)
-
-            c.setLineWidth(0.5)
-            c.line(table_left, y_cursor - row_height + 2, table_right, y_cursor - row_height + 2)
-            y_cursor -= row_height + 2
-            sno += 1
-
-        # outer border for calculations table
-        table_bottom = y_cursor + row_height + 6
-        if table_bottom < margin:
-            table_bottom = margin + 8
-        c.setLineWidth(1)
-        c.rect(table_left, table_bottom, table_width, table_y_start - table_bottom, fill=0, stroke=1)
-
-    # Add drawing if available
-    if last_figure_bytes:
-        c.showPage()
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(margin, height - margin, "3) Cross-section Drawing")
-        img = Image.open(io.BytesIO(last_figure_bytes))
-        # scale image to page width minus margins
-        max_w = width - 2 * margin
-        max_h = height - 2 * margin - 40
-        img_w, img_h = img.size
-        scale = min(max_w / img_w, max_h / img_h, 1.0)
-        disp_w = img_w * scale
-        disp_h = img_h * scale
-        img_reader = ImageReader(img)
-        c.drawImage(img_reader, margin, height - margin - disp_h - 20, width=disp_w, height=disp_h)
-
-    c.showPage()
-    c.save()
-    report_buf.seek(0)
-    st.download_button("Download PDF report", data=report_buf, file_name="CEP_Report.pdf", mime="application/pdf")
+        try:
+            total = count_schedule_rows(io.BytesIO(schedule_bytes), schedule_fmt)
+        except Exception as e:
+            st.error(f"Cannot read schedule: {e}")
+        else:
+            job = report_jobs().submit(content_key("schedule", schedule_mode, schedule_bytes), build_schedule_report,
+                                       total=total, label="Schedule report")
+            st.session_state["schedule_report_job"] = job.id
+            st.session_state["schedule_uploads"] = st.session_state.get("schedule_uploads", 0) + 1
+            st.rerun()
+    report_job_panel("schedule_report_job", "CEP_Schedule_Report.pdf")
+
+# Existing-building screen: utilization of the provided bars and stirrups of every member
+with st.expander("Reinforcement check (schedule with provided steel → utilization)"):
+    st.caption("Design schedule columns plus stirrup_bar and stirrup_spacing; mid_bar (side bars) and As_top "
+               "(top flexural steel) are optional. Tu_capacity is the largest Tu the member carries: every "
+               "smaller Tu checks adequate. Below Tu_almin its bars are short of Almin; where that lies above "
+               "Tth, Tu_capacity stays at Tth and the steel carries only Tu_almin to Tu_max.")
+    upload_key = f"check_file_{st.session_state.get('check_uploads', 0)}"
+    check_file = st.file_uploader("Schedule with provided steel", type=["csv", "parquet"], key=upload_key)
+    if st.button("Run check", key="run_check", disabled=check_file is None):
+        check_bytes = check_file.getvalue()
+        check_key = content_key("check", check_bytes)
+        try:
+            check_schedule(check_key, check_bytes, file_format(check_file.name))
+        except Exception as e:
+            st.error(f"Cannot check schedule: {e}")
+        else:
+            st.session_state["check_key"] = check_key
+            st.session_state["check_uploads"] = st.session_state.get("check_uploads", 0) + 1
+            st.rerun()
+    if st.session_state.get("check_key"):
+        checked = check_cache().get(st.session_state["check_key"])
+        if checked is None:
+            st.warning("The check is no longer cached — upload the schedule again.")
+        else:
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Members", f"{len(checked):,}")
+            m2.metric("Utilization above 1", f"{int((~checked['adequate']).sum()):,}")
+            m3.metric("Largest utilization", f"{checked['utilization'].max():.2f}")
+            limit = st.slider("Show members with utilization above", 0.0, 2.0, 1.0, 0.05, key="check_limit")
+            shown = checked[checked["utilization"] > limit].sort_values("utilization", ascending=False)
+            shown_cols = ([c for c in ("beam_id", "section", "b", "h") if c in shown]
+                          + ["utilization", "governs", "tu", "Tu_capacity", "Tu_almin", "Tu_max"] + UTILIZATION_KEYS)
+            st.dataframe(shown[shown_cols].head(1000), hide_index=True, width='stretch')
+            st.download_button("Download these members (CSV)", data=shown.to_csv(index=False).encode(),
+                               file_name="CEP_Check.csv", mime="text/csv", key="check_download")
 
 st.markdown("---")
+
+# Admin view: shared cache sizes and server memory (only with ?admin=<CEP_ADMIN_TOKEN>)
+if ADMIN_TOKEN and st.query_params.get("admin") == ADMIN_TOKEN:
+    with st.sidebar.expander("Server (admin)", expanded=True):
+        admin_panel()
@@ -0,0 +1,65 @@
+"""
+Headless engineering core for the CEP beam-torsion app.
+
+Importing the package pulls in only the scalar, pure-Python core (bar catalogs,
+geometry, stirrup selection, analysis, design). The NumPy batch engine, the
+matplotlib drawings and the reportlab PDF builder load on first attribute
+access, so a worker that only calls design_rectangular never imports them.
+"""
+import importlib
+
+from .bars import (BAR_DIAMETERS, RebarCatalog, ASTM_BARS, ASTM_METRIC_BARS, EN_BARS, CSA_BARS, CATALOGS,
+                   get_catalog, area_of_bar, area_of_bar_explicit, _bar_diameter)
+from .parsing import safe_float, safe_int
+from .records import BeamInput, SectionGeometry, BeamResult, merge_results
+from .geometry import compute_section_geometry, compute_section_geometry_dup
+from .stirrups import select_stirrup_and_spacing, select_stirrup_and_spacing_dup
+from .analysis import analysis_rectangular, analysis_T, analysis_L
+from .design import design_rectangular, design_T, design_L
+from .tables import (PARAM_INFO, RESULTS_TABLE_KEYS, REPORT_KEY_ORDER, format_value,
+                     results_table_rows, inputs_table, calculation_rows)
+
+# name -> submodule, resolved lazily by __getattr__
+_LAZY = {
+    "SECTION_RECT": "batch", "SECTION_T": "batch", "SECTION_L": "batch", "SECTION_CODES": "batch",
+    "BATCH_DESIGN_KEYS": "batch", "BATCH_ANALYSIS_KEYS": "batch", "section_codes": "batch",
+    "compute_section_geometry_batch": "batch", "select_stirrup_and_spacing_batch": "batch",
+    "design_batch": "batch", "design_batch_frame": "batch",
+    "analysis_batch": "batch", "analysis_batch_frame": "batch",
+    "draw_rectangular_layout": "drawing", "draw_T_layout": "drawing", "draw_L_layout": "drawing",
+    "columns_frame": "records", "columns_table": "records", "records_frame": "records",
+    "section_scene": "scene", "scene_to_svg": "vector", "optimize_design": "optimize",
+    "sweep_frame": "sweep", "sweep_chart": "sweep",
+    "design_combinations": "combos", "combinations_frame": "combos",
+    "design_stations": "span", "stirrup_zones": "span", "span_frame": "span", "linear_stations": "span",
+    "flexural_design": "flexure", "design_beam_batch": "flexure", "design_beam_frame": "flexure",
+    "FLEXURE_KEYS": "flexure",
+    "check_batch": "check", "check_batch_frame": "check",
+    "torsion_capacity_batch": "capacity", "torsion_capacity_frame": "capacity",
+    "ResultsStore": "store", "JobQueue": "jobs",
+    "build_pdf_report": "report", "write_batch_report": "report", "BatchReportWriter": "report",
+}
+
+__all__ = [
+    "BAR_DIAMETERS", "RebarCatalog", "ASTM_BARS", "ASTM_METRIC_BARS", "EN_BARS", "CSA_BARS", "CATALOGS",
+    "get_catalog", "area_of_bar", "area_of_bar_explicit",
+    "safe_float", "safe_int",
+    "BeamInput", "SectionGeometry", "BeamResult", "merge_results",
+    "compute_section_geometry", "compute_section_geometry_dup",
+    "select_stirrup_and_spacing", "select_stirrup_and_spacing_dup",
+    "analysis_rectangular", "analysis_T", "analysis_L",
+    "design_rectangular", "design_T", "design_L",
+    "PARAM_INFO", "RESULTS_TABLE_KEYS", "REPORT_KEY_ORDER", "format_value",
+    "results_table_rows", "inputs_table", "calculation_rows",
+] + list(_LAZY)
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,69 @@
+"""Threshold-torsion analysis (Analysis mode) per section type."""
+import math
+
+from .records import BeamResult
+
+# ---------------------------
+# Core analysis functions (explicit for each section)
+# ---------------------------
+def analysis_rectangular(b, h, fc, tu_ft):
+    try:
+        cover = 0.75
+        lamda = 1.0
+        phi = 0.75
+        Acp = b * h
+        Pcp = 2 * (b + h)
+        Aoh = max((b - 2 * cover), 0) * max((h - 2 * cover), 0)
+        Ph = 2 * max((b - 2 * cover), 0) + 2 * max((h - 2 * cover), 0)
+        Ao = 0.85 * Aoh
+        sqrt_fc = math.sqrt(fc)
+        Tcr = (4 * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
+        Tth = Tcr / 4
+        # message equivalent
+        safe = tu_ft < Tth
+        return BeamResult(
+            Acp=Acp, Pcp=Pcp, Aoh=Aoh, Ph=Ph, Ao=Ao,
+            phiTcr=phi * Tcr, Tth=Tth, safe=safe
+        )
+    except Exception as e:
+        raise
+
+def analysis_T(b, h, tf, fc, tu_ft):
+    try:
+        cover = 0.75
+        lamda = 1.0
+        phi = 0.75
+        x = min(h - tf, 4 * tf)
+        b_total = b + 2 * x
+        Acp = b * h + (b_total - b) * tf
+        Pcp = 2 * h + 2 * b + 2 * (b_total - b)
+        Aoh = max((b - 2 * cover), 0) * max((h - 2 * cover), 0)
+        Ph = 2 * max((b - 2 * cover), 0) + 2 * max((h - 2 * cover), 0)
+        Ao = 0.85 * Aoh
+        sqrt_fc = math.sqrt(fc)
+        Tcr = (4 * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
+        Tth = Tcr / 4
+        safe = tu_ft < Tth
+        return BeamResult(Acp=Acp, Pcp=Pcp, Aoh=Aoh, Ph=Ph, Ao=Ao, phiTcr=phi * Tcr, Tth=Tth, safe=safe, b_total=b_total, x=x)
+    except Exception as e:
+        raise
+
+def analysis_L(b, h, tf, fc, tu_ft):
+    try:
+        cover = 0.75
+        lamda = 1.0
+        phi = 0.75
+        x = min(h - tf, 4 * tf)
+        b_total = b + x
+        Acp = b * h + (b_total - b) * tf
+        Pcp = 2 * h + 2 * b + 2 * (b_total - b)
+        Aoh = max((b - 2 * cover), 0) * max((h - 2 * cover), 0)
+        Ph = 2 * max((b - 2 * cover), 0) + 2 * max((h - 2 * cover), 0)
+        Ao = 0.85 * Aoh
+        sqrt_fc = math.sqrt(fc)
+        Tcr = (4 * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
+        Tth = Tcr / 4
+        safe = tu_ft < Tth
+        return BeamResult(Acp=Acp, Pcp=Pcp, Aoh=Aoh, Ph=Ph, Ao=Ao, phiTcr=phi * Tcr, Tth=Tth, safe=safe, b_total=b_total, x=x)
+    except Exception as e:
+        raise
@@ -0,0 +1,156 @@
+"""Rebar catalogs (ASTM imperial and metric series) and the bar area / diameter helpers."""
+import math
+from array import array
+
+# ---------------------------
+# Bar diameter / area helpers (explicit copy)
+# ---------------------------
+BAR_DIAMETERS = {
+    3: 0.375,
+    4: 0.500,
+    5: 0.625,
+    6: 0.750,
+    7: 0.875,
+    8: 1.000,
+    9: 1.128,
+    10: 1.270,
+    11: 1.410,
+    14: 1.693,
+    18: 2.257
+}
+
+# ---------------------------
+# Rebar catalogs
+# Contiguous typed arrays (array.array) per series: bar id, diameter (in),
+# area (in^2) and unit weight (lb/ft), plus dense id-indexed tables. Scalar
+# lookups are O(1) on precomputed values; the *_of methods take arrays of ids
+# and index NumPy views of the same buffers (no copies, no per-bar float math).
+# ---------------------------
+STEEL_UNIT_WEIGHT = 490.0  # lb / ft^3
+
+def _nominal_area(d):
+    # same expression as the original area_of_bar, so areas are bit-identical
+    return round((math.pi / 4) * d ** 2, 6) if d > 0 else 0.0
+
+class RebarCatalog:
+    """
+    One bar series. ids are the designations used by the inputs (ASTM bar numbers,
+    nominal mm for metric series); unknown ids have zero diameter, area and weight.
+    """
+    __slots__ = ("name", "label_format", "labels", "ids", "diameters", "areas", "weights",
+                 "_diameter", "_area", "_weight", "_dense_diameter", "_dense_area", "_dense_weight")
+
+    def __init__(self, name, diameters_in, label="#{}"):
+        self.name = name
+        self.label_format = label
+        ids = sorted(diameters_in)
+        self.labels = tuple(label.format(i) for i in ids)
+        self.ids = array("q", ids)
+        self.diameters = array("d", (float(diameters_in[i]) for i in ids))
+        self.areas = array("d", (_nominal_area(d) for d in self.diameters))
+        self.weights = array("d", (a * STEEL_UNIT_WEIGHT / 144 for a in self.areas))
+        self._diameter = dict(zip(ids, self.diameters))
+        self._area = dict(zip(ids, self.areas))
+        self._weight = dict(zip(ids, self.weights))
+        size = max(ids) + 1
+        self._dense_diameter = array("d", (self._diameter.get(i, 0.0) for i in range(size)))
+        self._dense_area = array("d", (self._area.get(i, 0.0) for i in range(size)))
+        self._dense_weight = array("d", (self._weight.get(i, 0.0) for i in range(size)))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, bar_id):
+        return bar_id in self._area
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __repr__(self):
+        return f"RebarCatalog({self.name!r}, {len(self)} bars)"
+
+    def label(self, bar_id):
+        return self.label_format.format(int(bar_id))
+
+    def between(self, min_diameter, max_diameter):
+        """Ids of the bars with min_diameter <= diameter <= max_diameter (in)."""
+        return [i for i, d in zip(self.ids, self.diameters) if min_diameter - 1e-9 <= d <= max_diameter + 1e-9]
+
+    def diameter(self, bar_id, default=0.0):
+        return self._diameter.get(bar_id, default)
+
+    def area(self, bar_id):
+        return self._area.get(bar_id, 0.0)
+
+    def weight(self, bar_id):
+        return self._weight.get(bar_id, 0.0)
+
+    def _lookup(self, table, bar_ids):
+        import numpy as np
+
+        values = np.frombuffer(table, dtype=np.float64)
+        bar_ids = np.asarray(bar_ids).astype(np.int64)
+        known = (bar_ids >= 0) & (bar_ids < len(values))
+        return np.where(known, values[np.clip(bar_ids, 0, len(values) - 1)], 0.0)
+
+    def diameters_of(self, bar_ids):
+        """Vectorized diameter(): array of ids -> array of diameters (in)."""
+        return self._lookup(self._dense_diameter, bar_ids)
+
+    def areas_of(self, bar_ids):
+        """Vectorized area(): array of ids -> array of areas (in^2)."""
+        return self._lookup(self._dense_area, bar_ids)
+
+    def weights_of(self, bar_ids):
+        """Vectorized weight(): array of ids -> array of unit weights (lb/ft)."""
+        return self._lookup(self._dense_weight, bar_ids)
+
+    def first_with_area(self, required, candidates=None):
+        """Smallest bar (of candidates, default all) whose area >= required, or None."""
+        for bar_id in (self.ids if candidates is None else candidates):
+            if self.area(bar_id) >= required:
+                return bar_id
+        return None
+
+    def frame(self):
+        """The catalog as a DataFrame (id, label, diameter, area, weight)."""
+        import numpy as np
+        import pandas as pd
+
+        return pd.DataFrame({"id": np.frombuffer(self.ids, dtype=np.int64), "label": self.labels,
+                             "diameter": np.frombuffer(self.diameters), "area": np.frombuffer(self.areas),
+                             "weight": np.frombuffer(self.weights)})
+
+_MM = 1 / 25.4
+ASTM_BARS = RebarCatalog("ASTM A615 (imperial)", BAR_DIAMETERS)
+# soft-metric designations of the same bars
+ASTM_METRIC_BARS = RebarCatalog("ASTM A615M (metric)", {10: 0.375, 13: 0.500, 16: 0.625, 19: 0.750, 22: 0.875,
+                                                         25: 1.000, 29: 1.128, 32: 1.270, 36: 1.410, 43: 1.693,
+                                                         57: 2.257})
+EN_BARS = RebarCatalog("EN 10080 / ISO 6935-2", {d: d * _MM for d in (6, 8, 10, 12, 14, 16, 20, 25, 28, 32, 40)},
+                       label="\u00d8{}")
+CSA_BARS = RebarCatalog("CSA G30.18", {10: 11.3 * _MM, 15: 16.0 * _MM, 20: 19.5 * _MM, 25: 25.2 * _MM,
+                                       30: 29.9 * _MM, 35: 35.7 * _MM, 45: 43.7 * _MM, 55: 56.4 * _MM},
+                        label="{}M")
+CATALOGS = {"ASTM": ASTM_BARS, "ASTM-M": ASTM_METRIC_BARS, "EN": EN_BARS, "CSA": CSA_BARS}
+
+def get_catalog(name):
+    try:
+        return CATALOGS[name]
+    except KeyError:
+        raise ValueError(f"Unknown rebar catalog {name!r}; choose from {', '.join(CATALOGS)}") from None
+
+_ASTM_AREA = ASTM_BARS._area
+
+def area_of_bar_explicit(bar_number):
+    return _ASTM_AREA.get(bar_number, 0.0)
+
+def area_of_bar(bar_number):
+    return _ASTM_AREA.get(bar_number, 0.0)
+
+def _bar_diameter(bar_num):
+    """Return dia in inches, fallback for unknown bar numbers."""
+    try:
+        return float(ASTM_BARS.diameter(int(bar_num), 0.75))
+    except Exception:
+        return 0.75
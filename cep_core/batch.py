@@ -0,0 +1,281 @@
+"""NumPy batch (vectorized) design and analysis over arrays of beams."""
+import numpy as np
+
+from .bars import ASTM_BARS, area_of_bar
+from .records import columns_frame
+from .stirrups import STIRRUP_BARS, STIRRUP_TWO_AV
+
+# ---------------------------
+# Batch (vectorized) design — NumPy
+# One pass over arrays of beams. Mirrors design_rectangular / design_T /
+# design_L operation-for-operation so every row matches the scalar result.
+# ---------------------------
+SECTION_RECT, SECTION_T, SECTION_L = 0, 1, 2
+SECTION_CODES = {"Rectangular Section": SECTION_RECT, "T Section": SECTION_T, "L Section": SECTION_L}
+STIRRUP_BAR_OPTIONS = list(STIRRUP_BARS)
+MID_BAR_OPTIONS = list(range(3, 13))
+
+BATCH_DESIGN_KEYS = ["Acp", "Pcp", "Aoh", "Ph", "Ao", "bf",
+                     "phiTcr", "Tth", "safe", "demand", "Vc", "phiVc", "capacity", "demand_exceeds_capacity",
+                     "Al", "Almin_governs", "Vn", "Vs", "Ats", "Atsmin", "stirrup_bar", "stirrup_spacing",
+                     "req_bottom", "req_mid", "req_top", "num_bottom_bars_needed", "num_top_bars_needed",
+                     "mid_bar", "area_mid", "provided_bottom_by_user", "provided_top_by_user"]
+BATCH_INT_KEYS = ("stirrup_bar", "num_bottom_bars_needed", "num_top_bars_needed", "mid_bar")
+
+def section_codes(section_type, n=None):
+    """Map a section name (or array of names / codes) to int codes 0=Rect, 1=T, 2=L."""
+    arr = np.asarray(section_type)
+    if arr.dtype.kind in "iu":
+        codes = arr.astype(np.int8)
+    else:
+        codes = np.full(arr.shape, -1, dtype=np.int8)
+        for name, code in SECTION_CODES.items():
+            codes[arr == name] = code
+        if np.any(codes < 0):
+            bad = sorted({str(s) for s in np.asarray(arr[codes < 0]).ravel()})
+            raise ValueError(f"Unknown section type(s): {', '.join(bad)}")
+    if n is not None:
+        codes = np.broadcast_to(codes, (n,))
+    return codes
+
+def compute_section_geometry_batch(b, h, codes, tf=None):
+    """Vectorized compute_section_geometry. Returns dict of arrays (Acp, Pcp, Aoh, Ph, Ao, bf)."""
+    cover = 0.75
+    b = np.asarray(b, dtype=float)
+    h = np.asarray(h, dtype=float)
+    tf = np.full(b.shape, np.nan) if tf is None else np.asarray(tf, dtype=float)
+    flange = np.minimum(4 * tf, h - tf)
+    bf = np.where(codes == SECTION_T, b + 2 * flange, np.where(codes == SECTION_L, b + flange, b))
+    flanged = codes != SECTION_RECT
+    Acp = np.where(flanged, b * h + (bf - b) * tf, h * b)
+    Pcp = np.where(flanged, 2 * h + 2 * b + 2 * (bf - b), 2 * (h + b))
+    bo = np.maximum((b - 2 * cover - 0.25), 0)
+    ho = np.maximum((h - 2 * cover - 0.25), 0)
+    Aoh = bo * ho
+    Ph = 2 * bo + 2 * ho
+    Ao = 0.85 * Aoh
+    return {"Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao, "bf": bf}
+
+def select_stirrup_and_spacing_batch(Ph, Ats, dup=False):
+    """
+    Vectorized select_stirrup_and_spacing. dup (bool or bool array) selects the
+    select_stirrup_and_spacing_dup variant used by design_T; the two differ only for Ph <= 0.
+    Uses the precomputed 2 Av index from stirrups.py: one searchsorted per call.
+    """
+    Ph = np.asarray(Ph, dtype=float)
+    Ats = np.asarray(Ats, dtype=float)
+    dup = np.broadcast_to(np.asarray(dup, dtype=bool), Ph.shape)
+    bars = np.array(STIRRUP_BARS)
+    two_av = np.array(STIRRUP_TWO_AV)
+    last = len(bars) - 1
+    limit = np.minimum(np.where(dup & (Ph <= 0), 12.0, Ph / 8), 12.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # first bar with 2 Av / Ats >= 4, settled on the loop's own test (see first_stirrup_index)
+        k = np.searchsorted(two_av, 4 * Ats, side="left")
+        k = k + ((k <= last) & (two_av[np.minimum(k, last)] / Ats < 4))
+        k = k - ((k > 0) & (two_av[np.maximum(k - 1, 0)] / Ats >= 4))
+        s_first = two_av[np.minimum(k, last)] / Ats
+    found = (k <= last) & (s_first <= limit)
+    selected_bar = np.where(found, bars[np.minimum(k, last)], 3)
+    final_spacing = np.where(found, np.floor(s_first * 2) / 2, np.floor(limit * 2) / 2)
+    # early return for no torsional steel (and, for the non-dup variant, a degenerate Ph)
+    no_steel = (Ats <= 0) | (~dup & (Ph <= 0))
+    selected_bar = np.where(no_steel, 3, selected_bar)
+    final_spacing = np.where(no_steel, np.maximum(4.0, np.minimum(12.0, np.where(Ph > 0, Ph / 8, 12.0))), final_spacing)
+    return selected_bar, final_spacing
+
+def design_batch(section_type, b, h, tf, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
+    """
+    Vectorized design_rectangular / design_T / design_L over arrays of beams.
+
+    Every argument may be a scalar or a 1-D array; section_type is a name from
+    SECTION_CODES, an int code, or an array of either. Returns a dict of equal-length
+    arrays keyed by BATCH_DESIGN_KEYS. The safe / demand_exceeds_capacity branches are
+    boolean masks; float results outside a row's branch are NaN and int results are 0.
+    """
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                   for v in (b, h, fc, fy, fyt, tu_ft, vu, As_flexure)])
+    b, h, fc, fy, fyt, tu_ft, vu, As_flexure = arrays
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.full(n, np.nan) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    bar_l, nl, nt, bar_top = [np.broadcast_to(np.asarray(v).astype(np.int64), (n,)) for v in (bar_l, nl, nt, bar_top)]
+    return design_rows(section_terms(codes, b, h, tf, fc, fy, fyt), tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top)
+
+def section_terms(codes, b, h, tf, fc, fy, fyt):
+    """
+    The load-independent part of design_batch, per beam: geometry, phiTcr / Tth, the
+    concrete shear and stress-limit capacity and the steel minimums. Returns a dict
+    of arrays that design_rows (or a gather of it, one row per load case) completes.
+    """
+    lamda = 1.0
+    phi = 0.75
+    d = h - 2.5
+    if np.any(d <= 0):
+        rows = np.flatnonzero(d <= 0)
+        raise ValueError(f"Effective depth d <= 0 (rows {rows[:10].tolist()}).")
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        terms = compute_section_geometry_batch(b, h, codes, tf)
+        Acp = terms["Acp"]; Pcp = terms["Pcp"]; Ph = terms["Ph"]
+        sqrt_fc = np.sqrt(fc)
+        # np.float_power goes through C pow() like Python's `x ** 2`; plain `**` squares
+        # by multiplication, which can differ from the scalar functions in the last bit.
+        phiTcr = (4 * phi * lamda * sqrt_fc * np.float_power(Acp, 2) / Pcp) / (1000 * 12)
+        Vc = 2 * lamda * sqrt_fc * b * d
+        # Almin's load-independent parts: term1 = Almin_base - At_s * Ph * fyt / fy, term2 in full
+        Almin_base = 5 * sqrt_fc * Acp / (1000 * fy)
+        terms.update(
+            codes=codes, b=b, d=d, tf=tf, fc=fc, fy=fy, fyt=fyt, sqrt_fc=sqrt_fc, phiTcr=phiTcr, Tth=phiTcr / 4, Vc=Vc,
+            phiVc=phi * Vc / 1000, capacity=phi * ((Vc / (b * d)) + 8 * sqrt_fc),
+            Almin_base=Almin_base, Almin_term2=Almin_base - ((25 * b / fyt) * Ph * fyt / fy),
+            Atsmin=np.maximum(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt)))
+    return terms
+
+def torsion_steel(terms, tu_ft, vu):
+    """
+    design_rows' torsion and shear quantities for every row, whatever its branch: safe,
+    demand, Al (floored at Almin), Almin_governs, At_s, Vs and Ats (floored at Atsmin).
+    """
+    phi = 0.75
+    b = terms["b"]; d = terms["d"]; fy = terms["fy"]; fyt = terms["fyt"]
+    Aoh = terms["Aoh"]; Ph = terms["Ph"]; Ao = terms["Ao"]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        tu_in = tu_ft * 12
+        demand = np.sqrt(np.float_power((vu * 1000) / (b * d), 2)
+                         + np.float_power(tu_in * 1000 * Ph / (1.7 * np.float_power(Aoh, 2)), 2))
+
+        Al = np.where(Ao > 0, (tu_in * Ph) / (phi * 2 * Ao * fy), np.inf)
+        At_s = np.where(Ao > 0, tu_in / (phi * 2 * Ao * fy), np.inf)
+        term1 = terms["Almin_base"] - (At_s * Ph * fyt / fy)
+        Almin = np.maximum(term1, terms["Almin_term2"])
+        Almin_governs = Al < Almin
+        Al = np.where(Al < Almin, Almin, Al)
+        Vs = np.maximum(0.0, (vu - terms["phiVc"]) / phi)
+        x = np.where((fyt * d) != 0, Vs / (fyt * d), 0.0)
+        Ats = x + 2 * At_s
+        Ats = np.where(Ats < terms["Atsmin"], terms["Atsmin"], Ats)
+    return {"safe": tu_ft < terms["Tth"], "demand": demand, "Al": Al, "Almin_governs": Almin_governs,
+            "At_s": At_s, "Vs": Vs, "Ats": Ats}
+
+def design_rows(terms, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top, As_top=None):
+    """
+    design_batch's per-load part: one result row per row of terms (see section_terms)
+    and of the load / steel arrays. Same return as design_batch. As_top, if given, is
+    the top flexural steel in req_top in place of the user's nt top bars.
+    """
+    codes = terms["codes"]; Ph = terms["Ph"]
+    phiVc = terms["phiVc"]; capacity = terms["capacity"]; Atsmin = terms["Atsmin"]
+    steel = torsion_steel(terms, tu_ft, vu)
+    safe = steel["safe"]; demand = steel["demand"]; Al = steel["Al"]; Vs = steel["Vs"]; Ats = steel["Ats"]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        designed = ~safe & (demand <= capacity)
+        exceeds = ~safe & ~designed
+        Almin_governs = designed & steel["Almin_governs"]
+        Vn = phiVc
+
+        stirrup_bar, stirrup_spacing = select_stirrup_and_spacing_batch(Ph, Ats, dup=(codes == SECTION_T))
+
+        req_bottom = As_flexure + Al / 3.0
+        req_mid = Al / 3.0
+        top_user = (nt > 0) & (bar_top > 0)
+        top_bars_area = np.where(top_user, nt * ASTM_BARS.areas_of(bar_top), 0.0)
+        req_top = (top_bars_area if As_top is None else As_top) + Al / 3.0
+
+        area_bar_8 = area_of_bar(8)
+        area_bar_6 = area_of_bar(6)
+        num_bottom_bars_needed = np.ceil(np.where(designed, req_bottom, 0.0) / area_bar_8).astype(np.int64)
+        num_top_bars_needed = np.ceil(np.where(designed, req_top, 0.0) / area_bar_6).astype(np.int64)
+
+        required_per_bar = np.where(req_mid > 0, req_mid / 2, 0.0)
+        mid_options = np.array(MID_BAR_OPTIONS)
+        mid_fits = ASTM_BARS.areas_of(mid_options)[None, :] >= required_per_bar[:, None]
+        mid_bar = np.where(mid_fits.any(axis=1), mid_options[mid_fits.argmax(axis=1)], 3)
+        area_mid = 2 * ASTM_BARS.areas_of(mid_bar)
+
+        provided_bottom_by_user = nl * ASTM_BARS.areas_of(bar_l)
+        provided_top_by_user = top_bars_area
+
+    results = {k: terms[k] for k in ("Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth")}
+    results["safe"] = safe
+    checked = {"demand": demand, "Vc": terms["Vc"], "phiVc": phiVc, "capacity": capacity}
+    for key, arr in checked.items():
+        results[key] = np.where(safe, np.nan, arr)
+    results["demand_exceeds_capacity"] = exceeds
+    detailed = {"Al": Al, "Almin_governs": Almin_governs, "Vn": Vn, "Vs": Vs, "Ats": Ats, "Atsmin": Atsmin,
+                "stirrup_bar": stirrup_bar, "stirrup_spacing": stirrup_spacing,
+                "req_bottom": req_bottom, "req_mid": req_mid, "req_top": req_top,
+                "num_bottom_bars_needed": num_bottom_bars_needed, "num_top_bars_needed": num_top_bars_needed,
+                "mid_bar": mid_bar, "area_mid": area_mid,
+                "provided_bottom_by_user": provided_bottom_by_user, "provided_top_by_user": provided_top_by_user}
+    for key, arr in detailed.items():
+        if arr.dtype == bool:
+            results[key] = arr
+        elif key in BATCH_INT_KEYS:
+            results[key] = np.where(designed, arr, 0).astype(np.int64)
+        else:
+            results[key] = np.where(designed, arr, np.nan)
+    return results
+
+def design_batch_frame(df):
+    """
+    DataFrame front-end for design_batch. Expects the same column names as the UI's
+    last_inputs (section, b, h, tf, fc, fy, fyt, tu, vu, bar_l, nl, As_flexure, nt, bar_top);
+    tf may be omitted for all-rectangular schedules. Returns a DataFrame on df's index.
+    """
+    tf = df["tf"].to_numpy(dtype=float) if "tf" in df else None
+    out = design_batch(df["section"].to_numpy(), df["b"].to_numpy(), df["h"].to_numpy(), tf,
+                       df["fc"].to_numpy(), df["fy"].to_numpy(), df["fyt"].to_numpy(),
+                       df["tu"].to_numpy(), df["vu"].to_numpy(), df["bar_l"].to_numpy(), df["nl"].to_numpy(),
+                       df["As_flexure"].to_numpy(), df["nt"].to_numpy(), df["bar_top"].to_numpy())
+    return columns_frame(out, index=df.index, keys=BATCH_DESIGN_KEYS)
+
+# ---------------------------
+# Batch (vectorized) analysis — threshold torsion screen
+# ---------------------------
+BATCH_ANALYSIS_KEYS = ["Acp", "Pcp", "Aoh", "Ph", "Ao", "phiTcr", "Tth", "safe", "b_total", "x"]
+
+def analysis_batch(section_type, b, h, tf, fc, tu_ft):
+    """
+    Vectorized analysis_rectangular / analysis_T / analysis_L over a mixed array of members.
+
+    section_type is a name, an int code (SECTION_RECT / SECTION_T / SECTION_L) or an array
+    of either; passing int codes skips the string mapping for large screens. tf is ignored
+    for rectangular rows (b_total = b and x = 0 there). Returns a dict of arrays keyed by
+    BATCH_ANALYSIS_KEYS.
+    """
+    b, h, fc, tu_ft = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in (b, h, fc, tu_ft)])
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.zeros(n) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    flanged = codes != SECTION_RECT
+    tf = np.where(flanged, tf, 0.0)
+
+    cover = 0.75
+    lamda = 1.0
+    phi = 0.75
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.where(flanged, np.minimum(h - tf, 4 * tf), 0.0)
+        b_total = b + np.where(codes == SECTION_T, 2 * x, x)
+        Acp = np.where(flanged, b * h + (b_total - b) * tf, b * h)
+        Pcp = np.where(flanged, 2 * h + 2 * b + 2 * (b_total - b), 2 * (b + h))
+        bo = np.maximum((b - 2 * cover), 0)
+        ho = np.maximum((h - 2 * cover), 0)
+        Aoh = bo * ho
+        Ph = 2 * bo + 2 * ho
+        Ao = 0.85 * Aoh
+        # float_power keeps Acp ** 2 bit-identical to the scalar functions (see design_batch)
+        Tcr = (4 * lamda * np.sqrt(fc) * np.float_power(Acp, 2) / Pcp) / (1000 * 12)
+        Tth = Tcr / 4
+    safe = tu_ft < Tth
+    return {"Acp": Acp, "Pcp": Pcp, "Aoh": Aoh, "Ph": Ph, "Ao": Ao,
+            "phiTcr": phi * Tcr, "Tth": Tth, "safe": safe, "b_total": b_total, "x": x}
+
+def analysis_batch_frame(df):
+    """DataFrame front-end for analysis_batch (columns section, b, h, tf, fc, tu)."""
+    tf = df["tf"].to_numpy(dtype=float) if "tf" in df else None
+    out = analysis_batch(df["section"].to_numpy(), df["b"].to_numpy(), df["h"].to_numpy(), tf,
+                         df["fc"].to_numpy(), df["tu"].to_numpy())
+    return columns_frame(out, index=df.index, keys=BATCH_ANALYSIS_KEYS)
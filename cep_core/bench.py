@@ -0,0 +1,310 @@
+"""
+Benchmark suite for the calculation, drawing and reporting paths.
+
+Every case runs on a fixed synthetic schedule (seeded, so runs are comparable)
+and reports latency percentiles plus throughput. Results are written as JSON;
+pass a previous file with --compare to flag regressions.
+
+    python -m cep_core.bench --out bench/baseline.json
+    python -m cep_core.bench --quick --compare bench/baseline.json
+    python -m cep_core.bench --only batch --sizes 1000 100000
+
+Cases:
+    scalar_design/<section>    one design_* call per row (uncached core functions)
+    scalar_analysis/<section>  one analysis_* call per row
+    batch_design/<n>           design_batch_frame over an n-row schedule
+    batch_analysis/<n>         analysis_batch_frame over an n-row schedule
+    render/<section>           draw_*_layout to a matplotlib figure (closed untimed)
+    png_encode/<section>       figure_png_bytes of a rendered figure
+    scene/<section>            *_scene layout only (no backend)
+    pdf_report/<raster|vector> build_pdf_report from PNG bytes or from a scene
+    batch_report/<n>           write_batch_report for n beams
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+SECTIONS = ["Rectangular Section", "T Section", "L Section"]
+SHORT = {"Rectangular Section": "rect", "T Section": "T", "L Section": "L"}
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_SEED = 20240601
+
+def synthetic_schedule(n, seed=DEFAULT_SEED, section=None):
+    """Fixed pseudo-random beam schedule with the CLI's design columns (plus beam_id)."""
+    rng = np.random.default_rng(seed)
+    if section is None:
+        sections = np.array(SECTIONS)[rng.integers(0, 3, n)]
+    else:
+        sections = np.full(n, section)
+    return pd.DataFrame({
+        "beam_id": [f"B{i}" for i in range(n)],
+        "section": sections,
+        "b": np.round(rng.uniform(8.0, 20.0, n), 2),
+        "h": np.round(rng.uniform(12.0, 36.0, n), 2),
+        "tf": np.round(rng.uniform(2.0, 6.0, n), 1),
+        "fc": rng.choice([3000.0, 4000.0, 5000.0], n),
+        "fy": np.full(n, 60.0),
+        "fyt": np.full(n, 60.0),
+        "tu": np.round(rng.uniform(0.0, 60.0, n), 2),
+        "vu": np.round(rng.uniform(5.0, 80.0, n), 2),
+        "bar_l": rng.choice([5, 6, 7, 8], n),
+        "nl": rng.integers(2, 5, n),
+        "As_flexure": np.round(rng.uniform(0.3, 2.0, n), 3),
+        "nt": rng.integers(0, 3, n),
+        "bar_top": rng.choice([5, 6], n),
+    })
+
+# ---------------------------
+# Timing helpers
+# ---------------------------
+def summarize(latencies, items_per_call=1):
+    """Latency percentiles (ms) and throughput (items/s) from per-call seconds."""
+    lat = np.asarray(latencies, dtype=float)
+    total = float(lat.sum())
+    return {
+        "calls": int(lat.size),
+        "items_per_call": items_per_call,
+        "mean_ms": float(lat.mean() * 1e3),
+        "p50_ms": float(np.percentile(lat, 50) * 1e3),
+        "p90_ms": float(np.percentile(lat, 90) * 1e3),
+        "p99_ms": float(np.percentile(lat, 99) * 1e3),
+        "min_ms": float(lat.min() * 1e3),
+        "max_ms": float(lat.max() * 1e3),
+        "throughput": (lat.size * items_per_call / total) if total > 0 else float("inf"),
+    }
+
+def time_calls(fn, args_list, warmup=1, setup=None, teardown=None):
+    """
+    Time fn(*args) once per entry of args_list (after `warmup` untimed calls).
+    setup(args) -> args runs untimed before each call; teardown(result) after it.
+    """
+    args_list = list(args_list)
+    for args in args_list[:warmup]:
+        if setup:
+            args = setup(args)
+        result = fn(*args)
+        if teardown:
+            teardown(result)
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for args in args_list:
+            if setup:
+                args = setup(args)
+            t0 = time.perf_counter()
+            result = fn(*args)
+            latencies.append(time.perf_counter() - t0)
+            if teardown:
+                teardown(result)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return latencies
+
+# ---------------------------
+# Cases
+# ---------------------------
+def _design_args(row, section):
+    if section == "Rectangular Section":
+        return (row.b, row.h, row.fc, row.fy, row.fyt, row.tu, row.vu, row.bar_l, row.nl, row.As_flexure,
+                row.nt, row.bar_top)
+    return (row.b, row.h, row.tf, row.fc, row.fy, row.fyt, row.tu, row.vu, row.bar_l, row.nl, row.As_flexure,
+            row.nt, row.bar_top)
+
+def _analysis_args(row, section):
+    if section == "Rectangular Section":
+        return (row.b, row.h, row.fc, row.tu)
+    return (row.b, row.h, row.tf, row.fc, row.tu)
+
+def _plain_rows(df):
+    # python floats / ints, as the UI passes them
+    return list(df.astype({c: float for c in ("b", "h", "tf", "fc", "fy", "fyt", "tu", "vu", "As_flexure")})
+                  .astype({c: int for c in ("bar_l", "nl", "nt", "bar_top")}).itertuples(index=False))
+
+def bench_scalar(calls, seed):
+    from .analysis import analysis_L, analysis_rectangular, analysis_T
+    from .design import design_L, design_rectangular, design_T
+
+    design_fns = {"Rectangular Section": design_rectangular, "T Section": design_T, "L Section": design_L}
+    analysis_fns = {"Rectangular Section": analysis_rectangular, "T Section": analysis_T, "L Section": analysis_L}
+    results = {}
+    for section in SECTIONS:
+        rows = _plain_rows(synthetic_schedule(calls, seed, section))
+        results[f"scalar_design/{SHORT[section]}"] = summarize(
+            time_calls(design_fns[section], [_design_args(r, section) for r in rows], warmup=10))
+        results[f"scalar_analysis/{SHORT[section]}"] = summarize(
+            time_calls(analysis_fns[section], [_analysis_args(r, section) for r in rows], warmup=10))
+    return results
+
+def bench_batch(sizes, repeat, seed):
+    from .batch import analysis_batch_frame, design_batch_frame
+
+    results = {}
+    for n in sizes:
+        df = synthetic_schedule(n, seed)
+        results[f"batch_design/{n}"] = summarize(time_calls(design_batch_frame, [(df,)] * repeat), n)
+        results[f"batch_analysis/{n}"] = summarize(time_calls(analysis_batch_frame, [(df,)] * repeat), n)
+    return results
+
+def _layout_cases(calls, seed):
+    """(section, draw args) per section, from designed synthetic beams."""
+    from .drawing import layout_args
+    from .schedule import beam_records, compute_chunk
+
+    cases = {}
+    for section in SECTIONS:
+        df = synthetic_schedule(calls, seed, section)
+        records = list(beam_records(df, compute_chunk(df), "design"))
+        cases[section] = [(inputs, merged, layout_args(merged, inputs, "Design")) for inputs, merged in records]
+    return cases
+
+def bench_drawing(calls, seed, dpi=150):
+    import matplotlib.pyplot as plt
+
+    from .drawing import draw_section_layout, figure_png_bytes
+    from .scene import section_scene
+
+    def draw(section, merged, args):
+        return draw_section_layout(section, merged["b"], merged["h"], merged["tf"], **args)
+
+    def scene(section, merged, args):
+        return section_scene(section, merged["b"], merged["h"], merged["tf"], **args)
+
+    def render_untimed(args):
+        return (draw(*args),)
+
+    results = {}
+    for section, beams in _layout_cases(calls, seed).items():
+        args_list = [(section, merged, args) for _, merged, args in beams]
+        name = SHORT[section]
+        results[f"scene/{name}"] = summarize(time_calls(scene, args_list))
+        results[f"render/{name}"] = summarize(time_calls(draw, args_list, teardown=plt.close))
+        results[f"png_encode/{name}"] = summarize(
+            time_calls(lambda fig: figure_png_bytes(fig, dpi=dpi), args_list, setup=render_untimed))
+    return results
+
+def bench_reports(calls, seed, batch_beams):
+    from .drawing import draw_section_layout, figure_png_bytes
+    from .report import build_pdf_report, write_batch_report
+    from .scene import section_scene
+
+    cases = _layout_cases(calls, seed)
+    raster, vector = [], []
+    for section, beams in cases.items():
+        for inputs, merged, args in beams:
+            png = figure_png_bytes(draw_section_layout(section, merged["b"], merged["h"], merged["tf"], **args))
+            scene = section_scene(section, merged["b"], merged["h"], merged["tf"], **args)
+            raster.append(("Design", section, inputs, merged, png, None))
+            vector.append(("Design", section, inputs, merged, None, scene))
+    results = {
+        "pdf_report/raster": summarize(time_calls(build_pdf_report, raster)),
+        "pdf_report/vector": summarize(time_calls(build_pdf_report, vector)),
+    }
+    records = [(inputs, merged, scene) for _, _, inputs, merged, _, scene in vector]
+    records = (records * (batch_beams // len(records) + 1))[:batch_beams]
+    results[f"batch_report/{batch_beams}"] = summarize(
+        time_calls(lambda: write_batch_report(iter(records), io.BytesIO()), [()] * 3), batch_beams)
+    return results
+
+GROUPS = ["scalar", "batch", "drawing", "reports"]
+
+def run_benchmarks(groups=None, sizes=None, quick=False, seed=DEFAULT_SEED):
+    """Run the selected groups; returns {"meta": {...}, "results": {case: stats}}."""
+    import matplotlib
+    import reportlab
+
+    groups = groups or GROUPS
+    sizes = sizes or ([1_000, 10_000] if quick else DEFAULT_SIZES)
+    scalar_calls = 300 if quick else 3_000
+    draw_calls = 5 if quick else 30
+    repeat = 3 if quick else 7
+    results = {}
+    if "scalar" in groups:
+        results.update(bench_scalar(scalar_calls, seed))
+    if "batch" in groups:
+        results.update(bench_batch(sizes, repeat, seed))
+    if "drawing" in groups:
+        results.update(bench_drawing(draw_calls, seed))
+    if "reports" in groups:
+        results.update(bench_reports(draw_calls, seed, 20 if quick else 100))
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "matplotlib": matplotlib.__version__,
+        "reportlab": reportlab.Version,
+        "seed": seed,
+        "quick": quick,
+        "groups": list(groups),
+        "sizes": list(sizes),
+    }
+    return {"meta": meta, "results": results}
+
+def compare(current, baseline, threshold=0.25):
+    """
+    (case, baseline p50 ms, current p50 ms, ratio, regressed) for cases present in
+    both runs; a case regresses when its p50 grew by more than threshold.
+    """
+    rows = []
+    for case, stats in current["results"].items():
+        base = baseline["results"].get(case)
+        if not base:
+            continue
+        ratio = stats["p50_ms"] / base["p50_ms"] if base["p50_ms"] else float("inf")
+        rows.append((case, base["p50_ms"], stats["p50_ms"], ratio, ratio > 1 + threshold))
+    return rows
+
+def format_results(report):
+    lines = [f"{'case':<28}{'calls':>7}{'p50 ms':>11}{'p90 ms':>11}{'p99 ms':>11}{'items/s':>14}"]
+    for case, s in report["results"].items():
+        lines.append(f"{case:<28}{s['calls']:>7}{s['p50_ms']:>11.3f}{s['p90_ms']:>11.3f}{s['p99_ms']:>11.3f}"
+                     f"{s['throughput']:>14,.0f}")
+    return "\n".join(lines)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cep_core.bench", description="Benchmark the CEP core paths.")
+    parser.add_argument("--out", metavar="JSON", help="write results (the new baseline) to this file")
+    parser.add_argument("--compare", metavar="JSON", help="baseline file to compare p50 latencies against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative p50 slowdown counted as a regression (default: %(default)s)")
+    parser.add_argument("--only", nargs="+", choices=GROUPS, help="run only these groups")
+    parser.add_argument("--sizes", nargs="+", type=int, help="schedule sizes for the batch group")
+    parser.add_argument("--quick", action="store_true", help="fewer calls and smaller schedules")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    report = run_benchmarks(args.only, args.sizes, args.quick, args.seed)
+    print(format_results(report))
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2)
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        rows = compare(report, baseline, args.threshold)
+        print(f"\ncompared with {args.compare} ({baseline['meta'].get('timestamp', '?')}):")
+        print(f"{'case':<28}{'base p50':>11}{'p50':>11}{'ratio':>9}")
+        for case, base, cur, ratio, regressed in rows:
+            print(f"{case:<28}{base:>11.3f}{cur:>11.3f}{ratio:>8.2f}x{'  REGRESSION' if regressed else ''}")
+        if any(r[4] for r in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Memoized geometry / analysis / design results.
+
+Every wrapper normalizes its arguments to a canonical tuple (floats rounded to
+NDIGITS decimals) and calls the core function with those canonical values, so a
+cached result is a pure function of its key. Caches are bounded LRU (or TTL when
+a ttl is configured) and keep hit / miss / eviction counters.
+
+    from cep_core import cache
+    out = cache.design_T(8, 12, 2, 4000, 60, 60, 5.0, 10, 6, 2, 0.5, 0, 6)
+    cache.cache_stats()
+"""
+import functools
+import sys
+import threading
+import weakref
+
+from cachetools import LRUCache, TTLCache
+
+from . import analysis as _analysis
+from . import design as _design
+from . import geometry as _geometry
+
+NDIGITS = 6
+
+class _CountingLRUCache(LRUCache):
+    def __init__(self, maxsize, counters, getsizeof=None):
+        super().__init__(maxsize, getsizeof)
+        self._counters = counters
+
+    def popitem(self):
+        item = super().popitem()
+        self._counters["evictions"] += 1
+        return item
+
+class _CountingTTLCache(TTLCache):
+    def __init__(self, maxsize, ttl, counters, getsizeof=None):
+        super().__init__(maxsize, ttl, getsizeof=getsizeof)
+        self._counters = counters
+
+    def popitem(self):
+        item = super().popitem()
+        self._counters["evictions"] += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self._counters["expirations"] += len(expired)
+        return expired
+
+def canonical_value(value, ndigits=NDIGITS):
+    """Round floats (and float-valued ints) so equal inputs give equal keys."""
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, int):
+        return value
+    value = float(value)
+    if value.is_integer():
+        return value
+    return round(value, ndigits)
+
+def canonical_args(*args, ndigits=NDIGITS):
+    return tuple(canonical_value(a, ndigits) for a in args)
+
+def approx_size(value):
+    """Rough deep size in bytes of a cached value (bytes, str, scalars and containers of them)."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return sys.getsizeof(value)
+    if hasattr(value, "columns") and hasattr(value, "memory_usage"):  # DataFrames
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if hasattr(value, "nbytes") and hasattr(value, "dtype"):  # arrays / Series; getsizeof misses a view's buffer
+        return max(sys.getsizeof(value), int(value.nbytes))
+    if hasattr(value, "keys"):  # dicts and records
+        return sys.getsizeof(value) + sum(approx_size(k) + approx_size(value[k]) for k in value.keys())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(approx_size(v) for v in value)
+    return sys.getsizeof(value)
+
+# every ResultCache, for shared_cache_stats(); weak, so a discarded cache drops out
+_registry = weakref.WeakSet()
+
+class ResultCache:
+    """
+    Thread-safe bounded result cache with hit / miss / eviction counters. maxsize is
+    an entry count, or a total size when getsizeof is given (e.g. len for bytes).
+    """
+
+    def __init__(self, name, maxsize=4096, ttl=None, getsizeof=None):
+        self.name = name
+        self.getsizeof = getsizeof
+        self._lock = threading.RLock()
+        self.configure(maxsize, ttl)
+        _registry.add(self)
+
+    def configure(self, maxsize=None, ttl=None):
+        """(Re)build the underlying cache; clears entries and counters."""
+        with self._lock:
+            self.maxsize = maxsize if maxsize is not None else getattr(self, "maxsize", 4096)
+            self.ttl = ttl
+            self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+            if ttl:
+                self._cache = _CountingTTLCache(self.maxsize, ttl, self.counters, self.getsizeof)
+            else:
+                self._cache = _CountingLRUCache(self.maxsize, self.counters, self.getsizeof)
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self.counters["misses"] += 1
+            else:
+                self.counters["hits"] += 1
+                return value
+        value = compute()
+        with self._lock:
+            try:
+                self._cache[key] = value
+            except ValueError:
+                pass  # single value larger than the whole cache; hand it back uncached
+        return value
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self.counters["misses"] += 1
+                return default
+            self.counters["hits"] += 1
+            return value
+
+    def put(self, key, value):
+        """Store value; False if it is larger than the whole cache (and so not kept)."""
+        with self._lock:
+            try:
+                self._cache[key] = value
+            except ValueError:
+                return False
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def nbytes(self):
+        """Bytes held: the cache's own size total when sized by getsizeof, else an approx_size estimate."""
+        with self._lock:
+            if self.getsizeof is not None:
+                return self._cache.currsize
+            values = list(self._cache.values())
+        return sum(approx_size(v) for v in values)
+
+    def stats(self):
+        with self._lock:
+            if self.ttl:
+                self._cache.expire()
+            lookups = self.counters["hits"] + self.counters["misses"]
+            return {"name": self.name, "size": len(self._cache), "currsize": self._cache.currsize,
+                    "maxsize": self.maxsize, "ttl": self.ttl,
+                    **self.counters, "hit_rate": (self.counters["hits"] / lookups) if lookups else 0.0}
+
+geometry_cache = ResultCache("geometry", maxsize=4096)
+results_cache = ResultCache("results", maxsize=16384)
+
+def memoize(cache, fn):
+    """Wrap fn so calls go through cache, keyed on (fn name, canonical args)."""
+    @functools.wraps(fn)
+    def wrapper(*args):
+        args = canonical_args(*args)
+        # results are flat records of scalars; hand out copies so callers may mutate them
+        return cache.get_or_compute((fn.__name__,) + args, lambda: fn(*args)).copy()
+    wrapper.cache = cache
+    return wrapper
+
+compute_section_geometry = memoize(geometry_cache, _geometry.compute_section_geometry)
+analysis_rectangular = memoize(results_cache, _analysis.analysis_rectangular)
+analysis_T = memoize(results_cache, _analysis.analysis_T)
+analysis_L = memoize(results_cache, _analysis.analysis_L)
+design_rectangular = memoize(results_cache, _design.design_rectangular)
+design_T = memoize(results_cache, _design.design_T)
+design_L = memoize(results_cache, _design.design_L)
+
+def cache_stats():
+    """Counters and sizes for every result cache."""
+    return [geometry_cache.stats(), results_cache.stats()]
+
+def shared_cache_stats(nbytes=True):
+    """stats() of every live ResultCache in the process (results, figures, reports, ...), by name; plus bytes held."""
+    caches = sorted(_registry, key=lambda c: c.name)
+    rows = []
+    for c in caches:
+        row = {**c.stats(), "unit": "entries" if c.getsizeof is None else "bytes"}
+        if nbytes:
+            row["bytes"] = c.nbytes()
+        rows.append(row)
+    return rows
+
+def clear_shared_caches():
+    for c in list(_registry):
+        c.clear()
+
+def process_memory():
+    """{"rss": current resident bytes or None, "peak": peak resident bytes} of this process."""
+    try:
+        with open("/proc/self/status") as fh:
+            status = dict(line.split(":", 1) for line in fh if ":" in line)
+        return {"rss": int(status["VmRSS"].split()[0]) * 1024, "peak": int(status["VmHWM"].split()[0]) * 1024}
+    except (OSError, KeyError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return {"rss": None, "peak": peak if sys.platform == "darwin" else peak * 1024}
+
+def configure_caches(geometry_maxsize=None, results_maxsize=None, ttl=None):
+    """Resize the caches and/or switch them to TTL expiry (ttl in seconds)."""
+    geometry_cache.configure(geometry_maxsize, ttl)
+    results_cache.configure(results_maxsize, ttl)
+
+def clear_caches():
+    geometry_cache.clear()
+    results_cache.clear()
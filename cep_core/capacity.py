@@ -0,0 +1,126 @@
+"""
+Torsional capacity: the largest Tu a section with given steel can carry.
+
+The inverse of check_batch. Every criterion of the torsion design is monotone
+(or piecewise linear) in Tu at a fixed Vu, so each limit is solved in closed form,
+vectorized over members, with no reruns of the design:
+
+    Tu_stress        sqrt(demand_v^2 + (Tu Ph / 1.7 Aoh^2)^2) <= capacity
+    Tu_transverse    max(Vs / (fyt d) + 2 Tu / (phi 2 Ao fy), Atsmin) <= 2 Av / s
+    Tu_longitudinal  max(Tu Ph / (phi 2 Ao fy), Almin(Tu)) <= the Al the bars leave
+                     free: 3 (bottom - As_flexure), 3 (top - As_top), 3 side (or
+                     2 (bottom / top - flexure) without side bars), as in check_batch
+
+Almin falls as Tu grows, so bars that meet Al at Tu_longitudinal can still be
+short of Almin at a smaller Tu: Tu_almin is the Tu below which they are (0 if
+none). Tu_max is the smallest of the three limits, or 0 where that lies below
+Tu_almin or the stirrup spacing exceeds min(Ph/8, 12): the steel is adequate for
+Tu_almin <= Tu <= Tu_max. Below Tth torsion may be neglected whatever the steel,
+so Tu_capacity = max(Tu_max, Tth) where Tu_almin <= Tth, and Tth where the bars
+are short of Almin above it (governs "longitudinal"); every Tu below Tu_capacity
+checks adequate. governs is "threshold" where Tth is at least Tu_max. Limits are
+suprema in kip-ft: check_batch just below each of them is adequate for that
+criterion.
+
+    res = torsion_capacity_batch("T Section", 12, 24, 4, 4000, 60, 60, vu=40, bar_l=8, nl=3,
+                                 As_flexure=1.2, nt=2, bar_top=6, stirrup_bar=4, stirrup_spacing=6, mid_bar=5)
+    res["Tu_capacity"], res["governs"]
+"""
+import numpy as np
+
+from .batch import section_codes, section_terms
+from .check import provided_steel
+from .records import columns_frame
+
+LIMIT_KEYS = ["Tu_stress", "Tu_transverse", "Tu_longitudinal"]
+GOVERNS = np.array(["stress", "transverse", "longitudinal"])
+CAPACITY_KEYS = (["Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth"] + LIMIT_KEYS
+                 + ["Tu_almin", "spacing_ok", "Tu_max", "Tu_capacity", "governs"])
+
+def capacity_rows(terms, vu, bar_l, nl, As_flexure, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar, As_top):
+    """torsion_capacity_batch on section_terms (one row per row of terms and of the other arrays)."""
+    phi = 0.75
+    b = terms["b"]; d = terms["d"]; fy = terms["fy"]; fyt = terms["fyt"]
+    Aoh = terms["Aoh"]; Ph = terms["Ph"]; Ao = terms["Ao"]
+    provided = provided_steel(terms, bar_l, nl, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # stress limit: the shear stress leaves sqrt(capacity^2 - v^2) for torsion
+        v = (vu * 1000) / (b * d)
+        room = np.float_power(terms["capacity"], 2) - np.float_power(v, 2)
+        Tu_stress = np.where(room > 0, np.sqrt(room) * 1.7 * np.float_power(Aoh, 2) / (1000 * Ph), 0.0)
+
+        # transverse: 2 At/s = Ats_provided - Av/s, with At/s = Tu / (phi 2 Ao fy)
+        Vs = np.maximum(0.0, (vu - terms["phiVc"]) / phi)
+        x = np.where((fyt * d) != 0, Vs / (fyt * d), 0.0)
+        Ats_provided = provided["Ats_provided"]
+        spare = Ats_provided - x
+        Tu_transverse = np.where((Ats_provided >= terms["Atsmin"]) & (spare > 0), spare * phi * Ao * fy, 0.0)
+
+        # longitudinal: the largest Al the bars leave free after flexure
+        sides = provided["sides"]
+        share = np.where(sides, 3.0, 2.0)
+        Al_free = np.minimum(share * (provided["provided_bottom"] - As_flexure),
+                             share * (provided["provided_top"] - As_top))
+        Al_free = np.where(sides, np.minimum(Al_free, 3.0 * provided["provided_mid"]), Al_free)
+        # Al = Tu * a, floored at Almin = max(Almin_base - Tu * c, Almin_term2), which falls with Tu
+        a = Ph / (phi * 2 * Ao * fy)
+        c = a * fyt / fy
+        Tu_al = Al_free / a
+        Almin_at_limit = np.maximum(terms["Almin_base"] - Tu_al * c, terms["Almin_term2"])
+        Tu_longitudinal = np.where((Al_free > 0) & (Almin_at_limit <= Al_free), Tu_al, 0.0)
+        Tu_almin = np.where(Tu_longitudinal > 0, np.maximum((terms["Almin_base"] - Al_free) / c, 0.0), 0.0)
+
+        # kip-ft; a NaN limit (degenerate section) counts as 0
+        limits = np.stack([np.where(Ao > 0, np.nan_to_num(t, nan=0.0) / 12, 0.0)
+                           for t in (Tu_stress, Tu_transverse, Tu_longitudinal)])
+        Tu_almin = np.where(Ao > 0, np.nan_to_num(Tu_almin, nan=0.0) / 12, 0.0)
+        spacing_ok = stirrup_spacing <= provided["s_max"]
+        lowest = limits.min(axis=0)
+        Tu_max = np.where(spacing_ok & (lowest > Tu_almin), lowest, 0.0)
+
+    Tth = terms["Tth"]
+    results = {k: terms[k] for k in ("Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth")}
+    results.update(zip(LIMIT_KEYS, limits))
+    # between Tth and Tu_almin the bars are short of Almin, so only Tu below Tth is carried
+    gap = Tu_almin > Tth
+    results.update(Tu_almin=Tu_almin, spacing_ok=spacing_ok, Tu_max=Tu_max,
+                   Tu_capacity=np.where(gap, Tth, np.maximum(Tu_max, Tth)))
+    governs = np.where(lowest > Tu_almin, GOVERNS[limits.argmin(axis=0)], "longitudinal")
+    governs = np.where(spacing_ok, governs, "spacing")
+    governs = np.where(gap & (Tu_max > Tth), "longitudinal", governs)
+    results["governs"] = np.where(Tth >= Tu_max, "threshold", governs)
+    return results
+
+def torsion_capacity_batch(section_type, b, h, tf, fc, fy, fyt, vu, bar_l, nl, As_flexure, nt, bar_top,
+                           stirrup_bar, stirrup_spacing, mid_bar=0, As_top=0.0):
+    """
+    Closed-form largest Tu (kip-ft) per criterion at the given Vu (see the module
+    docstring). Arguments as for check_batch without tu_ft. Returns a dict of
+    equal-length arrays keyed by CAPACITY_KEYS.
+    """
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                   for v in (b, h, fc, fy, fyt, vu, As_flexure, As_top, stirrup_spacing)])
+    b, h, fc, fy, fyt, vu, As_flexure, As_top, stirrup_spacing = arrays
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.full(n, np.nan) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    bar_l, nl, nt, bar_top, stirrup_bar, mid_bar = [np.broadcast_to(np.asarray(v).astype(np.int64), (n,))
+                                                    for v in (bar_l, nl, nt, bar_top, stirrup_bar, mid_bar)]
+    return capacity_rows(section_terms(codes, b, h, tf, fc, fy, fyt), vu, bar_l, nl, As_flexure, nt, bar_top,
+                         stirrup_bar, stirrup_spacing, mid_bar, As_top)
+
+def torsion_capacity_frame(df):
+    """
+    DataFrame front-end for torsion_capacity_batch: check_batch_frame's columns (tu is
+    not needed). Returns a DataFrame on df's index.
+    """
+    tf = df["tf"].to_numpy(dtype=float) if "tf" in df else None
+    mid_bar = df["mid_bar"].fillna(0).to_numpy() if "mid_bar" in df else 0
+    As_top = df["As_top"].fillna(0.0).to_numpy(dtype=float) if "As_top" in df else 0.0
+    out = torsion_capacity_batch(df["section"].to_numpy(), df["b"].to_numpy(), df["h"].to_numpy(), tf,
+                                 df["fc"].to_numpy(), df["fy"].to_numpy(), df["fyt"].to_numpy(),
+                                 df["vu"].to_numpy(), df["bar_l"].to_numpy(), df["nl"].to_numpy(),
+                                 df["As_flexure"].to_numpy(), df["nt"].to_numpy(), df["bar_top"].to_numpy(),
+                                 df["stirrup_bar"].to_numpy(), df["stirrup_spacing"].to_numpy(), mid_bar, As_top)
+    return columns_frame(out, index=df.index, keys=CAPACITY_KEYS)
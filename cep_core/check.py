@@ -0,0 +1,129 @@
+"""
+Capacity check of provided reinforcement.
+
+design_batch sizes steel; check_batch takes the steel a member already has (bottom,
+top and side bars, stirrup bar and spacing) and returns utilization ratios, demand
+over what is provided, for every criterion of the torsion design:
+
+    util_stress    demand / capacity, the combined shear-torsion stress limit
+    util_long      longitudinal steel, worst of bottom / side / top against
+                   req_bottom = As_flexure + Al/3, req_mid = Al/3, req_top = As_top + Al/3
+    util_trans     Ats (Av/s + 2 At/s, floored at Atsmin) / 2 Av / s of the stirrups
+    util_spacing   stirrup spacing / min(Ph/8, 12)
+
+utilization is the largest of the four, governs names it and adequate is
+utilization <= 1. Rows below the threshold torsion (safe) have all ratios 0. Al and
+Ats are those of design_rows (batch.torsion_steel) and are checked even where the
+demand exceeds the capacity. With no side bars (mid_bar 0) the side third of Al is
+shared by the top and bottom bars. Everything is one vectorized pass over the
+members, so a whole building model is screened in well under a second.
+
+    res = check_batch("T Section", 12, 24, 4, 4000, 60, 60, tu_ft=25, vu=40, bar_l=8, nl=3,
+                      As_flexure=1.2, nt=2, bar_top=6, stirrup_bar=4, stirrup_spacing=6, mid_bar=5)
+    res["utilization"], res["governs"]
+"""
+import numpy as np
+
+from .bars import ASTM_BARS
+from .batch import section_codes, section_terms, torsion_steel
+from .records import columns_frame
+
+UTILIZATION_KEYS = ["util_stress", "util_long", "util_trans", "util_spacing"]
+GOVERNS = np.array(["stress", "longitudinal", "transverse", "spacing"])
+CHECK_KEYS = (["Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth", "safe", "demand", "capacity",
+               "demand_exceeds_capacity", "Al", "Ats", "req_bottom", "req_mid", "req_top",
+               "provided_bottom", "provided_mid", "provided_top", "Ats_provided", "s_max"]
+              + UTILIZATION_KEYS + ["utilization", "governs", "adequate"])
+
+def _ratio(required, provided):
+    """required / provided; 0 where nothing is required, inf where it is but nothing is provided."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(required > 0, required / provided, 0.0)
+
+def provided_steel(terms, bar_l, nl, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar):
+    """
+    The provided steel of check_rows: provided_bottom / _mid / _top (in^2), Ats_provided
+    (2 Av / s), s_max and sides (side bars present).
+    """
+    sides = mid_bar > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {"provided_bottom": nl * ASTM_BARS.areas_of(bar_l),
+                "provided_mid": np.where(sides, 2 * ASTM_BARS.areas_of(np.where(sides, mid_bar, 3)), 0.0),
+                "provided_top": np.where((nt > 0) & (bar_top > 0), nt * ASTM_BARS.areas_of(bar_top), 0.0),
+                "Ats_provided": 2 * ASTM_BARS.areas_of(stirrup_bar) / stirrup_spacing,
+                "s_max": np.minimum(terms["Ph"] / 8, 12.0), "sides": sides}
+
+def check_rows(terms, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar, As_top):
+    """check_batch on section_terms (one row per row of terms and of the other arrays)."""
+    steel = torsion_steel(terms, tu_ft, vu)
+    safe = steel["safe"]; Al = steel["Al"]; Ats = steel["Ats"]
+    demand = np.where(safe, np.nan, steel["demand"])
+    capacity = np.where(safe, np.nan, terms["capacity"])
+
+    provided = provided_steel(terms, bar_l, nl, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar)
+    provided_bottom = provided["provided_bottom"]; provided_mid = provided["provided_mid"]
+    provided_top = provided["provided_top"]; Ats_provided = provided["Ats_provided"]; s_max = provided["s_max"]
+    sides = provided["sides"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # without side bars the top and bottom bars carry the side third too
+        share = np.where(sides, Al / 3.0, Al / 2.0)
+        req_bottom = np.where(safe, np.nan, As_flexure + share)
+        req_mid = np.where(safe, np.nan, np.where(sides, Al / 3.0, 0.0))
+        req_top = np.where(safe, np.nan, As_top + share)
+
+        ratios = {
+            "util_stress": demand / capacity,
+            "util_long": np.maximum(np.maximum(_ratio(req_bottom, provided_bottom), _ratio(req_top, provided_top)),
+                                    _ratio(req_mid, provided_mid)),
+            "util_trans": Ats / Ats_provided,
+            "util_spacing": stirrup_spacing / s_max,
+        }
+    results = {k: terms[k] for k in ("Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth")}
+    results.update(safe=safe, demand=demand, capacity=capacity, demand_exceeds_capacity=~safe & ~(demand <= capacity),
+                   Al=np.where(safe, np.nan, Al), Ats=np.where(safe, np.nan, Ats),
+                   req_bottom=req_bottom, req_mid=req_mid, req_top=req_top, provided_bottom=provided_bottom,
+                   provided_mid=provided_mid, provided_top=provided_top, Ats_provided=Ats_provided, s_max=s_max)
+    for key, arr in ratios.items():
+        results[key] = np.where(safe, 0.0, arr)
+    stacked = np.stack([results[k] for k in UTILIZATION_KEYS])
+    results["utilization"] = stacked.max(axis=0)
+    # a NaN ratio (degenerate section) governs
+    results["governs"] = np.where(safe, "", GOVERNS[np.nan_to_num(stacked, nan=np.inf).argmax(axis=0)])
+    results["adequate"] = results["utilization"] <= 1.0
+    return results
+
+def check_batch(section_type, b, h, tf, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top,
+                stirrup_bar, stirrup_spacing, mid_bar=0, As_top=0.0):
+    """
+    Vectorized capacity check of provided steel (see the module docstring). Arguments
+    as for design_batch, except that nt / bar_top are the provided top bars checked
+    against As_top (required top flexural steel) + Al/3. stirrup_bar / stirrup_spacing
+    are the provided two-leg stirrups and mid_bar the size of the two side bars (0:
+    none). Returns a dict of equal-length arrays keyed by CHECK_KEYS.
+    """
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                   for v in (b, h, fc, fy, fyt, tu_ft, vu, As_flexure, As_top, stirrup_spacing)])
+    b, h, fc, fy, fyt, tu_ft, vu, As_flexure, As_top, stirrup_spacing = arrays
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.full(n, np.nan) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    bar_l, nl, nt, bar_top, stirrup_bar, mid_bar = [np.broadcast_to(np.asarray(v).astype(np.int64), (n,))
+                                                    for v in (bar_l, nl, nt, bar_top, stirrup_bar, mid_bar)]
+    return check_rows(section_terms(codes, b, h, tf, fc, fy, fyt), tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top,
+                      stirrup_bar, stirrup_spacing, mid_bar, As_top)
+
+def check_batch_frame(df):
+    """
+    DataFrame front-end for check_batch: design_batch_frame's columns plus stirrup_bar
+    and stirrup_spacing; mid_bar and As_top are optional (default 0). Returns a DataFrame
+    on df's index.
+    """
+    tf = df["tf"].to_numpy(dtype=float) if "tf" in df else None
+    mid_bar = df["mid_bar"].fillna(0).to_numpy() if "mid_bar" in df else 0
+    As_top = df["As_top"].fillna(0.0).to_numpy(dtype=float) if "As_top" in df else 0.0
+    out = check_batch(df["section"].to_numpy(), df["b"].to_numpy(), df["h"].to_numpy(), tf,
+                      df["fc"].to_numpy(), df["fy"].to_numpy(), df["fyt"].to_numpy(),
+                      df["tu"].to_numpy(), df["vu"].to_numpy(), df["bar_l"].to_numpy(), df["nl"].to_numpy(),
+                      df["As_flexure"].to_numpy(), df["nt"].to_numpy(), df["bar_top"].to_numpy(),
+                      df["stirrup_bar"].to_numpy(), df["stirrup_spacing"].to_numpy(), mid_bar, As_top)
+    return columns_frame(out, index=df.index, keys=CHECK_KEYS)
@@ -0,0 +1,142 @@
+"""
+Command-line batch runner.
+
+    python -m cep_core schedule.csv results.parquet --mode design --chunksize 200000
+    python -m cep_core schedule.parquet results.parquet --workers 16 --reports reports/
+    python -m cep_core schedule.csv results.csv --batch-report submittal.pdf
+    python -m cep_core existing.csv utilization.parquet --mode check
+    python -m cep_core existing.csv tu_limits.parquet --mode capacity
+    python -m cep_core schedule.csv results.parquet --store results_store --project tower-a
+    python -m cep_core schedule.csv results.parquet --store results_store --incremental --reports reports/
+    python -m cep_core beams.csv envelope.csv --combos combos.csv --combo-rows combo_results.csv
+    python -m cep_core beams.csv zones.csv --stations stations.csv --min-zone-length 24
+"""
+import argparse
+import os
+import sys
+import time
+
+from .combos import run_combinations
+from .incremental import run_schedule_incremental
+from .parallel import run_schedule_parallel, write_schedule_report
+from .schedule import DEFAULT_CHUNKSIZE, run_schedule
+from .span import MIN_ZONE_LENGTH, run_span
+from .store import ResultsStore
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cep_core",
+                                     description="Run the torsion design/analysis over a CSV or Parquet beam schedule.")
+    parser.add_argument("input", help="beam schedule (.csv or .parquet)")
+    parser.add_argument("output", help="results file (.csv or .parquet), or a directory for per-chunk part files")
+    parser.add_argument("--mode", choices=["design", "analysis", "check", "capacity"], default="design",
+                        help="check: utilization of the provided bars and stirrups; capacity: the largest Tu they "
+                             "carry (default: %(default)s)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk (default: %(default)s)")
+    parser.add_argument("--input-format", choices=["csv", "parquet"], help="override the input extension")
+    parser.add_argument("--output-format", choices=["csv", "parquet"], help="override the output extension")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes; above 1 runs chunks on a process pool (default: %(default)s)")
+    parser.add_argument("--drawings", metavar="DIR", help="write a PNG cross-section per beam into DIR")
+    parser.add_argument("--reports", metavar="DIR", help="write a PDF report per beam into DIR")
+    parser.add_argument("--batch-report", metavar="PDF", help="write one PDF covering every beam, with a summary index")
+    parser.add_argument("--store", metavar="DIR", help="also append the results to a partitioned Parquet results store")
+    parser.add_argument("--incremental", action="store_true",
+                        help="recompute (and redraw / re-report) only beams whose inputs changed since the stored run; "
+                             "needs --store")
+    parser.add_argument("--combos", metavar="FILE",
+                        help="load combinations (beam id, combo, vu, tu) for the beams in input; writes the "
+                             "per-beam governing envelope to output (design mode)")
+    parser.add_argument("--combo-rows", metavar="FILE", help="with --combos, also write every combination's results")
+    parser.add_argument("--stations", metavar="FILE",
+                        help="Vu(x) / Tu(x) stations (beam id, x in inches, vu, tu) for the beams in input; writes "
+                             "the stirrup zones to output (design mode)")
+    parser.add_argument("--station-rows", metavar="FILE", help="with --stations, also write every station's results")
+    parser.add_argument("--min-zone-length", type=float, default=MIN_ZONE_LENGTH,
+                        help="shortest stirrup zone in inches (default: %(default)s)")
+    parser.add_argument("--project", help="project key in the results store (default: the input file name)")
+    parser.add_argument("--id-column", default="beam_id", help="column naming drawing/report files (default: %(default)s)")
+    parser.add_argument("--keep-parts", action="store_true", help="keep per-chunk part files after merging")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.chunksize <= 0 or args.workers <= 0:
+        print("error: --chunksize and --workers must be positive", file=sys.stderr)
+        return 2
+    if args.incremental and not args.store:
+        print("error: --incremental needs --store", file=sys.stderr)
+        return 2
+    if args.combos or args.stations:
+        if (args.combos and args.stations or args.mode != "design" or args.incremental or args.store
+                or args.drawings or args.reports or args.batch_report):
+            print("error: --combos / --stations run one design table on their own", file=sys.stderr)
+            return 2
+        return _main_combinations(args) if args.combos else _main_stations(args)
+    if args.combo_rows or args.station_rows:
+        print("error: --combo-rows / --station-rows need --combos / --stations", file=sys.stderr)
+        return 2
+    if args.mode in ("check", "capacity") and (args.drawings or args.reports or args.batch_report):
+        print(f"error: --mode {args.mode} writes result tables only (no drawings or reports)", file=sys.stderr)
+        return 2
+    project = args.project or os.path.splitext(os.path.basename(args.input))[0]
+    t0 = time.perf_counter()
+    stored = None
+    try:
+        if args.incremental:
+            summary = run_schedule_incremental(args.input, args.output, ResultsStore(args.store), project, args.mode,
+                                               args.chunksize, args.input_format, args.output_format, args.drawings,
+                                               args.reports, args.id_column)
+            stored = project, summary["run"]
+        elif args.workers > 1 or args.drawings or args.reports:
+            summary = run_schedule_parallel(args.input, args.output, args.mode, args.chunksize, args.workers,
+                                            args.input_format, args.output_format, args.drawings, args.reports,
+                                            args.id_column, args.keep_parts)
+        else:
+            summary = run_schedule(args.input, args.output, args.mode, args.chunksize,
+                                   args.input_format, args.output_format)
+        if args.batch_report:
+            write_schedule_report(args.input, args.batch_report, args.mode, args.chunksize, args.input_format,
+                                  args.id_column)
+        if args.store and not args.incremental:
+            stored = project, ResultsStore(args.store).append_file(args.output, project, args.mode, args.id_column,
+                                                                   args.output_format, args.chunksize)[0]
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - t0
+    print(f"{summary['rows']} beams in {summary['chunks']} chunk(s), {elapsed:.2f} s  "
+          f"(safe: {summary['safe']}, demand exceeds capacity: {summary['demand_exceeds_capacity']}) -> {args.output}")
+    if "inadequate" in summary:
+        print(f"utilization above 1: {summary['inadequate']} beam(s)")
+    if args.incremental:
+        print(f"reused {summary['reused']}, recomputed {summary['recomputed']}, "
+              f"dropped from schedule {summary['dropped']}")
+    if stored and stored[1] is not None:
+        print(f"stored as run {stored[1]} of project {stored[0]!r} in {args.store}")
+    return 0
+
+def _main_combinations(args):
+    t0 = time.perf_counter()
+    try:
+        summary = run_combinations(args.input, args.combos, args.output, args.combo_rows, args.input_format,
+                                   args.output_format, args.id_column)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - t0
+    print(f"{summary['beams']} beams x {summary['combinations']} combination(s), {elapsed:.2f} s  "
+          f"(safe: {summary['safe']}, demand exceeds capacity: {summary['demand_exceeds_capacity']}) -> {args.output}")
+    return 0
+
+def _main_stations(args):
+    t0 = time.perf_counter()
+    try:
+        summary = run_span(args.input, args.stations, args.output, args.station_rows, args.input_format,
+                           args.output_format, args.id_column, args.min_zone_length)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - t0
+    print(f"{summary['beams']} beams, {summary['stations']} station(s) -> {summary['zones']} stirrup zone(s), "
+          f"{elapsed:.2f} s  (beams over capacity: {summary['demand_exceeds_capacity']}) -> {args.output}")
+    return 0
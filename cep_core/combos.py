@@ -0,0 +1,194 @@
+"""
+Load-combination envelopes.
+
+Each beam carries its factored load combinations (typically 10-40 (Vu, Tu)
+pairs). design_combinations evaluates every (beam, combination) row in one
+vectorized pass: batch.section_terms runs once per beam (geometry, phiTcr / Tth,
+concrete capacity, steel minimums) and batch.design_rows once per combination
+on a gather of those terms, so each combination row equals design_batch for that
+beam and load. envelope() then picks, per beam, the governing combination for
+the longitudinal steel (Al), the transverse steel (Ats) and the demand / capacity
+ratio, and carries the design quantities that follow from each.
+
+    beams:  beam_id, section, b, h, tf, fc, fy, fyt, bar_l, nl, As_flexure, nt, bar_top
+    combos: beam_id, combo, vu, tu
+    rows, env = combinations_frame(beams, combos)
+    env.loc["B12", ["Ats", "Ats_combo", "stirrup_bar", "stirrup_spacing"]]
+"""
+import numpy as np
+
+from .batch import BATCH_DESIGN_KEYS, design_rows, section_codes, section_terms
+from .records import columns_frame
+
+BEAM_COLUMNS = ["section", "b", "h", "fc", "fy", "fyt", "bar_l", "nl", "As_flexure", "nt", "bar_top"]
+COMBO_COLUMNS = ["vu", "tu"]
+RATIO_KEY = "demand_capacity_ratio"
+COMBO_KEYS = ["beam", "combo"] + BATCH_DESIGN_KEYS + [RATIO_KEY]
+# governing result -> the results taken from that same combination
+GOVERNED = {
+    RATIO_KEY: ["demand", "capacity"],
+    "Al": ["Almin_governs", "req_bottom", "req_mid", "req_top", "num_bottom_bars_needed", "num_top_bars_needed",
+           "mid_bar", "area_mid"],
+    "Ats": ["Vs", "Atsmin", "stirrup_bar", "stirrup_spacing"],
+}
+ENVELOPE_KEYS = (["Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth", "n_combos", "safe", "demand_exceeds_capacity"]
+                 + [k for key, governed in GOVERNED.items() for k in [key, f"{key}_combo"] + governed])
+
+def design_combinations(section_type, b, h, tf, fc, fy, fyt, bar_l, nl, As_flexure, nt, bar_top, beam, tu_ft, vu):
+    """
+    Vectorized design of every load combination of every beam.
+
+    The beam arguments are as for design_batch (scalars or arrays of n_beams); beam
+    (int positions into them), tu_ft and vu are arrays with one entry per combination.
+    Returns (rows, terms): rows is a dict of combination arrays keyed like design_batch
+    plus "beam" and demand_capacity_ratio (NaN for safe combinations); terms is the
+    per-beam batch.section_terms, for envelope().
+    """
+    b, h, fc, fy, fyt, As_flexure = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                                          for v in (b, h, fc, fy, fyt, As_flexure)])
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.full(n, np.nan) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    bar_l, nl, nt, bar_top = [np.broadcast_to(np.asarray(v).astype(np.int64), (n,)) for v in (bar_l, nl, nt, bar_top)]
+    beam = np.asarray(beam, dtype=np.int64)
+    if beam.size and (beam.min() < 0 or beam.max() >= n):
+        raise ValueError(f"Combination beam positions must be in [0, {n}).")
+    tu_ft, vu = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (tu_ft, vu)])
+    tu_ft, vu = np.broadcast_to(tu_ft, beam.shape), np.broadcast_to(vu, beam.shape)
+
+    # geometry, phiTcr / Tth and capacities once per beam; a gather (no arithmetic) per combination
+    terms = section_terms(codes, b, h, tf, fc, fy, fyt)
+    gathered = {k: v[beam] for k, v in terms.items()}
+    rows = design_rows(gathered, tu_ft, vu, bar_l[beam], nl[beam], As_flexure[beam], nt[beam], bar_top[beam])
+    rows["beam"] = beam
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rows[RATIO_KEY] = rows["demand"] / rows["capacity"]
+    return rows, terms
+
+def beam_segments(beam, n_beams):
+    """(order, counts, starts): a stable sort of the combination rows by beam and each beam's slice of it."""
+    order = np.argsort(beam, kind="stable")
+    counts = np.bincount(beam, minlength=n_beams)
+    starts = np.cumsum(counts) - counts
+    return order, counts, starts
+
+def governing_rows(values, beam, n_beams, segments=None):
+    """
+    Per beam, the row of its largest value (-1 where it has no combination or only NaN);
+    ties go to the first row. segments is beam_segments(beam, n_beams), to share one sort.
+    """
+    order, counts, starts = segments or beam_segments(beam, n_beams)
+    rows = np.full(n_beams, -1, dtype=np.int64)
+    present = np.flatnonzero(counts)
+    if not present.size:
+        return rows
+    ranked = np.asarray(values, dtype=float)[order]
+    top = np.full(n_beams, np.nan)
+    top[present] = np.fmax.reduceat(ranked, starts[present])
+    # NaN never compares equal, so an all-NaN beam has no hit
+    hits = np.flatnonzero(ranked == np.repeat(top, counts))
+    first = np.searchsorted(hits, starts[present])
+    pos = hits[np.minimum(first, max(hits.size - 1, 0))] if hits.size else np.zeros(present.size, dtype=np.int64)
+    found = (first < hits.size) & (pos < starts[present] + counts[present])
+    rows[present[found]] = order[pos[found]]
+    return rows
+
+def _take(arr, rows):
+    taken = arr[np.maximum(rows, 0)] if arr.size else np.zeros(rows.shape, dtype=arr.dtype)
+    if taken.dtype == bool:
+        return taken & (rows >= 0)
+    if taken.dtype.kind in "iu":
+        return np.where(rows >= 0, taken, 0)
+    return np.where(rows >= 0, taken, np.nan)
+
+def envelope(rows, terms):
+    """
+    Per-beam envelope of design_combinations output: geometry, phiTcr and Tth (from the
+    per-beam terms), n_combos, safe (every combination below Tth), demand_exceeds_capacity
+    (any combination) and, for each governing result in GOVERNED, its largest value,
+    the governing combination row (<key>_combo, -1 if none) and the results of that row.
+    """
+    beam = rows["beam"]
+    n = terms["b"].shape[0]
+    n_combos = np.bincount(beam, minlength=n)
+    out = {k: terms[k] for k in ("Acp", "Pcp", "Aoh", "Ph", "Ao", "bf", "phiTcr", "Tth")}
+    out["n_combos"] = n_combos
+    out["safe"] = (n_combos > 0) & (np.bincount(beam, weights=rows["safe"], minlength=n) == n_combos)
+    out["demand_exceeds_capacity"] = np.bincount(beam, weights=rows["demand_exceeds_capacity"], minlength=n) > 0
+    segments = beam_segments(beam, n)
+    for key, governed in GOVERNED.items():
+        chosen = governing_rows(rows[key], beam, n, segments)
+        out[key] = _take(rows[key], chosen)
+        out[f"{key}_combo"] = chosen
+        for k in governed:
+            out[k] = _take(rows[k], chosen)
+    return out
+
+def combinations_frame(beams, combos, id_column="beam_id", combo_column="combo"):
+    """
+    DataFrame front-end: beams has one row per beam (BEAM_COLUMNS, tf, id_column),
+    combos one row per load combination (id_column, combo_column, vu, tu). Returns
+    (rows, env): rows on combos' index with id / combo columns and the COMBO_KEYS
+    results; env indexed by beam id, with each <key>_combo naming the governing
+    combination (None where there is none).
+    """
+    import pandas as pd
+
+    missing = [c for c in BEAM_COLUMNS + [id_column] if c not in beams]
+    missing += [c for c in COMBO_COLUMNS + [id_column, combo_column] if c not in combos]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(dict.fromkeys(missing))}")
+    ids = pd.Index(beams[id_column])
+    if ids.has_duplicates:
+        raise ValueError(f"Duplicate {id_column!r} values in the beam table.")
+    beam = ids.get_indexer(combos[id_column])
+    if np.any(beam < 0):
+        unknown = sorted({str(v) for v in combos[id_column].to_numpy()[beam < 0]})
+        raise ValueError(f"Combinations for unknown beam(s): {', '.join(unknown[:10])}")
+
+    tf = beams["tf"].to_numpy(dtype=float) if "tf" in beams else None
+    rows, terms = design_combinations(
+        beams["section"].to_numpy(), beams["b"].to_numpy(), beams["h"].to_numpy(), tf,
+        beams["fc"].to_numpy(), beams["fy"].to_numpy(), beams["fyt"].to_numpy(), beams["bar_l"].to_numpy(),
+        beams["nl"].to_numpy(), beams["As_flexure"].to_numpy(), beams["nt"].to_numpy(), beams["bar_top"].to_numpy(),
+        beam, combos["tu"].to_numpy(), combos["vu"].to_numpy())
+    labels = combos[combo_column].to_numpy(dtype=object)
+    rows[id_column] = combos[id_column].to_numpy()
+    rows[combo_column] = labels
+    rows_frame = columns_frame(rows, index=combos.index, keys=[id_column, combo_column] + COMBO_KEYS[2:])
+
+    env = envelope(rows, terms)
+    for key in GOVERNED:
+        chosen = env[f"{key}_combo"]
+        env[f"{key}_combo"] = np.where(chosen >= 0, _take(labels, chosen), None)
+    env_frame = columns_frame(env, index=ids, keys=ENVELOPE_KEYS)
+    return rows_frame, env_frame
+
+def read_table(path, fmt=None):
+    """A whole CSV / Parquet table (for inputs that cannot be processed chunk by chunk)."""
+    import pandas as pd
+
+    from .schedule import iter_schedule_chunks
+
+    return pd.concat(list(iter_schedule_chunks(path, fmt=fmt)), ignore_index=True)
+
+def run_combinations(beams_path, combos_path, output_path, rows_path=None, input_format=None, output_format=None,
+                     id_column="beam_id", combo_column="combo"):
+    """
+    Envelope a beam table against its load-combination table (CSV / Parquet) and write
+    one envelope row per beam to output_path, plus every combination's results to
+    rows_path if given. Both tables are read whole: a beam's combinations may sit anywhere
+    in the file. Returns a summary dict (beams, combinations, safe, demand_exceeds_capacity).
+    """
+    from .schedule import ScheduleWriter
+
+    beams = read_table(beams_path, input_format)
+    combos = read_table(combos_path, input_format)
+    rows, env = combinations_frame(beams, combos, id_column, combo_column)
+    with ScheduleWriter(output_path, output_format) as writer:
+        writer.write(env.reset_index())
+    if rows_path:
+        with ScheduleWriter(rows_path, output_format) as writer:
+            writer.write(rows)
+    return {"beams": len(env), "combinations": len(rows), "safe": int(env["safe"].sum()),
+            "demand_exceeds_capacity": int(env["demand_exceeds_capacity"].sum())}
@@ -0,0 +1,242 @@
+"""Torsion design (Design mode) per section type."""
+import math
+
+from .bars import area_of_bar, area_of_bar_explicit
+from .geometry import compute_section_geometry, compute_section_geometry_dup
+from .records import BeamResult
+from .stirrups import lookup_stirrup_and_spacing, lookup_stirrup_and_spacing_dup
+
+# ---------------------------
+# Design functions (Rectangular/T/L) - verbose
+# ---------------------------
+def design_rectangular(b, h, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
+    vals = compute_section_geometry(b, h, "Rectangular", None)
+    # replicate code from expanded clean version
+    cover = 0.75
+    lamda = 1.0
+    phi = 0.75
+    d = h - 2.5
+    if d <= 0:
+        raise ValueError("Effective depth d <= 0.")
+    tu_in = tu_ft * 12
+    sqrt_fc = math.sqrt(fc)
+    Acp = vals.Acp; Pcp = vals.Pcp; Aoh = vals.Aoh; Ph = vals.Ph; Ao = vals.Ao
+    phiTcr = (4 * phi * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
+    Tth = phiTcr / 4
+    if tu_ft < Tth:
+        return BeamResult(safe=True, phiTcr=phiTcr, Tth=Tth)
+    demand = math.sqrt(((vu * 1000) / (b * d)) ** 2 + (tu_in * 1000 * Ph / (1.7 * (Aoh ** 2))) ** 2)
+    Vc = 2 * lamda * sqrt_fc * b * d
+    phiVc = phi * Vc / 1000
+    capacity = phi * ((Vc / (b * d)) + 8 * sqrt_fc)
+
+    results = BeamResult()
+    results.phiTcr = phiTcr
+    results.Tth = Tth
+    results.demand = demand
+    results.Vc = Vc
+    results.phiVc = phiVc
+    results.capacity = capacity
+
+    if demand <= capacity:
+        Al = (tu_in * Ph) / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
+        At_s = tu_in / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
+        term1 = (5 * sqrt_fc * Acp / (1000 * fy)) - (At_s * Ph * fyt / fy)
+        term2 = (5 * sqrt_fc * Acp / (1000 * fy)) - ((25 * b / fyt) * Ph * fyt / fy)
+        Almin = max(term1, term2)
+        if Al < Almin:
+            Al = Almin
+            results.Almin_governs = True
+        results.Al = Al
+        Vn = phiVc
+        Vs = max(0.0, (vu - Vn) / phi)
+        x = Vs / (fyt * d) if (fyt * d) != 0 else 0.0
+        Ats = x + 2 * At_s
+        Atsmin = max(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt))
+        if Ats < Atsmin:
+            Ats = Atsmin
+        results.Vn = Vn
+        results.Vs = Vs
+        results.Ats = Ats
+        results.Atsmin = Atsmin
+
+        selected_bar, final_spacing = lookup_stirrup_and_spacing(Ph, Ats)
+        results.stirrup_bar = selected_bar
+        results.stirrup_spacing = final_spacing
+
+        req_bottom = As_flexure + Al / 3.0
+        req_mid = Al / 3.0
+        top_bars_area = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
+        req_top = top_bars_area + Al / 3.0
+
+        area_bar_8 = area_of_bar(8)
+        area_bar_6 = area_of_bar(6)
+
+        num_bottom_bars_needed = math.ceil(req_bottom / area_bar_8) if area_bar_8>0 else 0
+        num_top_bars_needed = math.ceil(req_top / area_bar_6) if area_bar_6>0 else 0
+
+        required_per_bar = req_mid / 2 if req_mid>0 else 0.0
+        mid_bar = next((bar for bar in range(3, 13) if area_of_bar(bar) >= required_per_bar), 3)
+        area_mid = 2 * area_of_bar(mid_bar) if mid_bar else 0.0
+
+        provided_bottom_by_user = nl * area_of_bar(bar_l)
+        provided_top_by_user = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
+
+        results.update(
+            req_bottom=req_bottom, req_mid=req_mid, req_top=req_top,
+            num_bottom_bars_needed=num_bottom_bars_needed, num_top_bars_needed=num_top_bars_needed,mid_bar=mid_bar,
+            area_mid=area_mid,
+            provided_bottom_by_user=provided_bottom_by_user, provided_top_by_user=provided_top_by_user
+        )
+    else:
+        results.demand_exceeds_capacity = True
+
+    return results
+
+def design_T(b, h, tf, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
+    vals = compute_section_geometry_dup(b, h, "T Section", tf)
+    cover = 0.75
+    lamda = 1.0
+    phi = 0.75
+    d = h - 2.5
+    if d <= 0:
+        raise ValueError("Effective depth d <= 0.")
+    tu_in = tu_ft * 12
+    sqrt_fc = math.sqrt(fc)
+    Acp = vals.Acp; Pcp = vals.Pcp; Aoh = vals.Aoh; Ph = vals.Ph; Ao = vals.Ao
+    phiTcr = (4 * phi * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
+    Tth = phiTcr / 4
+    if tu_ft < Tth:
+        return BeamResult(safe=True, phiTcr=phiTcr, Tth=Tth)
+    demand = math.sqrt(((vu * 1000) / (b * d)) ** 2 + (tu_in * 1000 * Ph / (1.7 * (Aoh ** 2))) ** 2)
+    Vc = 2 * lamda * sqrt_fc * b * d
+    phiVc = phi * Vc / 1000
+    capacity = phi * ((Vc / (b * d)) + 8 * sqrt_fc)
+
+    results = BeamResult(phiTcr=phiTcr, Tth=Tth, demand=demand, Vc=Vc, phiVc=phiVc, capacity=capacity)
+
+    if demand <= capacity:
+        Al = (tu_in * Ph) / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
+        At_s = tu_in / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
+        term1 = (5 * sqrt_fc * Acp / (1000 * fy)) - (At_s * Ph * fyt / fy)
+        term2 = (5 * sqrt_fc * Acp / (1000 * fy)) - ((25 * b / fyt) * Ph * fyt / fy)
+        Almin = max(term1, term2)
+        if Al < Almin:
+            Al = Almin
+            results.Almin_governs = True
+        results.Al = Al
+        Vn = phiVc
+        Vs = max(0.0, (vu - Vn) / phi)
+        x = Vs / (fyt * d) if (fyt * d) != 0 else 0.0
+        Ats = x + 2 * At_s
+        Atsmin = max(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt))
+        if Ats < Atsmin:
+            Ats = Atsmin
+        results.update(Vn=Vn, Vs=Vs, Ats=Ats, Atsmin=Atsmin)
+
+        selected_bar, final_spacing = lookup_stirrup_and_spacing_dup(Ph, Ats)
+        results.stirrup_bar = selected_bar
+        results.stirrup_spacing = final_spacing
+
+        req_bottom = As_flexure + Al / 3.0
+        req_mid = Al / 3.0
+        top_bars_area = nt * area_of_bar_explicit(bar_top) if (nt > 0 and bar_top > 0) else 0.0
+        req_top = top_bars_area + Al / 3.0
+
+        area_bar_8 = area_of_bar_explicit(8)
+        area_bar_6 = area_of_bar_explicit(6)
+
+        num_bottom_bars_needed = math.ceil(req_bottom / area_bar_8) if area_bar_8>0 else 0
+        num_top_bars_needed = math.ceil(req_top / area_bar_6) if area_bar_6>0 else 0
+
+        required_per_bar = req_mid / 2 if req_mid>0 else 0.0
+        mid_bar = next((bar for bar in range(3, 13) if area_of_bar_explicit(bar) >= required_per_bar), 3)
+        area_mid = 2 * area_of_bar_explicit(mid_bar) if mid_bar else 0.0
+
+        provided_bottom_by_user = nl * area_of_bar(bar_l)
+        provided_top_by_user = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
+
+        results.update(
+            req_bottom=req_bottom, req_mid=req_mid, req_top=req_top,
+            num_bottom_bars_needed=num_bottom_bars_needed, num_top_bars_needed=num_top_bars_needed,
+            mid_bar=mid_bar, area_mid=area_mid, provided_bottom_by_user=provided_bottom_by_user,
+            provided_top_by_user=provided_top_by_user
+        )
+    else:
+        results.demand_exceeds_capacity = True
+
+    return results
+
+def design_L(b, h, tf, fc, fy, fyt, tu_ft, vu, bar_l, nl, As_flexure, nt, bar_top):
+    vals = compute_section_geometry(b, h, "L Section", tf)
+    cover = 0.75
+    lamda = 1.0
+    phi = 0.75
+    d = h - 2.5
+    if d <= 0:
+        raise ValueError("Effective depth d <= 0.")
+    tu_in = tu_ft * 12
+    sqrt_fc = math.sqrt(fc)
+    Acp = vals.Acp; Pcp = vals.Pcp; Aoh = vals.Aoh; Ph = vals.Ph; Ao = vals.Ao
+    phiTcr = (4 * phi * lamda * sqrt_fc * (Acp ** 2) / Pcp) / (1000 * 12)
+    Tth = phiTcr / 4
+    if tu_ft < Tth:
+        return BeamResult(safe=True, phiTcr=phiTcr, Tth=Tth)
+    demand = math.sqrt(((vu * 1000) / (b * d)) ** 2 + (tu_in * 1000 * Ph / (1.7 * (Aoh ** 2))) ** 2)
+    Vc = 2 * lamda * sqrt_fc * b * d
+    phiVc = phi * Vc / 1000
+    capacity = phi * ((Vc / (b * d)) + 8 * sqrt_fc)
+
+    results = BeamResult(phiTcr=phiTcr, Tth=Tth, demand=demand, Vc=Vc, phiVc=phiVc, capacity=capacity)
+
+    if demand <= capacity:
+        Al = (tu_in * Ph) / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
+        At_s = tu_in / (phi * 2 * Ao * fy) if Ao > 0 else float('inf')
+        term1 = (5 * sqrt_fc * Acp / (1000 * fy)) - (At_s * Ph * fyt / fy)
+        term2 = (5 * sqrt_fc * Acp / (1000 * fy)) - ((25 * b / fyt) * Ph * fyt / fy)
+        Almin = max(term1, term2)
+        if Al < Almin:
+            Al = Almin
+            results.Almin_governs = True
+        results.Al = Al
+        Vn = phiVc
+        Vs = max(0.0, (vu - Vn) / phi)
+        x = Vs / (fyt * d) if (fyt * d) != 0 else 0.0
+        Ats = x + 2 * At_s
+        Atsmin = max(0.75 * sqrt_fc * b / (1000 * fyt), 50 * b / (1000 * fyt))
+        if Ats < Atsmin:
+            Ats = Atsmin
+        results.update(Vn=Vn, Vs=Vs, Ats=Ats, Atsmin=Atsmin)
+
+        selected_bar, final_spacing = lookup_stirrup_and_spacing(Ph, Ats)
+        results.stirrup_bar = selected_bar
+        results.stirrup_spacing = final_spacing
+
+        req_bottom = As_flexure + Al / 3.0
+        req_mid = Al / 3.0
+        top_bars_area = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
+        req_top = top_bars_area + Al / 3.0
+
+        area_bar_8 = area_of_bar(8)
+        area_bar_6 = area_of_bar(6)
+
+        num_bottom_bars_needed = math.ceil(req_bottom / area_bar_8) if area_bar_8>0 else 0
+        num_top_bars_needed = math.ceil(req_top / area_bar_6) if area_bar_6>0 else 0
+
+        required_per_bar = req_mid / 2 if req_mid>0 else 0.0
+        mid_bar = next((bar for bar in range(3, 13) if area_of_bar(bar) >= required_per_bar), 3)
+        area_mid = 2 * area_of_bar(mid_bar) if mid_bar else 0.0
+
+        provided_bottom_by_user = nl * area_of_bar(bar_l)
+        provided_top_by_user = nt * area_of_bar(bar_top) if (nt > 0 and bar_top > 0) else 0.0
+
+        results.update(
+            req_bottom=req_bottom, req_mid=req_mid, req_top=req_top,
+            num_bottom_bars_needed=num_bottom_bars_needed, num_top_bars_needed=num_top_bars_needed,
+            mid_bar=mid_bar, area_mid=area_mid, provided_bottom_by_user=provided_bottom_by_user,
+            provided_top_by_user=provided_top_by_user
+        )
+    else:
+        results.demand_exceeds_capacity = True
+
+    return results
@@ -0,0 +1,110 @@
+"""Matplotlib cross-section drawings for rectangular, T and L beams."""
+import io
+
+import matplotlib.pyplot as plt
+from matplotlib.patches import Rectangle, Circle, FancyBboxPatch
+
+from .scene import L_scene, T_scene, rectangular_scene, section_scene
+
+# ---------------------------
+# Drawing helpers (improved & consolidated)
+# ---------------------------
+
+def _draw_circle(ax, cx, cy, r, edge='black', face='#2B7ABF', zorder=5):
+    """Unified circle drawer used by layouts (keeps signature same)."""
+    c = Circle((cx, cy), r, edgecolor=edge, facecolor=face, linewidth=1.2, zorder=zorder)
+    ax.add_patch(c)
+
+def _draw_double_arrow(ax, x1, y1, x2, y2, text, rot=0, txt_offset=(0,0)):
+    """Draws dimension arrow with small rounded text background for readability."""
+    ax.annotate('', xy=(x1, y1), xytext=(x2, y2),
+                arrowprops=dict(arrowstyle='<->', color='black', lw=1.1))
+    tx = (x1 + x2) / 2 + txt_offset[0]
+    ty = (y1 + y2) / 2 + txt_offset[1]
+    # small white bbox for contrast
+    ax.text(tx, ty, text, ha='center', va='center', rotation=rot, fontsize=9,
+            bbox=dict(boxstyle="round,pad=0.12", fc="white", ec="none"))
+
+def _draw_callout_arrow(ax, tail_x, tail_y, head_x, head_y, label, tail_offset=(6,-6)):
+    """Red callout arrow used for reinforcement labels (keeps signature same)."""
+    ax.annotate('', xy=(head_x, head_y), xytext=(tail_x, tail_y),
+                arrowprops=dict(arrowstyle='->', color='red', lw=1.6))
+    ax.text(tail_x + tail_offset[0], tail_y + tail_offset[1], label, fontsize=10, color='black')
+
+def render_scene(scene):
+    """Draw a scene (see scene.py) on a new matplotlib figure and return the figure."""
+    fig, ax = plt.subplots(figsize=scene["figsize"])
+    for item in scene["items"]:
+        kind = item["kind"]
+        if kind == "box":
+            if item["rounded"]:
+                patch = FancyBboxPatch((item["x"], item["y"]), item["w"], item["h"],
+                                       boxstyle="round,pad=0.02", linewidth=item["lw"],
+                                       edgecolor=item["edge"], facecolor=item["face"])
+            else:
+                patch = Rectangle((item["x"], item["y"]), item["w"], item["h"],
+                                  linewidth=item["lw"], edgecolor=item["edge"], facecolor=item["face"])
+            ax.add_patch(patch)
+        elif kind == "circle":
+            _draw_circle(ax, item["cx"], item["cy"], item["r"], edge=item["edge"], face=item["face"], zorder=item["zorder"])
+        elif kind == "arrow":
+            ax.annotate('', xy=(item["x1"], item["y1"]), xytext=(item["x2"], item["y2"]),
+                        arrowprops=dict(arrowstyle=item["style"], color=item["color"], lw=item["lw"]))
+        elif kind == "text":
+            ax.text(item["x"], item["y"], item["text"], fontsize=item["size"], ha=item["ha"], va=item["va"],
+                    rotation=item["rot"], color=item["color"])
+        elif kind == "dimension":
+            _draw_double_arrow(ax, item["x1"], item["y1"], item["x2"], item["y2"], item["text"],
+                               rot=item["rot"], txt_offset=item["txt_offset"])
+        elif kind == "callout":
+            _draw_callout_arrow(ax, item["tail_x"], item["tail_y"], item["head_x"], item["head_y"], item["label"],
+                                tail_offset=item["tail_offset"])
+    ax.set_xlim(*scene["xlim"])
+    ax.set_ylim(*scene["ylim"])
+    ax.set_aspect('equal')
+    ax.axis('off')
+    return fig
+
+def draw_rectangular_layout(b, h, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """Rectangular section drawing (layout in scene.rectangular_scene)."""
+    return render_scene(rectangular_scene(b, h, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing))
+
+def draw_T_layout(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """T-section drawing (layout in scene.T_scene)."""
+    return render_scene(T_scene(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing))
+
+def draw_L_layout(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """L-section drawing (layout in scene.L_scene)."""
+    return render_scene(L_scene(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing))
+
+# ---------------------------
+# Layout dispatch (shared by the UI and the batch runners)
+# ---------------------------
+def layout_args(merged, inputs, mode="Design"):
+    """
+    Bar counts / stirrup arguments for draw_*_layout, picked the way the UI does:
+    designed counts first, then the user's Nt / Nl. Analysis mode draws geometry only.
+    """
+    if mode == "Analysis":
+        return {"num_top": 0, "num_bottom": 0, "mid_bar": 0, "stirrup_bar": 0, "stirrup_spacing": 0.0}
+    return {
+        "num_top": merged.get("num_top_bars_needed") or inputs.get("nt", 0),
+        "num_bottom": merged.get("num_bottom_bars_needed") or inputs.get("nl", 0),
+        "mid_bar": merged.get("mid_bar", 0),
+        "stirrup_bar": merged.get("stirrup_bar", 0),
+        "stirrup_spacing": merged.get("stirrup_spacing", 0.0),
+    }
+
+def draw_section_layout(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """Draw the section named by `section` (tf defaults to 1.0 for T/L, as in the UI)."""
+    return render_scene(section_scene(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                                      show_bar_spacing))
+
+def figure_png_bytes(fig, dpi=150, close=True):
+    """Encode a figure as PNG (as the UI does for the PDF report), closing it by default."""
+    buf = io.BytesIO()
+    fig.tight_layout()
+    fig.savefig(buf, format='png', dpi=dpi)
+    if close:
+        plt.close(fig)
+    return buf.getvalue()
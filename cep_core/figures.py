@@ -0,0 +1,79 @@
+"""
+Content-addressed cache of rendered cross-section PNGs.
+
+The key is a SHA-256 of everything that changes the picture (section type,
+dimensions, bar counts, mid bar, stirrup bar / spacing, spacing annotation,
+dpi), and the cache holds PNG bytes under a total-size cap. Figures are
+closed right after encoding, so a long-running server does not accumulate
+matplotlib figures.
+
+drawing_cache holds the UI's full drawing (PNG, scene and SVG, see
+render_section_drawing) under its own size cap; both caches are shared by every
+session of a server process.
+"""
+import hashlib
+
+from .cache import ResultCache, approx_size, canonical_args
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def _drawing_size(drawing):
+    png, scene, svg = drawing
+    return len(png) + len(svg) + approx_size(scene)
+
+figure_cache = ResultCache("figures", maxsize=DEFAULT_MAX_BYTES, getsizeof=len)
+drawing_cache = ResultCache("drawings", maxsize=DEFAULT_MAX_BYTES, getsizeof=_drawing_size)
+
+def figure_key(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+               show_bar_spacing=False, dpi=150):
+    """Hex digest identifying one drawing; tf is ignored for rectangular sections."""
+    if section not in ("T Section", "L Section"):
+        tf = None
+    parts = canonical_args(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                           bool(show_bar_spacing), dpi)
+    # hash the repr, so 10 and 10.0 must spell the same
+    parts = tuple(float(p) if isinstance(p, (int, float)) and not isinstance(p, bool) else p for p in parts)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+def render_section_png(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                       show_bar_spacing=False, dpi=150):
+    """
+    Return (key, png_bytes) for a section drawing, rendering it only on a cache miss.
+    Arguments are those of draw_section_layout plus dpi.
+    """
+    key = figure_key(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                     show_bar_spacing, dpi)
+
+    def render():
+        from .drawing import draw_section_layout, figure_png_bytes
+
+        fig = draw_section_layout(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                                  show_bar_spacing)
+        return figure_png_bytes(fig, dpi=dpi)
+
+    return key, figure_cache.get_or_compute(key, render)
+
+def render_section_drawing(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                           show_bar_spacing=False, dpi=150):
+    """
+    Return (key, png_bytes, scene, svg_text) for a section drawing, as the UI shows
+    and downloads it; the scene is built once and rendered both ways on a cache miss.
+    The scene is the cached (shared) object: read it, do not modify it.
+    """
+    key = figure_key(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                     show_bar_spacing, dpi)
+
+    def render():
+        from .drawing import figure_png_bytes, render_scene
+        from .scene import section_scene
+        from .vector import scene_to_svg
+
+        scene = section_scene(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing,
+                              show_bar_spacing)
+        return figure_png_bytes(render_scene(scene), dpi=dpi), scene, scene_to_svg(scene)
+
+    return (key,) + drawing_cache.get_or_compute(key, render)
+
+def configure_figure_cache(max_bytes=DEFAULT_MAX_BYTES, drawing_max_bytes=None):
+    figure_cache.configure(max_bytes)
+    drawing_cache.configure(max_bytes if drawing_max_bytes is None else drawing_max_bytes)
@@ -0,0 +1,146 @@
+"""
+Flexural design: the tension steel a factored moment needs.
+
+flexural_design sizes As from Mu with the rectangular stress block (0.85 f'c
+over a = beta1 c, phi = 0.9), vectorized over arrays of beams. The sagging moment
+Mu puts the flange of a T / L section in compression: the effective width is the
+bf of compute_section_geometry, and where the block runs below the flange (a > tf)
+the overhangs and the web are split as for a T-beam. The hogging moment Mu_top
+(top steel) puts the flange in tension, so only the web b resists it.
+
+design_beam_batch designs the whole beam in one pass: section_terms once, the
+flexural steel, then design_rows with As_flexure (and As_top) feeding req_bottom
+and req_top.
+
+    res = design_beam_batch("T Section", 12, 24, 4, 4000, 60, 60, mu=120, tu_ft=25, vu=40,
+                            bar_l=6, nl=2, nt=2, bar_top=6, mu_top=80)
+    res["As_flexure"], res["req_bottom"], res["flexure_exceeds"]
+
+Mu is in kip-ft, f'c in psi and fy in ksi, as in the torsion design; d = h - 2.5
+as there. Sections are singly reinforced: a moment the block cannot carry, or one
+that leaves the section short of tension-controlled (eps_t < 0.005), is flagged
+flexure_exceeds and its steel is NaN.
+"""
+import numpy as np
+
+from .batch import (BATCH_DESIGN_KEYS, SECTION_RECT, compute_section_geometry_batch, design_rows, section_codes,
+                    section_terms)
+from .records import columns_frame
+
+PHI_FLEXURE = 0.9
+EPS_TENSION_CONTROLLED = 0.005
+FLEXURE_KEYS = ["a", "eps_t", "web_compression", "As_min", "As_flexure", "As_top", "flexure_exceeds"]
+BEAM_DESIGN_KEYS = BATCH_DESIGN_KEYS + FLEXURE_KEYS
+
+def _stress_block(M, width, d, fc, fy_psi):
+    """(As, a) for M (lb-in) on a compression block of the given width; NaN where it cannot carry M."""
+    k = 0.85 * fc * width
+    # phi k a (d - a / 2) = M, smaller root
+    a = d - np.sqrt(d * d - 2 * M / (PHI_FLEXURE * k))
+    return k * a / fy_psi, a
+
+def flexural_rows(terms, mu, mu_top=None):
+    """
+    flexural_design on a dict of per-row section terms (codes, b, d, bf, tf, fc, fy;
+    e.g. batch.section_terms). Returns a dict of FLEXURE_KEYS arrays; As_top is NaN
+    throughout when mu_top is None.
+    """
+    codes = terms["codes"]; b = terms["b"]; d = terms["d"]; bf = terms["bf"]; tf = terms["tf"]; fc = terms["fc"]
+    fy_psi = terms["fy"] * 1000
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M = np.abs(np.asarray(mu, dtype=float)) * 12000
+        beta1 = np.clip(0.85 - 0.05 * (fc - 4000) / 1000, 0.65, 0.85)
+        As_min = np.maximum(3 * np.sqrt(fc), 200) * b * d / fy_psi
+
+        # flange width first (bf = b for rectangular sections); T-beam split where a > tf
+        As, a = _stress_block(M, bf, d, fc, fy_psi)
+        web = (codes != SECTION_RECT) & ~(a <= tf)
+        Cf = 0.85 * fc * (bf - b) * tf
+        As_web, a_web = _stress_block(M - PHI_FLEXURE * Cf * (d - tf / 2), b, d, fc, fy_psi)
+        As = np.where(web, Cf / fy_psi + As_web, As)
+        a = np.where(web, a_web, a)
+        c = a / beta1
+        eps_t = np.where(M > 0, 0.003 * (d - c) / c, np.nan)
+        exceeds = (M > 0) & ~(eps_t >= EPS_TENSION_CONTROLLED)
+        As_flexure = np.where(exceeds, np.nan, np.where(M > 0, np.maximum(As, As_min), 0.0))
+
+        if mu_top is None:
+            As_top = np.full(M.shape, np.nan)
+        else:
+            M_top = np.abs(np.asarray(mu_top, dtype=float)) * 12000
+            As_t, a_t = _stress_block(M_top, b, d, fc, fy_psi)
+            c_t = a_t / beta1
+            top_exceeds = (M_top > 0) & ~(0.003 * (d - c_t) / c_t >= EPS_TENSION_CONTROLLED)
+            As_top = np.where(top_exceeds, np.nan, np.where(M_top > 0, np.maximum(As_t, As_min), 0.0))
+            exceeds = exceeds | top_exceeds
+    return {"a": np.where(M > 0, a, 0.0), "eps_t": eps_t, "web_compression": web & (M > 0), "As_min": As_min,
+            "As_flexure": As_flexure, "As_top": As_top, "flexure_exceeds": exceeds}
+
+def flexural_design(section_type, b, h, tf, fc, fy, mu, mu_top=None):
+    """
+    Vectorized required flexural steel. Arguments are scalars or 1-D arrays as for
+    design_batch; mu (and mu_top, for the top steel) are factored moments in kip-ft,
+    taken by magnitude. Returns a dict of FLEXURE_KEYS arrays plus bf and d.
+    """
+    b, h, fc, fy, mu = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in (b, h, fc, fy, mu)])
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.full(n, np.nan) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    d = h - 2.5
+    if np.any(d <= 0):
+        rows = np.flatnonzero(d <= 0)
+        raise ValueError(f"Effective depth d <= 0 (rows {rows[:10].tolist()}).")
+    bf = compute_section_geometry_batch(b, h, codes, tf)["bf"]
+    terms = {"codes": codes, "b": b, "d": d, "bf": bf, "tf": tf, "fc": fc, "fy": fy}
+    out = flexural_rows(terms, mu, None if mu_top is None else np.broadcast_to(np.asarray(mu_top, dtype=float), (n,)))
+    out.update(bf=bf, d=d)
+    return out
+
+def design_beam_batch(section_type, b, h, tf, fc, fy, fyt, mu, tu_ft, vu, bar_l, nl, nt, bar_top, mu_top=None):
+    """
+    design_batch with the flexural steel designed instead of given: As_flexure from mu
+    feeds req_bottom and, when mu_top is given, As_top replaces the user's top bars in
+    req_top. Returns a dict keyed by BEAM_DESIGN_KEYS. req_* follow design_batch (NaN
+    unless the torsion design ran); As_flexure / As_top are reported for every row, and
+    a face whose flexure exceeds the section has NaN req_* and no bar count.
+    """
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in (b, h, fc, fy, fyt, mu, tu_ft, vu)])
+    b, h, fc, fy, fyt, mu, tu_ft, vu = arrays
+    n = b.shape[0]
+    codes = section_codes(section_type, n)
+    tf = np.full(n, np.nan) if tf is None else np.broadcast_to(np.asarray(tf, dtype=float), (n,))
+    bar_l, nl, nt, bar_top = [np.broadcast_to(np.asarray(v).astype(np.int64), (n,)) for v in (bar_l, nl, nt, bar_top)]
+    if mu_top is not None:
+        mu_top = np.broadcast_to(np.asarray(mu_top, dtype=float), (n,))
+
+    terms = section_terms(codes, b, h, tf, fc, fy, fyt)
+    flex = flexural_rows(terms, mu, mu_top)
+    As_top = None if mu_top is None else np.nan_to_num(flex["As_top"])
+    results = design_rows(terms, tu_ft, vu, bar_l, nl, np.nan_to_num(flex["As_flexure"]), nt, bar_top, As_top=As_top)
+    faces = [("req_bottom", "num_bottom_bars_needed", flex["As_flexure"])]
+    if mu_top is not None:
+        faces.append(("req_top", "num_top_bars_needed", flex["As_top"]))
+    for req, count, As in faces:
+        failed = np.isnan(As)
+        results[req] = np.where(failed, np.nan, results[req])
+        results[count] = np.where(failed, 0, results[count])
+    results.update(flex)
+    return results
+
+def design_beam_frame(df):
+    """
+    DataFrame front-end for design_beam_batch: design_batch_frame's columns with mu
+    (kip-ft) in place of As_flexure, plus an optional mu_top. Returns a DataFrame on
+    df's index.
+    """
+    missing = [c for c in ("section", "b", "h", "fc", "fy", "fyt", "mu", "tu", "vu", "bar_l", "nl", "nt", "bar_top")
+               if c not in df]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    tf = df["tf"].to_numpy(dtype=float) if "tf" in df else None
+    mu_top = df["mu_top"].to_numpy(dtype=float) if "mu_top" in df else None
+    out = design_beam_batch(df["section"].to_numpy(), df["b"].to_numpy(), df["h"].to_numpy(), tf,
+                            df["fc"].to_numpy(), df["fy"].to_numpy(), df["fyt"].to_numpy(), df["mu"].to_numpy(),
+                            df["tu"].to_numpy(), df["vu"].to_numpy(), df["bar_l"].to_numpy(), df["nl"].to_numpy(),
+                            df["nt"].to_numpy(), df["bar_top"].to_numpy(), mu_top=mu_top)
+    return columns_frame(out, index=df.index, keys=BEAM_DESIGN_KEYS)
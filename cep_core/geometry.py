@@ -0,0 +1,56 @@
+"""Gross and hollow section geometry for rectangular, T and L beams."""
+from .records import SectionGeometry
+
+# ---------------------------
+# Section geometry helpers
+# (explicit version + duplicate)
+# ---------------------------
+def compute_section_geometry(entries_b, entries_h, section_type, entries_tf=None):
+    cover = 0.75
+    b = float(entries_b)
+    h = float(entries_h)
+    if section_type == "T Section":
+        tf = float(entries_tf)
+        bf = b + 2 * min(4 * tf, h - tf)
+        Acp = b * h + (bf - b) * tf
+        Pcp = 2 * h + 2 * b + 2 * (bf - b)
+    elif section_type == "L Section":
+        tf = float(entries_tf)
+        bf = b + min(4 * tf, h - tf)
+        Acp = b * h + (bf - b) * tf
+        Pcp = 2 * h + 2 * b + 2 * (bf - b)
+    else:
+        Acp = h * b
+        Pcp = 2 * (h + b)
+
+    Aoh = max((b - 2 * cover - 0.25), 0) * max((h - 2 * cover - 0.25), 0)
+    Ph = 2 * max((b - 2 * cover - 0.25), 0) + 2 * max((h - 2 * cover - 0.25), 0)
+    Ao = 0.85 * Aoh
+
+    return SectionGeometry(
+        Acp=Acp, Pcp=Pcp, Aoh=Aoh, Ph=Ph, Ao=Ao,
+        b=b, h=h, cover=cover, bf=(bf if 'bf' in locals() else b), tf=(entries_tf if entries_tf is not None else 0.0)
+    )
+
+def compute_section_geometry_dup(entries_b, entries_h, section_type, entries_tf=None):
+    # duplicate of compute_section_geometry to mimic long Tk file structure
+    cover = 0.75
+    b = float(entries_b)
+    h = float(entries_h)
+    if section_type == "T Section":
+        tf = float(entries_tf)
+        bf = b + 2 * min(4 * tf, h - tf)
+        Acp = b * h + (bf - b) * tf
+        Pcp = 2 * h + 2 * b + 2 * (bf - b)
+    elif section_type == "L Section":
+        tf = float(entries_tf)
+        bf = b + min(4 * tf, h - tf)
+        Acp = b * h + (bf - b) * tf
+        Pcp = 2 * h + 2 * b + 2 * (bf - b)
+    else:
+        Acp = h * b
+        Pcp = 2 * (h + b)
+    Aoh = max((b - 2 * cover - 0.25), 0) * max((h - 2 * cover - 0.25), 0)
+    Ph = 2 * max((b - 2 * cover - 0.25), 0) + 2 * max((h - 2 * cover - 0.25), 0)
+    Ao = 0.85 * Aoh
+    return SectionGeometry(Acp=Acp, Pcp=Pcp, Aoh=Aoh, Ph=Ph, Ao=Ao, b=b, h=h, cover=cover, bf=(bf if 'bf' in locals() else b), tf=(entries_tf if entries_tf is not None else 0.0))
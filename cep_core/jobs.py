@@ -0,0 +1,180 @@
+"""
+Background report jobs.
+
+A JobQueue builds PDF reports on a small thread pool: submit() returns a Job at
+once, and the caller (a Streamlit script run, say) polls its progress by id
+instead of blocking until reportlab is done. Finished reports are kept in a
+byte-capped ResultCache under a content key, so submitting an unchanged report
+completes at once, and submitting a key that is still being built returns the
+running job.
+
+    jobs = JobQueue(workers=2)
+    key = content_key("schedule", "design", schedule_digest)
+    job = jobs.submit(key, lambda progress: build_pdf(progress), total=n_beams)
+    jobs.get(job.id).fraction
+    jobs.result(job.id)            # PDF bytes once job.status == DONE
+
+build(progress) returns the report bytes and may call progress(done) as it goes
+(report.write_batch_report takes progress= for this).
+"""
+import hashlib
+import numbers
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import ResultCache, canonical_value
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_JOBS = 1024
+
+def _key_part(value):
+    if hasattr(value, "keys"):  # dicts and records
+        return tuple(sorted((k, _key_part(value[k])) for k in value.keys()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_part(v) for v in value)
+    if isinstance(value, (bytes, bytearray)):
+        return hashlib.sha256(value).hexdigest()
+    if hasattr(value, "tolist") and hasattr(value, "dtype"):  # arrays; their repr elides long ones
+        return _key_part(value.tolist())
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        # repr spells 10, 10.0 and np.int64(10) differently
+        return float(canonical_value(value))
+    return value
+
+def content_key(*parts):
+    """
+    SHA-256 hex of parts, for submit(): mappings by sorted items, floats rounded as
+    in the result caches, bytes by their own digest.
+    """
+    return hashlib.sha256(repr(_key_part(parts)).encode()).hexdigest()
+
+class Job:
+    """One submitted report; the queue updates it, callers only read it."""
+    __slots__ = ("id", "key", "label", "status", "done", "total", "error", "submitted", "finished")
+
+    def __init__(self, key, label="", total=None):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.label = label
+        self.status = QUEUED
+        self.done = 0
+        self.total = total
+        self.error = None
+        self.submitted = time.time()
+        self.finished = None
+
+    @property
+    def pending(self):
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def fraction(self):
+        """Progress in [0, 1]; 0 until done when the total is unknown."""
+        if self.status == DONE:
+            return 1.0
+        if not self.total:
+            return 0.0
+        return min(self.done / self.total, 1.0)
+
+    def describe(self):
+        if self.status == QUEUED:
+            return "Queued"
+        if self.status == RUNNING:
+            return f"{self.done:,} / {self.total:,} beam(s)" if self.total else f"{self.done:,} beam(s)"
+        if self.status == FAILED:
+            return f"Failed: {self.error}"
+        return f"Done in {self.finished - self.submitted:.1f} s"
+
+    def __repr__(self):
+        return f"Job({self.id!r}, {self.label!r}, {self.status}, {self.done}/{self.total})"
+
+class JobQueue:
+    """
+    Thread pool of report builds with a shared byte-capped result cache; see the
+    module docstring. At most max_jobs are remembered; the oldest finished ones
+    are forgotten first.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_bytes=DEFAULT_MAX_BYTES, max_jobs=DEFAULT_MAX_JOBS):
+        self.cache = ResultCache("reports", maxsize=max_bytes, getsizeof=len)
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cep-report")
+        self._jobs = OrderedDict()
+        self._building = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, build, total=None, label=""):
+        """Queue build(progress) under key; returns the Job (already DONE on a cache hit)."""
+        with self._lock:
+            job = self._building.get(key)
+            if job is not None:
+                return job
+            job = Job(key, label, total)
+            self._remember(job)
+            if self.cache.get(key) is not None:
+                job.done = total or 0
+                job.status = DONE
+                job.finished = time.time()
+                return job
+            self._building[key] = job
+        self._executor.submit(self._run, job, build)
+        return job
+
+    def _remember(self, job):
+        self._jobs[job.id] = job
+        if len(self._jobs) > self.max_jobs:
+            for job_id in [i for i, j in self._jobs.items() if not j.pending][:len(self._jobs) - self.max_jobs]:
+                del self._jobs[job_id]
+
+    def _run(self, job, build):
+        job.status = RUNNING
+
+        def progress(done):
+            job.done = done
+
+        try:
+            data = bytes(build(progress))
+            if not self.cache.put(job.key, data):
+                raise ValueError(f"report is larger than the report cache ({self.cache.maxsize:,} bytes)")
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.finished = time.time()
+            job.status = FAILED
+        else:
+            if job.total:
+                job.done = job.total
+            job.finished = time.time()
+            job.status = DONE
+        finally:
+            with self._lock:
+                self._building.pop(job.key, None)
+
+    def get(self, job_id):
+        """The Job with this id, or None if unknown (or forgotten)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def result(self, job_id):
+        """A finished job's PDF bytes; None while pending, after failure or once evicted."""
+        job = self.get(job_id)
+        if job is None or job.status != DONE:
+            return None
+        return self.cache.get(job.key)
+
+    def stats(self):
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {"jobs": counts, "cache": self.cache.stats()}
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
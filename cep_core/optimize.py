@@ -0,0 +1,206 @@
+"""
+Minimum-steel (or minimum-cost) design search.
+
+optimize_design sweeps a grid of b, h (and tf for T / L sections) for one set of
+loads and materials. Every geometry is first screened with the same Tth and
+demand <= capacity checks as design_* (batch.section_terms / torsion_steel, once
+per geometry); only geometries that need torsion steel and pass the capacity
+check go through design_rows, on those same terms. Bar sizes are then chosen per
+geometry, vectorized over the candidate bar lists:
+
+    stirrups     the bar whose spacing floor(min(2 Av / Ats, min(Ph/8, 12)) * 2) / 2
+                 is at least 4 in and gives the least hoop steel Av * Ph / s
+    bottom / top ceil(req / A_bar) bars of the size with the least area that fit in
+                 one layer across the web (clear spacing >= max(1 in, bar diameter));
+                 at least two bars (one per corner) when torsion steel is required
+
+Steel is counted per foot of span: longitudinal bars, the two mid bars from
+design_* and the hoops. Geometries below Tth need no torsion steel, so only their
+flexural bottom bars (and the user's top bars) are counted.
+
+    from cep_core.optimize import optimize_design
+    res = optimize_design("T Section", fc=4000, fy=60, fyt=60, tu=25, vu=40, As_flexure=1.2,
+                          b=range(8, 25), h=range(12, 41), tf=[3, 4, 5, 6])
+    res["best"], res["stats"]
+"""
+import numpy as np
+
+from .bars import ASTM_BARS, get_catalog
+from .batch import SECTION_RECT, design_rows, section_codes, section_terms, torsion_steel
+
+STEEL_DENSITY = 0.2836  # lb / in^3
+COVER = 0.75
+MIN_CLEAR_SPACING = 1.0  # in
+# candidate bar diameters (in); for ASTM these are #5-#10, #4-#8 and #3-#5
+BOTTOM_BAR_RANGE = (0.625, 1.27)
+TOP_BAR_RANGE = (0.5, 1.0)
+STIRRUP_BAR_RANGE = (0.375, 0.625)
+BOTTOM_BAR_OPTIONS = ASTM_BARS.between(*BOTTOM_BAR_RANGE)
+TOP_BAR_OPTIONS = ASTM_BARS.between(*TOP_BAR_RANGE)
+STIRRUP_BAR_OPTIONS = ASTM_BARS.between(*STIRRUP_BAR_RANGE)
+OBJECTIVES = ("steel", "cost")
+
+OPTIMIZE_COLUMNS = ["b", "h", "tf", "safe", "bottom_bar", "num_bottom", "top_bar", "num_top", "mid_bar",
+                    "stirrup_bar", "stirrup_spacing", "As_long", "Av_s", "steel_volume", "steel_weight",
+                    "concrete_volume", "cost", "Tth", "demand", "capacity", "Al", "Ats"]
+
+def candidate_grid(section, b, h, tf=None):
+    """Flattened (b, h, tf) grid; tf is NaN for rectangular sections."""
+    b = np.asarray(list(b) if not np.isscalar(b) else [b], dtype=float)
+    h = np.asarray(list(h) if not np.isscalar(h) else [h], dtype=float)
+    if section_codes(section) == SECTION_RECT:
+        tf = np.array([np.nan])
+    elif tf is None:
+        raise ValueError("T and L sections need flange thickness (tf) candidates.")
+    else:
+        tf = np.asarray(list(tf) if not np.isscalar(tf) else [tf], dtype=float)
+    B, H, TF = np.meshgrid(b, h, tf, indexing="ij")
+    return B.ravel(), H.ravel(), TF.ravel()
+
+def screen(code, b, h, tf, fc, fy, fyt, tu_ft, vu):
+    """
+    The checks design_* makes before designing, over arrays of geometries. Returns
+    (valid, terms, steel): valid needs d > 0 and, for T / L sections, a flange thinner
+    than the overall depth; terms (batch.section_terms) and steel (batch.torsion_steel,
+    with safe and demand) have one row per valid geometry, in grid order.
+    """
+    valid = (h - 2.5 > 0) & (np.isnan(tf) | (tf < h))
+    idx = np.flatnonzero(valid)
+    fc, fy, fyt = (np.full(len(idx), float(v)) for v in (fc, fy, fyt))
+    terms = section_terms(section_codes(code, len(idx)), b[idx], h[idx], tf[idx], fc, fy, fyt)
+    return valid, terms, torsion_steel(terms, tu_ft, vu)
+
+def _pick_stirrups(Ph, Ats, bars, catalog=ASTM_BARS):
+    """(bar, spacing, Av/s) with the least hoop steel per geometry; bar 0 where none fits."""
+    Av = catalog.areas_of(bars)
+    limit = np.minimum(Ph / 8, 12.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_raw = (2 * Av[None, :]) / Ats[:, None]
+        spacing = np.floor(np.minimum(s_raw, limit[:, None]) * 2) / 2
+        av_s = np.where(spacing >= 4, Av[None, :] / spacing, np.inf)
+    best = av_s.argmin(axis=1)
+    rows = np.arange(len(Ph))
+    ok = np.isfinite(av_s[rows, best])
+    return (np.where(ok, bars[best], 0), np.where(ok, spacing[rows, best], np.nan),
+            np.where(ok, av_s[rows, best], np.inf))
+
+def _pick_bars(req, width, stirrup_dia, bars, min_count, catalog=ASTM_BARS):
+    """(bar, count, area) of the least-area single layer per geometry; bar 0 where none fits."""
+    area = catalog.areas_of(bars)
+    dia = catalog.diameters_of(bars)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        count = np.maximum(np.ceil(req[:, None] / area[None, :]), min_count[:, None])
+        room = width[:, None] - 2 * COVER - 2 * stirrup_dia[:, None] - count * dia[None, :]
+        clear = np.where(count > 1, room / (count - 1), room)
+    fits = (count == 0) | (clear >= np.maximum(MIN_CLEAR_SPACING, dia[None, :]))
+    provided = np.where(fits, count * area[None, :], np.inf)
+    best = provided.argmin(axis=1)
+    rows = np.arange(len(req))
+    ok = np.isfinite(provided[rows, best])
+    return (np.where(ok, bars[best], 0), np.where(ok, count[rows, best], 0).astype(np.int64),
+            np.where(ok, provided[rows, best], np.inf))
+
+def optimize_design(section, fc, fy, fyt, tu, vu, As_flexure, b, h, tf=None, nt=0, bar_top=6,
+                    bottom_bars=None, top_bars=None, stirrup_bars=None,
+                    objective="steel", steel_price=1.0, concrete_price=0.0, keep=20, catalog=ASTM_BARS):
+    """
+    Cheapest passing design over a b x h (x tf) grid; loads and materials as for design_*.
+
+    objective "steel" ranks by steel volume (in^3 per ft of span); "cost" ranks by
+    steel_weight * steel_price + concrete_volume * concrete_price ($ per ft, with
+    prices in $/lb and $/ft^3). Note that with steel alone the search favours the
+    largest section in the grid, since bigger sections need less torsion steel.
+
+    Bars are chosen from catalog (a RebarCatalog or its CATALOGS name, e.g. "EN");
+    the *_bars lists default to its bars within the *_BAR_RANGE diameters. The user's
+    top bars (nt x bar_top) and the mid bars from design_* stay ASTM bar numbers.
+
+    Returns {"best": dict or None, "candidates": DataFrame of the `keep` best designs
+    (OPTIMIZE_COLUMNS), "stats": candidate / pruning counts}.
+    """
+    import pandas as pd
+
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {', '.join(OBJECTIVES)}")
+    code = int(section_codes(section))
+    if isinstance(catalog, str):
+        catalog = get_catalog(catalog)
+    bottom_bars, top_bars, stirrup_bars = (np.asarray(catalog.between(*rng) if v is None else v, dtype=np.int64)
+                                           for v, rng in ((bottom_bars, BOTTOM_BAR_RANGE), (top_bars, TOP_BAR_RANGE),
+                                                          (stirrup_bars, STIRRUP_BAR_RANGE)))
+    B, H, TF = candidate_grid(section, b, h, tf)
+    n = len(B)
+    # from here on arrays are per valid geometry (terms rows); grid maps them back to B, H, TF
+    valid, terms, steel = screen(code, B, H, TF, fc, fy, fyt, tu, vu)
+    grid = np.flatnonzero(valid)
+    m = len(grid)
+    safe = steel["safe"]
+    within = steel["demand"] <= terms["capacity"]
+    designed_rows = ~safe & within
+
+    # full design only for the geometries that need torsion steel and pass the capacity check
+    Al = np.zeros(m); Ats = np.zeros(m); area_mid = np.zeros(m); mid_bar = np.zeros(m, dtype=np.int64)
+    req_bottom = np.full(m, float(As_flexure))
+    top_user = nt * ASTM_BARS.area(int(bar_top)) if (nt > 0 and bar_top > 0) else 0.0
+    req_top = np.full(m, top_user)
+    idx = np.flatnonzero(designed_rows)
+    if len(idx):
+        k = len(idx)
+        res = design_rows({key: v[idx] for key, v in terms.items()}, tu, vu, np.full(k, 8), np.zeros(k, dtype=np.int64),
+                          As_flexure, np.full(k, nt), np.full(k, bar_top))
+        Al[idx] = res["Al"]; Ats[idx] = res["Ats"]; area_mid[idx] = res["area_mid"]; mid_bar[idx] = res["mid_bar"]
+        req_bottom[idx] = res["req_bottom"]; req_top[idx] = res["req_top"]
+
+    rows = np.flatnonzero(safe | within)
+    Ph = terms["Ph"][rows]
+    torsion = designed_rows[rows]
+    stirrup_bar, stirrup_spacing, av_s = _pick_stirrups(Ph, Ats[rows], stirrup_bars, catalog)
+    stirrup_bar = np.where(torsion, stirrup_bar, 0)
+    stirrup_spacing = np.where(torsion, stirrup_spacing, np.nan)
+    av_s = np.where(torsion, av_s, 0.0)
+    # bars sit inside the stirrups; screened-out-by-Tth beams still get ties of the smallest stirrup size
+    stirrup_dia = np.where(stirrup_bar > 0, catalog.diameters_of(stirrup_bar), catalog.diameters[0])
+    min_count = np.where(torsion, 2, 0)
+    width = B[grid[rows]]
+    bottom_bar, num_bottom, bottom_area = _pick_bars(req_bottom[rows], width, stirrup_dia, bottom_bars,
+                                                     np.maximum(min_count, 2), catalog)
+    top_bar, num_top, top_area = _pick_bars(req_top[rows], width, stirrup_dia, top_bars, min_count, catalog)
+    top_bar = np.where(num_top > 0, top_bar, 0)
+    ok = np.isfinite(av_s) & np.isfinite(bottom_area) & np.isfinite(top_area)
+
+    As_long = bottom_area + top_area + area_mid[rows]
+    steel_volume = 12 * (As_long + av_s * Ph)
+    steel_weight = steel_volume * STEEL_DENSITY
+    concrete_volume = terms["Acp"][rows] * 12 / 1728
+    cost = steel_weight * steel_price + concrete_volume * concrete_price
+    score = steel_volume if objective == "steel" else cost
+    # ties go to the smaller section
+    order = np.lexsort((width, H[grid[rows]], concrete_volume, np.where(ok, score, np.inf)))
+    order = order[ok[order]][:keep]
+
+    sel = rows[order]
+    at = grid[sel]
+    frame = pd.DataFrame({
+        "b": B[at], "h": H[at], "tf": np.nan_to_num(TF[at]), "safe": safe[sel],
+        "bottom_bar": bottom_bar[order], "num_bottom": num_bottom[order],
+        "top_bar": top_bar[order], "num_top": num_top[order], "mid_bar": mid_bar[sel],
+        "stirrup_bar": stirrup_bar[order], "stirrup_spacing": stirrup_spacing[order],
+        "As_long": As_long[order], "Av_s": av_s[order], "steel_volume": steel_volume[order],
+        "steel_weight": steel_weight[order], "concrete_volume": concrete_volume[order], "cost": cost[order],
+        "Tth": terms["Tth"][sel], "demand": np.where(safe[sel], np.nan, steel["demand"][sel]),
+        "capacity": np.where(safe[sel], np.nan, terms["capacity"][sel]), "Al": Al[sel], "Ats": Ats[sel],
+    }, columns=OPTIMIZE_COLUMNS)
+    stats = {
+        "candidates": n,
+        # bar layouts of the screened geometries; those below Tth have no stirrups to choose
+        "layouts": int(len(bottom_bars) * len(top_bars)
+                       * (np.count_nonzero(torsion) * len(stirrup_bars) + np.count_nonzero(~torsion))),
+        "pruned_geometry": int(np.count_nonzero(~valid)),
+        "pruned_capacity": int(np.count_nonzero(~safe & ~within)),
+        "safe": int(np.count_nonzero(safe)),
+        "designed": int(len(idx)),
+        "no_layout": int(np.count_nonzero(~ok)),
+        "feasible": int(np.count_nonzero(ok)),
+    }
+    best = frame.iloc[0].to_dict() if len(frame) else None
+    return {"best": best, "candidates": frame, "stats": stats, "catalog": catalog.name}
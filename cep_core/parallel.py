@@ -0,0 +1,176 @@
+"""
+Process-pool execution for large beam schedules.
+
+The parent process reads the schedule in chunks and hands each chunk to a worker.
+Workers run the batch design, write their own part file (part-00000.parquet, ...)
+and, optionally, render per-beam PNG drawings and PDF reports. Parts are named by
+chunk index, so the output order never depends on which worker finished first.
+"""
+import os
+import re
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .schedule import (DEFAULT_CHUNKSIZE, ScheduleWriter, beam_records, compute_chunk, file_format,
+                       iter_schedule_chunks, output_frame, summarize_chunk)
+
+def default_workers():
+    return os.cpu_count() or 1
+
+def part_path(parts_dir, index, fmt):
+    return os.path.join(parts_dir, f"part-{index:05d}.{fmt}")
+
+def _safe_name(value):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(value)) or "beam"
+
+def render_beam_artifacts(chunk, results, mode, first_row, drawings_dir=None, reports_dir=None, id_column="beam_id"):
+    """Write <beam id>.png and/or <beam id>.pdf for every row of a computed chunk."""
+    from .drawing import layout_args
+    from .figures import render_section_png
+    from .report import build_pdf_report
+    from .scene import section_scene
+
+    ids = chunk[id_column].tolist() if id_column in chunk else range(first_row, first_row + len(chunk))
+    ui_mode = mode.capitalize()
+    for beam_id, (inputs, merged) in zip(ids, beam_records(chunk, results, mode)):
+        draw_args = layout_args(merged, inputs, ui_mode)
+        name = _safe_name(beam_id)
+        if drawings_dir:
+            # repeated beams (same section, bars and stirrups) reuse the worker's cached PNG
+            _, png = render_section_png(inputs["section"], merged["b"], merged["h"], merged["tf"], **draw_args)
+            with open(os.path.join(drawings_dir, f"{name}.png"), "wb") as fh:
+                fh.write(png)
+        if reports_dir:
+            # reports draw the section as vector graphics; no PNG round-trip
+            scene = section_scene(inputs["section"], merged["b"], merged["h"], merged["tf"], **draw_args)
+            pdf = build_pdf_report(ui_mode, inputs["section"], inputs, merged, scene=scene)
+            with open(os.path.join(reports_dir, f"{name}.pdf"), "wb") as fh:
+                fh.write(pdf.getbuffer())
+
+def schedule_report_records(input_path, mode="design", chunksize=DEFAULT_CHUNKSIZE, input_format=None,
+                            id_column="beam_id"):
+    """
+    Yield (inputs, merged, scene) per beam of a schedule for report.write_batch_report,
+    one chunk at a time; inputs carries the beam's id as "beam_id".
+    """
+    from .drawing import layout_args
+    from .scene import section_scene
+
+    ui_mode = mode.capitalize()
+    first_row = 0
+    for chunk in iter_schedule_chunks(input_path, chunksize, input_format):
+        results = compute_chunk(chunk, mode)
+        ids = chunk[id_column].tolist() if id_column in chunk else range(first_row, first_row + len(chunk))
+        for beam_id, (inputs, merged) in zip(ids, beam_records(chunk, results, mode)):
+            inputs["beam_id"] = beam_id
+            scene = section_scene(inputs["section"], merged["b"], merged["h"], merged["tf"],
+                                  **layout_args(merged, inputs, ui_mode))
+            yield inputs, merged, scene
+        first_row += len(chunk)
+
+def write_schedule_report(input_path, report_path, mode="design", chunksize=DEFAULT_CHUNKSIZE, input_format=None,
+                          id_column="beam_id", progress=None):
+    """
+    One multi-beam PDF (pages per beam plus a summary index) for a whole schedule.
+    input_path / report_path may also be binary streams; progress as for write_batch_report.
+    """
+    from .report import write_batch_report
+
+    records = schedule_report_records(input_path, mode, chunksize, input_format, id_column)
+    return write_batch_report(records, report_path, mode.capitalize(), progress=progress)
+
+def process_chunk(index, chunk, first_row, mode, parts_dir, fmt, drawings_dir=None, reports_dir=None, id_column="beam_id"):
+    """Worker entry point: compute one chunk, write its part file, render artifacts."""
+    try:
+        results = compute_chunk(chunk, mode)
+    except ValueError as e:
+        raise ValueError(f"Rows {first_row}-{first_row + len(chunk) - 1}: {e}") from e
+    out = output_frame(chunk, results, mode)
+    path = part_path(parts_dir, index, fmt)
+    with ScheduleWriter(path, fmt) as writer:
+        writer.write(out)
+    if drawings_dir or reports_dir:
+        render_beam_artifacts(chunk, results, mode, first_row, drawings_dir, reports_dir, id_column)
+    return index, summarize_chunk(out, {"rows": 0, "chunks": 0, "safe": 0, "demand_exceeds_capacity": 0})
+
+def merge_parts(parts, output_path, fmt):
+    """Concatenate part files, in the given order, into one CSV/Parquet file."""
+    if fmt == "csv":
+        with open(output_path, "wb") as dst:
+            for i, part in enumerate(parts):
+                with open(part, "rb") as src:
+                    header = src.readline()
+                    if i == 0:
+                        dst.write(header)
+                    shutil.copyfileobj(src, dst)
+    else:
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for part in parts:
+                pf = pq.ParquetFile(part)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, pf.schema_arrow)
+                for batch in pf.iter_batches():
+                    writer.write_batch(batch.cast(writer.schema) if batch.schema != writer.schema else batch)
+        finally:
+            if writer is not None:
+                writer.close()
+
+def run_schedule_parallel(input_path, output_path, mode="design", chunksize=DEFAULT_CHUNKSIZE, workers=None,
+                          input_format=None, output_format=None, drawings_dir=None, reports_dir=None,
+                          id_column="beam_id", keep_parts=False):
+    """
+    Process-pool version of run_schedule.
+
+    output_path is either a results file (.csv / .parquet; parts go to <output>.parts/
+    and are merged in chunk order, then removed unless keep_parts) or a directory that
+    receives the part files only. At most 2 * workers chunks are in flight, so memory
+    stays bounded by chunksize. Returns the same summary dict as run_schedule.
+    """
+    workers = workers or default_workers()
+    to_dir = os.path.isdir(output_path) or not os.path.splitext(str(output_path))[1]
+    if to_dir:
+        fmt = (output_format or "parquet").lower()
+        parts_dir = output_path
+    else:
+        fmt = file_format(output_path, output_format)
+        parts_dir = f"{output_path}.parts"
+    os.makedirs(parts_dir, exist_ok=True)
+    for d in (drawings_dir, reports_dir):
+        if d:
+            os.makedirs(d, exist_ok=True)
+
+    summary = {"rows": 0, "chunks": 0, "safe": 0, "demand_exceeds_capacity": 0}
+    n_parts = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        first_row = 0
+        try:
+            for index, chunk in enumerate(iter_schedule_chunks(input_path, chunksize, input_format)):
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        _, part_summary = fut.result()
+                        for k, v in part_summary.items():
+                            summary[k] = summary.get(k, 0) + v
+                pending.add(pool.submit(process_chunk, index, chunk, first_row, mode, parts_dir, fmt,
+                                        drawings_dir, reports_dir, id_column))
+                first_row += len(chunk)
+                n_parts = index + 1
+            for fut in pending:
+                _, part_summary = fut.result()
+                for k, v in part_summary.items():
+                    summary[k] = summary.get(k, 0) + v
+        except BaseException:
+            for fut in pending:
+                fut.cancel()
+            raise
+
+    if not to_dir:
+        parts = [part_path(parts_dir, i, fmt) for i in range(n_parts)]
+        merge_parts(parts, output_path, fmt)
+        if not keep_parts:
+            shutil.rmtree(parts_dir)
+    return summary
@@ -0,0 +1,20 @@
+"""Input parsing helpers shared by the UI and batch front-ends."""
+
+# ---------------------------
+# Safe parsing utilities (expanded)
+# ---------------------------
+def safe_float(value, name="value", default=None):
+    try:
+        if value is None:
+            return default
+        return float(value)
+    except Exception as e:
+        raise ValueError(f"Invalid input for {name}: {e}")
+
+def safe_int(value, name="value", default=0):
+    try:
+        if value is None or value == "":
+            return default
+        return int(float(value))
+    except Exception as e:
+        raise ValueError(f"Invalid integer input for {name}: {e}")
@@ -0,0 +1,149 @@
+"""
+Typed beam input / result records and zero-copy columnar conversion.
+
+BeamInput, SectionGeometry and BeamResult are __slots__ classes: a fixed set of
+fields, no per-instance __dict__. They are also mutable mappings over the fields
+that have been set, so code written against the old dicts keeps working
+(merged["Al"], "safe" in merged, merged.get("stirrup_bar"), {**vals, **out}).
+A field that was never set is absent, exactly like a key the scalar functions
+did not return; None is an ordinary value (BeamInput.tf is None for rectangles).
+
+Batch results stay columnar (dicts of NumPy arrays); columns_frame and
+columns_table wrap those arrays as pandas / Arrow columns without copying.
+"""
+from collections.abc import MutableMapping
+
+GEOMETRY_FIELDS = ("Acp", "Pcp", "Aoh", "Ph", "Ao", "b", "h", "cover", "bf", "tf")
+RESULT_FIELDS = ("safe", "phiTcr", "Tth", "demand", "Vc", "phiVc", "capacity", "demand_exceeds_capacity",
+                 "Almin_governs", "Al", "Vn", "Vs", "Ats", "Atsmin", "stirrup_bar", "stirrup_spacing",
+                 "req_bottom", "req_mid", "req_top", "num_bottom_bars_needed", "num_top_bars_needed",
+                 "mid_bar", "area_mid", "provided_bottom_by_user", "provided_top_by_user", "b_total", "x")
+INPUT_FIELDS = ("beam_id", "section", "mode", "b", "h", "tf", "fc", "fy", "fyt", "tu", "vu",
+                "bar_l", "nl", "nt", "bar_top", "As_flexure")
+
+class Record(MutableMapping):
+    """Slotted record with mapping access over its set fields (in FIELDS order)."""
+    __slots__ = ()
+    FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, other=(), **values):
+        if other:
+            self.update(other)
+        try:
+            for key, value in values.items():
+                setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}") from None
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        # no __dict__: only slots can be set (methods and class attributes are read-only)
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}") from None
+
+    def update(self, other=(), **values):
+        # same semantics as MutableMapping.update, without the per-key ABC dispatch
+        if not other:
+            items = ()
+        elif isinstance(other, Record):
+            items = ((name, getattr(other, name)) for name in other.FIELDS if hasattr(other, name))
+        elif hasattr(other, "keys"):
+            items = ((key, other[key]) for key in other.keys())
+        else:
+            items = other
+        try:
+            for key, value in items:
+                setattr(self, key, value)
+            for key, value in values.items():
+                setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}") from None
+
+    def __delitem__(self, key):
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self._FIELD_SET and hasattr(self, key)
+
+    def __iter__(self):
+        return (name for name in self.FIELDS if hasattr(self, name))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    def copy(self):
+        return type(self)(self)
+
+    def to_dict(self):
+        return dict(self.items())
+
+class BeamInput(Record):
+    """One beam's inputs, keyed like the UI's last_inputs."""
+    __slots__ = INPUT_FIELDS
+    FIELDS = INPUT_FIELDS
+
+class SectionGeometry(Record):
+    """compute_section_geometry output."""
+    __slots__ = GEOMETRY_FIELDS
+    FIELDS = GEOMETRY_FIELDS
+
+class BeamResult(Record):
+    """analysis_* / design_* output, or the UI's merged geometry + results record."""
+    __slots__ = GEOMETRY_FIELDS + RESULT_FIELDS
+    FIELDS = GEOMETRY_FIELDS + RESULT_FIELDS
+
+def merge_results(geometry, results):
+    """The UI's {**geometry, **results} as one BeamResult (results win on shared fields)."""
+    merged = BeamResult(geometry)
+    merged.update(results)
+    return merged
+
+# ---------------------------
+# Columnar conversion
+# ---------------------------
+def columns_frame(columns, index=None, keys=None):
+    """DataFrame over a dict of 1-D arrays (e.g. design_batch output); the arrays are not copied."""
+    import pandas as pd
+
+    keys = list(columns) if keys is None else keys
+    return pd.DataFrame({k: columns[k] for k in keys}, index=index, copy=False)
+
+def columns_table(columns, keys=None):
+    """
+    pyarrow Table over a dict of 1-D arrays. Numeric columns wrap the NumPy buffers
+    without copying (NaN stays a value, not a null); bool columns are bit-packed by
+    Arrow and so are copied.
+    """
+    import pyarrow as pa
+
+    keys = list(columns) if keys is None else keys
+    return pa.table({k: pa.array(columns[k]) for k in keys})
+
+def records_frame(records, fields=None):
+    """DataFrame with one row per record, built column by column; unset fields are NaN / None."""
+    import pandas as pd
+
+    records = list(records)
+    if fields is None:
+        fields = [f for f in (type(records[0]).FIELDS if records else ()) if any(f in r for r in records)]
+    return pd.DataFrame({f: [getattr(r, f, None) for r in records] for f in fields}, columns=list(fields))
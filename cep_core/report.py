@@ -0,0 +1,389 @@
+"""Professional PDF calculation report (reportlab)."""
+import io
+
+from PIL import Image
+from reportlab.pdfgen import canvas as pdf_canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+
+from .bars import ASTM_BARS
+from .tables import calculation_rows, format_value, inputs_table
+from .vector import draw_scene_on_canvas
+
+def build_pdf_report(mode, section, inputs, merged, figure_bytes=None, scene=None):
+    """
+    Build the single-beam report: inputs table, step-by-step calculations table and
+    the cross-section drawing. inputs is a BeamInput (or dict with the UI's last_inputs
+    keys); merged is the geometry + results BeamResult (or dict). The drawing is drawn as vector graphics from scene
+    (see scene.py) when given, else embedded from PNG figure_bytes. Returns a BytesIO at 0.
+    """
+    report_buf = io.BytesIO()
+    # create pdf
+    c = pdf_canvas.Canvas(report_buf, pagesize=A4)
+    draw_beam_pages(c, mode, section, inputs, merged, figure_bytes, scene)
+    c.save()
+    report_buf.seek(0)
+    return report_buf
+
+def draw_beam_pages(c, mode, section, inputs, merged, figure_bytes=None, scene=None,
+                    title="CEP — Professional Calculation Report"):
+    """Draw one beam's report pages on canvas c (see build_pdf_report), ending with showPage."""
+    width, height = A4
+    margin = 40
+
+    # Header
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(margin, height - margin, title)
+    c.setFont("Helvetica", 10)
+    c.drawString(margin, height - margin - 18, f"Mode: {mode}    Section: {section}")
+
+    # Inputs block -> draw as a sorted table (S.No | Parameter (description) | Symbol | Value | Units)
+    y = height - margin - 48
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(margin, y, "1) Inputs & Material")
+    y -= 18
+    c.setFont("Helvetica", 9)
+
+    # Table layout for inputs
+    c.setFont("Helvetica-Bold", 10)
+    ix_sno = margin + 8
+    ix_param = margin + 40
+    ix_symbol = margin + 260
+    ix_value = margin + 360
+    ix_units = margin + 460
+    table_left_i = margin + 4
+    table_right_i = ix_units + 80
+    table_width_i = table_right_i - table_left_i
+    header_h = 16
+    row_h = 14
+
+    # header
+    c.setFillColorRGB(0.9,0.9,0.9)
+    c.rect(table_left_i, y - header_h, table_width_i, header_h, fill=1, stroke=0)
+    c.setFillColorRGB(0,0,0)
+    c.drawString(ix_sno, y - header_h + 3, "S.No")
+    c.drawString(ix_param, y - header_h + 3, "Parameter (description)")
+    c.drawString(ix_symbol, y - header_h + 3, "Symbol")
+    c.drawString(ix_value, y - header_h + 3, "Value")
+    c.drawString(ix_units, y - header_h + 3, "Units")
+    y_cursor_i = y - header_h - 4
+    c.setFont("Helvetica", 9)
+    sno_i = 1
+    for item in inputs_table(inputs):
+        if y_cursor_i < margin + 80:
+            # draw border and new page
+            c.rect(table_left_i, y_cursor_i + row_h + 4, table_width_i, (y - header_h) - (y_cursor_i + row_h + 4), fill=0, stroke=1)
+            c.showPage()
+            y = height - margin
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(margin, y, "1) Inputs & Material (continued)")
+            y -= 18
+            # redraw header
+            c.setFont("Helvetica-Bold", 10)
+            c.setFillColorRGB(0.9,0.9,0.9)
+            c.rect(table_left_i, y - header_h, table_width_i, header_h, fill=1, stroke=0)
+            c.setFillColorRGB(0,0,0)
+            c.drawString(ix_sno, y - header_h + 3, "S.No")
+            c.drawString(ix_param, y - header_h + 3, "Parameter (description)")
+            c.drawString(ix_symbol, y - header_h + 3, "Symbol")
+            c.drawString(ix_value, y - header_h + 3, "Value")
+            c.drawString(ix_units, y - header_h + 3, "Units")
+            c.setFont("Helvetica", 9)
+            y_cursor_i = y - header_h - 4
+            sno_i = 1
+
+        # alternate background
+        if sno_i % 2 == 0:
+            c.setFillColorRGB(0.98,0.98,0.98)
+            c.rect(table_left_i, y_cursor_i - row_h + 2, table_width_i, row_h, fill=1, stroke=0)
+            c.setFillColorRGB(0,0,0)
+
+        # draw row
+        desc, sym, units, val = item
+        val_str = format_value(val)
+        c.drawString(ix_sno, y_cursor_i - row_h + 4, str(sno_i))
+        c.drawString(ix_param, y_cursor_i - row_h + 4, desc)
+        c.drawString(ix_symbol, y_cursor_i - row_h + 4, sym)
+        c.drawString(ix_value, y_cursor_i - row_h + 4, val_str)
+        c.drawString(ix_units, y_cursor_i - row_h + 4, units)
+        # horizontal line
+        c.setLineWidth(0.5)
+        c.line(table_left_i, y_cursor_i - row_h + 2, table_right_i, y_cursor_i - row_h + 2)
+        y_cursor_i -= row_h + 2
+        sno_i += 1
+
+    # outer border for inputs table
+    table_bottom_i = y_cursor_i + row_h + 6
+    if table_bottom_i < margin:
+        table_bottom_i = margin + 8
+    c.setLineWidth(1)
+    c.rect(table_left_i, table_bottom_i, table_width_i, (y - header_h) - table_bottom_i, fill=0, stroke=1)
+
+    # Move y pointer to after inputs table for calculations title
+    y = table_bottom_i - 18
+
+    # Calculations block -> only include keys actually present in merged (sorted)
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(margin, y, "2) Calculations & Results (step-by-step)")
+    y -= 18
+    c.setFont("Helvetica", 9)
+    if not merged:
+        c.drawString(margin + 8, y, "No calculation available. Run calculation first to include detailed steps.")
+        y -= 14
+    else:
+        # Table headings and layout calculations (for bordered table)
+        c.setFont("Helvetica-Bold", 10)
+        x_sno = margin + 8
+        x_param = margin + 40
+        x_symbol = margin + 300
+        x_units = margin + 380
+        x_value = margin + 450
+
+        table_left = margin + 4
+        table_right = x_value + 90
+        table_width = table_right - table_left
+        header_height = 18
+        row_height = 14
+        table_top = y
+        # header
+        c.setLineWidth(1)
+        c.setFillColorRGB(0.9,0.9,0.9)
+        c.rect(table_left, table_top - header_height, table_width, header_height, fill=1, stroke=0)
+        c.setFillColorRGB(0,0,0)
+        c.drawString(x_sno, table_top - header_height + 4, "S.No")
+        c.drawString(x_param, table_top - header_height + 4, "Parameter (description)")
+        c.drawString(x_symbol, table_top - header_height + 4, "Symbol")
+        c.drawString(x_units, table_top - header_height + 4, "Units")
+        c.drawString(x_value, table_top - header_height + 4, "Value")
+        y_cursor = table_top - header_height - 4
+        table_y_start = table_top - header_height
+        sno = 1
+        c.setFont("Helvetica", 9)
+
+        for desc, sym, units, val in calculation_rows(merged, inputs):
+            # page break if needed
+            if y_cursor < margin + 60:
+                # draw border and new page
+                table_bottom = y_cursor + row_height + 4
+                c.rect(table_left, table_bottom, table_width, table_y_start - table_bottom, fill=0, stroke=1)
+                c.showPage()
+                y = height - margin
+                c.setFont("Helvetica-Bold", 12)
+                c.drawString(margin, y, "2) Calculations & Results (continued)")
+                y -= 20
+                c.setFont("Helvetica", 9)
+                table_top = y
+                c.setFillColorRGB(0.9,0.9,0.9)
+                c.rect(table_left, table_top - header_height, table_width, header_height, fill=1, stroke=0)
+                c.setFillColorRGB(0,0,0)
+                c.setFont("Helvetica-Bold", 10)
+                c.drawString(x_sno, table_top - header_height + 4, "S.No")
+                c.drawString(x_param, table_top - header_height + 4, "Parameter (description)")
+                c.drawString(x_symbol, table_top - header_height + 4, "Symbol")
+                c.drawString(x_units, table_top - header_height + 4, "Units")
+                c.drawString(x_value, table_top - header_height + 4, "Value")
+                c.setFont("Helvetica", 9)
+                y_cursor = table_top - header_height - 4
+                table_y_start = table_top - header_height
+
+            val_str = format_value(val)
+
+            # alternate background
+            if sno % 2 == 0:
+                c.setFillColorRGB(0.98,0.98,0.98)
+                c.rect(table_left, y_cursor - row_height + 2, table_width, row_height, fill=1, stroke=0)
+                c.setFillColorRGB(0,0,0)
+
+            # draw text
+            c.drawString(x_sno, y_cursor - row_height + 6, str(sno))
+            # wrap param desc if needed (simple)
+            param_text = desc
+            max_param_chars = 36
+            if len(param_text) > max_param_chars:
+                first_part = param_text[:max_param_chars]
+                second_part = param_text[max_param_chars:]
+                c.drawString(x_param, y_cursor - row_height + 6, first_part)
+                c.drawString(x_param, y_cursor - row_height - 6, second_part)
+            else:
+                c.drawString(x_param, y_cursor - row_height + 6, param_text)
+            c.drawString(x_symbol, y_cursor - row_height + 6, sym)
+            c.drawString(x_units, y_cursor - row_height + 6, units)
+            c.drawString(x_value, y_cursor - row_height + 6, val_str)
+
+            c.setLineWidth(0.5)
+            c.line(table_left, y_cursor - row_height + 2, table_right, y_cursor - row_height + 2)
+            y_cursor -= row_height + 2
+            sno += 1
+
+        # outer border for calculations table
+        table_bottom = y_cursor + row_height + 6
+        if table_bottom < margin:
+            table_bottom = margin + 8
+        c.setLineWidth(1)
+        c.rect(table_left, table_bottom, table_width, table_y_start - table_bottom, fill=0, stroke=1)
+
+    # Add drawing if available
+    if scene is not None:
+        c.showPage()
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(margin, height - margin, "3) Cross-section Drawing")
+        max_h = height - 2 * margin - 40
+        draw_scene_on_canvas(c, scene, margin, height - margin - 20 - max_h, width - 2 * margin, max_h)
+    elif figure_bytes:
+        c.showPage()
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(margin, height - margin, "3) Cross-section Drawing")
+        img = Image.open(io.BytesIO(figure_bytes))
+        # scale image to page width minus margins
+        max_w = width - 2 * margin
+        max_h = height - 2 * margin - 40
+        img_w, img_h = img.size
+        scale = min(max_w / img_w, max_h / img_h, 1.0)
+        disp_w = img_w * scale
+        disp_h = img_h * scale
+        img_reader = ImageReader(img)
+        c.drawImage(img_reader, margin, height - margin - disp_h - 20, width=disp_w, height=disp_h)
+
+    c.showPage()
+
+# ---------------------------
+# Multi-beam report
+# ---------------------------
+INDEX_COLUMNS = [("No.", 0), ("Beam", 32), ("Section", 112), ("b x h (in)", 200), ("Tu (kip-ft)", 272),
+                 ("Stirrups", 330), ("Status", 400), ("Page", 485)]
+
+def beam_status(merged, mode="Design"):
+    """One-line outcome for the summary index, worded like the UI's messages."""
+    if not merged:
+        return "No calculation"
+    if merged.get("safe", False):
+        return "Safe (Tu < Tth)"
+    if merged.get("demand_exceeds_capacity", False):
+        return "Demand > capacity"
+    return "Designed" if mode == "Design" else "Torsion reinf. req."
+
+def _index_row(number, beam_id, section, inputs, merged, mode, page):
+    stirrups = ""
+    if merged.get("stirrup_bar"):
+        stirrups = f"{ASTM_BARS.label(merged['stirrup_bar'])} @ {merged['stirrup_spacing']:.1f} in"
+    return (str(number), str(beam_id), section.replace(" Section", ""),
+            f"{float(merged.get('b', inputs.get('b', 0))):g} x {float(merged.get('h', inputs.get('h', 0))):g}",
+            f"{float(inputs.get('tu') or 0):.2f}", stirrups, beam_status(merged, mode), str(page))
+
+class BatchReportWriter:
+    """
+    One PDF covering many beams: each add() draws that beam's report pages (as
+    build_pdf_report does) and close() appends the summary index, linked to every
+    beam's first page and mirrored in the PDF outline.
+
+    Beams are drawn as they arrive and their drawings are not kept, but memory still
+    grows with the beam count: reportlab holds every page until close() writes the
+    file, and the index rows are kept for it (about 50 KB per beam in all). Split very
+    large schedules over several reports.
+
+        with BatchReportWriter("submittal.pdf") as report:
+            for inputs, merged, scene in records:
+                report.add(inputs, merged, scene)
+    """
+
+    def __init__(self, out, mode="Design", title="CEP — Beam Torsion Calculation Report"):
+        self.mode = mode
+        self.title = title
+        self.c = pdf_canvas.Canvas(out, pagesize=A4, pageCompression=1)
+        self.c.setTitle(title)
+        self.c.addOutlineEntry("Summary index", "index", level=0)
+        self.index = []
+
+    def add(self, inputs, merged, drawing=None, beam_id=None, mode=None):
+        """
+        Draw one beam. drawing is a scene dict (vector), PNG bytes or None; beam_id
+        defaults to inputs["beam_id"], then the running number. Returns the first page.
+        """
+        mode = mode or self.mode
+        number = len(self.index) + 1
+        beam_id = beam_id if beam_id is not None else inputs.get("beam_id", number)
+        section = inputs.get("section", "")
+        page = self.c.getPageNumber()
+        key = f"beam-{number}"
+        self.c.bookmarkPage(key)
+        self.c.addOutlineEntry(f"{beam_id} ({section})", key, level=0)
+        scene = drawing if isinstance(drawing, dict) else None
+        figure_bytes = drawing if isinstance(drawing, (bytes, bytearray)) else None
+        draw_beam_pages(self.c, mode, section, inputs, merged, figure_bytes, scene,
+                        title=f"Beam {beam_id} — CEP Calculation Report")
+        self.index.append(_index_row(number, beam_id, section, inputs, merged, mode, page))
+        return page
+
+    def _index_header(self, y, margin):
+        c = self.c
+        c.setFillColorRGB(0.9, 0.9, 0.9)
+        c.rect(margin, y - 16, A4[0] - 2 * margin, 16, fill=1, stroke=0)
+        c.setFillColorRGB(0, 0, 0)
+        c.setFont("Helvetica-Bold", 9)
+        for label, dx in INDEX_COLUMNS:
+            c.drawString(margin + 4 + dx, y - 12, label)
+        c.setFont("Helvetica", 8)
+        return y - 16
+
+    def _write_index(self):
+        c = self.c
+        width, height = A4
+        margin = 40
+        row_h = 13
+        c.bookmarkPage("index")
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(margin, height - margin, self.title)
+        c.setFont("Helvetica", 10)
+        counts = {}
+        for row in self.index:
+            counts[row[6]] = counts.get(row[6], 0) + 1
+        totals = ", ".join(f"{status}: {n}" for status, n in counts.items())
+        c.drawString(margin, height - margin - 18, f"Summary index — {len(self.index)} beam(s)    {totals}")
+        y = self._index_header(height - margin - 36, margin)
+        for i, row in enumerate(self.index):
+            if y - row_h < margin:
+                c.showPage()
+                c.setFont("Helvetica-Bold", 12)
+                c.drawString(margin, height - margin, "Summary index (continued)")
+                y = self._index_header(height - margin - 12, margin)
+            if i % 2:
+                c.setFillColorRGB(0.98, 0.98, 0.98)
+                c.rect(margin, y - row_h, width - 2 * margin, row_h, fill=1, stroke=0)
+                c.setFillColorRGB(0, 0, 0)
+            for (_, dx), text in zip(INDEX_COLUMNS, row):
+                c.drawString(margin + 4 + dx, y - row_h + 4, text)
+            # whole row jumps to the beam's first page
+            c.linkRect("", f"beam-{row[0]}", (margin, y - row_h, width - margin, y), relative=0)
+            c.setLineWidth(0.3)
+            c.line(margin, y - row_h, width - margin, y - row_h)
+            y -= row_h
+        c.showPage()
+
+    def close(self):
+        """Write the summary index and finish the PDF."""
+        if self.c is None:
+            return
+        self._write_index()
+        self.c.save()
+        self.c = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_batch_report(records, out, mode="Design", title="CEP — Beam Torsion Calculation Report", progress=None):
+    """
+    Write a multi-beam report from an iterable of (inputs, merged, drawing) records
+    (see BatchReportWriter.add) to a path or binary stream; returns the beam count.
+    Records are consumed one at a time, so a generator avoids holding the inputs;
+    the PDF itself still grows in memory until it is written (see BatchReportWriter).
+    progress(beams_done) is called after each beam, if given.
+    """
+    with BatchReportWriter(out, mode, title) as report:
+        for inputs, merged, drawing in records:
+            report.add(inputs, merged, drawing)
+            if progress is not None:
+                progress(len(report.index))
+        return len(report.index)
@@ -0,0 +1,381 @@
+"""
+Backend-neutral cross-section geometry.
+
+The *_scene functions lay out a section (outline, hollow, bars, dimension and
+callout arrows) in drawing units (12 per inch) and return a scene dict:
+
+    {"figsize": (w, h), "xlim": (x0, x1), "ylim": (y0, y1), "items": [...]}
+
+Each item is a dict with a "kind" of box, circle, arrow, text, dimension or
+callout. drawing.py renders scenes with matplotlib; vector.py renders the same
+scenes to reportlab PDF primitives and SVG.
+"""
+from .bars import ASTM_BARS
+
+def new_scene(figsize):
+    return {"figsize": figsize, "xlim": (0, 1), "ylim": (0, 1), "items": []}
+
+def add_box(scene, x, y, w, h, edge='black', face='#ffffff', lw=1.0, rounded=False):
+    scene["items"].append({"kind": "box", "x": x, "y": y, "w": w, "h": h, "edge": edge, "face": face, "lw": lw,
+                           "rounded": rounded})
+
+def add_circle(scene, cx, cy, r, edge='black', face='#2B7ABF', zorder=5):
+    scene["items"].append({"kind": "circle", "cx": cx, "cy": cy, "r": r, "edge": edge, "face": face, "lw": 1.2,
+                           "zorder": zorder})
+
+def add_arrow(scene, x1, y1, x2, y2, style='<->', color='black', lw=1.0):
+    """Arrow from the tail (x2, y2) to the head (x1, y1), like ax.annotate(xy=head, xytext=tail)."""
+    scene["items"].append({"kind": "arrow", "x1": x1, "y1": y1, "x2": x2, "y2": y2, "style": style, "color": color,
+                           "lw": lw})
+
+def add_text(scene, x, y, text, size=9, ha='left', va='baseline', rot=0, color='black'):
+    scene["items"].append({"kind": "text", "x": x, "y": y, "text": text, "size": size, "ha": ha, "va": va, "rot": rot,
+                           "color": color})
+
+def add_dimension(scene, x1, y1, x2, y2, text, rot=0, txt_offset=(0,0)):
+    """Dimension arrow with its label centred on a small white box."""
+    scene["items"].append({"kind": "dimension", "x1": x1, "y1": y1, "x2": x2, "y2": y2, "text": text, "rot": rot,
+                           "txt_offset": txt_offset})
+
+def add_callout(scene, tail_x, tail_y, head_x, head_y, label, tail_offset=(6,-6)):
+    """Red reinforcement callout arrow with its label next to the tail."""
+    scene["items"].append({"kind": "callout", "tail_x": tail_x, "tail_y": tail_y, "head_x": head_x, "head_y": head_y,
+                           "label": label, "tail_offset": tail_offset})
+
+def rectangular_scene(b, h, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """
+    Improved rectangular section plotting while preserving original signature.
+    - Places top longitudinals inside flange-like inner area.
+    - Places 2 mid bars left/right (if mid_bar>0).
+    - Places bottom bars as dense row.
+    """
+    scene = new_scene((10,6))
+    scale = 12.0  # pixels per inch
+    width = b * scale
+    height = h * scale
+
+    # Outer thick border (same visual weight as before)
+    outer_thickness = 6
+    add_box(scene, 0, 0, width, height, edge='black', face='#e6e6e6', lw=outer_thickness, rounded=True)
+
+    # Inner clear area (respect cover and small margins so bars don't touch outer border)
+    cover = 0.75  # in
+    cover_px = cover * scale
+    margin_px = 10
+    inner_left = cover_px + margin_px
+    inner_right = width - cover_px - margin_px
+    inner_bottom = cover_px + margin_px
+    inner_top = height - cover_px - margin_px
+    inner_width = inner_right - inner_left
+    inner_height = inner_top - inner_bottom
+
+    # Draw inner rectangle (thin border) where bars sit
+    add_box(scene, inner_left, inner_bottom, inner_width, inner_height, edge='#333333', face='#ffffff', lw=3)
+
+    # draw cover annotation (as before)
+    cover_arrow_x1 = 2
+    add_arrow(scene, cover_arrow_x1, inner_top - inner_height/2, inner_left, inner_top - inner_height/2, style='<->', color='black', lw=1.2)
+    add_text(scene, (cover_arrow_x1 + inner_left)/2, inner_top - inner_height/2 + 8, f"cover = {cover:.2f} in", size=9, ha='center')
+
+    # circle radius for rebars
+    r_px = 10
+
+    # Top bars (distributed along inner width near top)
+    top_coords = []
+    if num_top > 0 and inner_width > 2*r_px:
+        if num_top > 1:
+            spacing_top = (inner_width - 2*r_px - 4) / (num_top - 1)
+        else:
+            spacing_top = 0
+        y_top = inner_top - r_px - 6
+        for i in range(num_top):
+            cx = inner_left + r_px + 2 + i * spacing_top
+            add_circle(scene, cx, y_top, r_px)
+            top_coords.append((cx, y_top))
+
+    # Mid bars: place left & right at mid-height but within clear zone not flange
+    y_mid = inner_bottom + inner_height / 2
+    mid_coords = []
+    if mid_bar and mid_bar > 0:
+        mid_left = (inner_left + r_px + 8, y_mid)
+        mid_right = (inner_right - r_px - 8, y_mid)
+        add_circle(scene, *mid_left, r_px)
+        add_circle(scene, *mid_right, r_px)
+        mid_coords = [mid_left, mid_right]
+
+    # Bottom bars: dense row along bottom
+    bottom_coords = []
+    if num_bottom > 0 and inner_width > 2*r_px:
+        if num_bottom > 1:
+            spacing_bottom = (inner_width - 2*r_px - 4) / (num_bottom - 1)
+        else:
+            spacing_bottom = 0
+        y_bottom = inner_bottom + r_px + 6
+        for i in range(num_bottom):
+            cx = inner_left + r_px + 2 + i * spacing_bottom
+            add_circle(scene, cx, y_bottom, r_px)
+            bottom_coords.append((cx, y_bottom))
+
+    # dimension arrows: b and h (kept similar)
+    add_dimension(scene, 0, height + 18, width, height + 18, f"b = {b:.2f} in")
+    add_dimension(scene, -48, 0, -48, height, f"h = {h:.2f} in", rot=90)
+
+    # labels & callouts (to right)
+    labels_x = width + 80
+    if top_coords:
+        tx, ty = top_coords[0]
+        add_callout(scene, labels_x, ty + 4, tx + r_px + 5, ty, f"{num_top} × #{6} (top)")
+    if mid_coords:
+        add_callout(scene, labels_x, y_mid + 2, mid_coords[1][0] + r_px + 5, y_mid, f"2 × #{mid_bar} (mid)")
+    if stirrup_bar and stirrup_bar > 0:
+        add_callout(scene, labels_x, y_mid - 30, inner_right + 5, y_mid - inner_height/6,
+                         f"{ASTM_BARS.label(stirrup_bar)} stirrups @ {stirrup_spacing:.2f} in c/c")
+    if bottom_coords:
+        bx, by = bottom_coords[0]
+        add_callout(scene, labels_x, by - 30, bx + r_px + 5, by, f"{num_bottom} × #{8} (bottom)")
+
+    # optionally show spacing between bottom bars
+    if show_bar_spacing and len(bottom_coords) > 1:
+        x_first = bottom_coords[0][0]
+        x_last = bottom_coords[-1][0]
+        spacing_in = (x_last - x_first) / (len(bottom_coords)-1) / scale if len(bottom_coords) > 1 else 0
+        add_dimension(scene, x_first, y_bottom - 25, x_last, y_bottom - 25, f"{spacing_in:.2f} in spacing")
+
+    scene["xlim"] = (-160, width + 260)
+    scene["ylim"] = (-80, height + 120)
+    return scene
+
+def T_scene(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """
+    Improved T-section plotting: flange top shows flange longitudinal bars,
+    web interior shows mid/bottom bars; hollow/cover calculations adjusted so
+    flange bars draw properly in the flange zone (like the sample image).
+    """
+    scene = new_scene((11,7))
+    scale = 12.0
+    bf = (b + 2 * min(4 * tf, h - tf))
+    Bf_px = bf * scale
+    Tf_px = tf * scale
+    Bw_px = b * scale
+    D_px = h * scale
+
+    base_x = 40
+    base_y = 40
+
+    # flange geometry
+    flange_left = base_x
+    flange_right = base_x + Bf_px
+    flange_top = base_y + D_px - Tf_px
+    flange_bottom = base_y + D_px
+
+    # web geometry
+    web_left = base_x + (Bf_px - Bw_px) / 2
+    web_bottom = base_y
+    web_height = D_px - Tf_px
+
+    # draw flange and web outlines
+    add_box(scene, flange_left, flange_top, Bf_px, Tf_px, edge='black', face='#e6e6e6', lw=4)
+    add_box(scene, web_left, web_bottom, Bw_px, web_height, edge='black', face='#ffffff', lw=4)
+
+    # compute inner clear/hollow area where bars are placed (respect cover)
+    cover = 0.75
+    cover_px = cover * scale
+    hollow_left = web_left + cover_px
+    hollow_right = web_left + Bw_px - cover_px
+    # allow hollow_top to extend into flange so flange bars can be drawn inside flange region
+    hollow_bottom = web_bottom + cover_px
+    hollow_top = flange_bottom - cover_px
+    hollow_w = hollow_right - hollow_left
+    hollow_h = hollow_top - hollow_bottom
+
+    # draw inner border where bars lie
+    add_box(scene, hollow_left, hollow_bottom, hollow_w, hollow_h, edge='#333333', face='#ffffff', lw=3)
+
+    # labels for bf and h
+    add_text(scene, (flange_left + flange_right)/2, flange_bottom + 16, f"bf = {bf:.2f} in   tf = {tf:.2f} in", size=9, ha='center')
+    add_dimension(scene, -60, web_bottom, -60, flange_bottom, f"h = {h:.2f} in", rot=90)
+
+    r_px = 10
+
+    # Top flange bars (distributed within hollow width but within flange region visually)
+    top_coords = []
+    if num_top > 0 and hollow_w > 2*r_px:
+        if num_top > 1:
+            spacing_top = (hollow_w - 2*r_px - 4) / (num_top - 1)
+        else:
+            spacing_top = 0
+        # place top bars slightly below flange top (so they appear inside flange)
+        y_top = flange_top + Tf_px/2
+        # clamp so they stay inside the hollow visualization
+        y_top = min(y_top, hollow_top - r_px - 2)
+        for i in range(num_top):
+            cx = hollow_left + r_px + 2 + i * spacing_top
+            add_circle(scene, cx, y_top, r_px)
+            top_coords.append((cx, y_top))
+
+    # Mid bars inside web (left & right)
+    mid_coords = []
+    y_mid = hollow_bottom + hollow_h / 2
+    if mid_bar and mid_bar > 0:
+        mid_left = (max(hollow_left, web_left + r_px + 6), y_mid)
+        mid_right = (min(hollow_right, web_left + Bw_px - r_px - 6), y_mid)
+        add_circle(scene, *mid_left, r_px)
+        add_circle(scene, *mid_right, r_px)
+        mid_coords = [mid_left, mid_right]
+
+    # Bottom bars (dense row near bottom of hollow)
+    bottom_coords = []
+    if num_bottom > 0 and hollow_w > 2*r_px:
+        if num_bottom > 1:
+            spacing_bottom = (hollow_w - 2*r_px - 4) / (num_bottom - 1)
+        else:
+            spacing_bottom = 0
+        y_bottom = hollow_bottom + r_px + 6
+        for i in range(num_bottom):
+            cx = hollow_left + r_px + 2 + i * spacing_bottom
+            add_circle(scene, cx, y_bottom, r_px)
+            bottom_coords.append((cx, y_bottom))
+
+    # labels/callouts (to right of flange)
+    label_x = flange_right + 80
+    if top_coords:
+        tx, ty = top_coords[-1]  # point to rightmost flange bar like sample
+        add_callout(scene, label_x, ty + 6, tx + r_px + 3, ty, f"({num_top})#{6} top longitudinal bars")
+    if mid_coords:
+        # right mid bar
+        add_callout(scene, label_x, y_mid, mid_coords[1][0] + r_px + 3, y_mid, f"2#({mid_bar}) top longitudinal bars")
+    if bottom_coords:
+        bx, by = bottom_coords[len(bottom_coords)//2]
+        add_callout(scene, label_x, by - 18, bx + r_px + 3, by, f"({num_bottom})#{8} bottom longitudinal bars")
+    if stirrup_bar and stirrup_bar > 0:
+        add_callout(scene, label_x, y_mid - 36, hollow_right + 6, y_mid - hollow_h/4, f"{ASTM_BARS.label(stirrup_bar)} stirrups @ {stirrup_spacing:.1f} in c/c")
+
+    # optionally show bottom spacing numeric
+    if show_bar_spacing and len(bottom_coords) > 1:
+        x_first = bottom_coords[0][0]
+        x_last = bottom_coords[-1][0]
+        spacing_in = (x_last - x_first) / (len(bottom_coords)-1) / scale if len(bottom_coords) > 1 else 0
+        add_dimension(scene, x_first, hollow_bottom - 28, x_last, hollow_bottom - 28, f"{spacing_in:.2f} in spacing")
+
+    scene["xlim"] = (-160, flange_right + 260)
+    scene["ylim"] = (-100, flange_bottom + 120)
+    return scene
+
+def L_scene(b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """
+    L-section plotting: flange drawn on left; flange top longitudinals appear under flange;
+    mid and bottom bars inside web clear area. Signatures preserved.
+    """
+    scene = new_scene((11,7))
+    scale = 12.0
+    bf = (b + min(4 * tf, h - tf))
+    bf_px = bf * scale
+    Tf_px = tf * scale
+    Bw_px = b * scale
+    D_px = h * scale
+
+    base_x = 40
+    base_y = 40
+
+    # flange on LEFT
+    flange_left = base_x
+    flange_right = base_x + bf_px
+    flange_top = base_y + D_px - Tf_px
+    flange_bottom = base_y + D_px
+
+    # web to right of flange
+    web_left = flange_right - Bw_px
+    web_bottom = base_y
+    web_height = D_px - Tf_px
+
+    # draw flange and web
+    add_box(scene, flange_left, flange_top, bf_px, Tf_px, edge='black', face='#e6e6e6', lw=4)
+    add_box(scene, web_left, web_bottom, Bw_px, web_height, edge='black', face='#ffffff', lw=4)
+
+    # inner clear/hollow where rebars are placed (respect cover)
+    cover = 0.75
+    cover_px = cover * scale
+    hollow_left = web_left + cover_px
+    hollow_right = web_left + Bw_px - cover_px
+    hollow_top = flange_bottom - cover_px
+    hollow_bottom = web_bottom + cover_px
+    hollow_w = hollow_right - hollow_left
+    hollow_h = hollow_top - hollow_bottom
+
+    # draw inner area
+    add_box(scene, hollow_left, hollow_bottom, hollow_w, hollow_h, edge='#333333', face='#ffffff', lw=3)
+
+    # dims text
+    add_text(scene, (flange_left + flange_right)/2, flange_bottom + 16, f"bf = {bf:.2f} in   tf = {tf:.2f} in", size=9, ha='center')
+    add_dimension(scene, -60, web_bottom, -60, flange_bottom, f"h = {h:.2f} in", rot=90)
+
+    r_px = 10
+
+    # Top bars under flange (distributed across hollow width)
+    top_coords = []
+    if num_top > 0 and hollow_w > 2*r_px:
+        if num_top > 1:
+            spacing_top = (hollow_w - 2*r_px - 4) / (num_top - 1)
+        else:
+            spacing_top = 0
+        y_top = flange_top + Tf_px/2
+        y_top = min(y_top, hollow_top - r_px - 2)
+        for i in range(num_top):
+            cx = hollow_left + r_px + 2 + i * spacing_top
+            add_circle(scene, cx, y_top, r_px)
+            top_coords.append((cx, y_top))
+
+    # Mid bars inside web
+    y_mid = hollow_bottom + hollow_h / 2
+    mid_coords = []
+    if mid_bar and mid_bar > 0:
+        mid_left = (hollow_left + r_px + 6, y_mid)
+        mid_right = (hollow_right - r_px - 6, y_mid)
+        add_circle(scene, *mid_left, r_px)
+        add_circle(scene, *mid_right, r_px)
+        mid_coords = [mid_left, mid_right]
+
+    # Bottom bars along web bottom
+    bottom_coords = []
+    if num_bottom > 0 and hollow_w > 2*r_px:
+        if num_bottom > 1:
+            spacing_bottom = (hollow_w - 2*r_px - 4) / (num_bottom - 1)
+        else:
+            spacing_bottom = 0
+        y_bottom = hollow_bottom + r_px + 6
+        for i in range(num_bottom):
+            cx = hollow_left + r_px + 2 + i * spacing_bottom
+            add_circle(scene, cx, y_bottom, r_px)
+            bottom_coords.append((cx, y_bottom))
+
+    # callout labels (outside to the right)
+    label_x = flange_right + 80
+    if top_coords:
+        tx, ty = top_coords[-1]
+        add_callout(scene, label_x, ty + 6, tx + r_px + 3, ty, f"{num_top} × #{6} (top)")
+    if mid_coords:
+        add_callout(scene, label_x, y_mid, mid_coords[1][0] + r_px + 3, y_mid, f"2 × #{mid_bar} (mid)")
+    if bottom_coords:
+        bx, by = bottom_coords[0]
+        add_callout(scene, label_x, by - 18, bx + r_px + 3, by, f"{num_bottom} × #{8} (bottom)")
+    if stirrup_bar and stirrup_bar > 0:
+        add_callout(scene, label_x, y_mid - 36, hollow_right + 6, y_mid - hollow_h/4, f"{ASTM_BARS.label(stirrup_bar)} stirrups @ {stirrup_spacing:.2f} in c/c")
+
+    # optionally annotate bottom spacing
+    if show_bar_spacing and len(bottom_coords) > 1:
+        x_first = bottom_coords[0][0]
+        x_last = bottom_coords[-1][0]
+        spacing_in = (x_last - x_first) / (len(bottom_coords)-1) / scale if len(bottom_coords) > 1 else 0
+        add_dimension(scene, x_first, hollow_bottom - 28, x_last, hollow_bottom - 28, f"{spacing_in:.2f} in spacing")
+
+    scene["xlim"] = (-160, flange_right + 260)
+    scene["ylim"] = (-100, flange_bottom + 120)
+    return scene
+
+def section_scene(section, b, h, tf, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing=False):
+    """Scene for the section name (tf defaults to 1.0 for T/L, as in the UI)."""
+    if section == "T Section":
+        return T_scene(b, h, tf or 1.0, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing)
+    if section == "L Section":
+        return L_scene(b, h, tf or 1.0, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing)
+    return rectangular_scene(b, h, num_top, num_bottom, mid_bar, stirrup_bar, stirrup_spacing, show_bar_spacing)
@@ -0,0 +1,253 @@
+"""
+Chunked beam-schedule processing: read CSV/Parquet schedules in chunks, run the
+batch design / analysis / reinforcement check / torsional capacity on each chunk
+and stream the results to CSV/Parquet.
+Memory is bounded by the chunk size, not the schedule length.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .batch import BATCH_ANALYSIS_KEYS, SECTION_RECT, analysis_batch_frame, design_batch_frame, section_codes
+from .capacity import CAPACITY_KEYS, torsion_capacity_frame
+from .check import CHECK_KEYS, check_batch_frame
+from .records import BeamInput, BeamResult
+from .tables import RESULTS_TABLE_KEYS
+
+DESIGN_COLUMNS = ["section", "b", "h", "fc", "fy", "fyt", "tu", "vu", "bar_l", "nl", "As_flexure", "nt", "bar_top"]
+ANALYSIS_COLUMNS = ["section", "b", "h", "fc", "tu"]
+# check mode: the provided steel; mid_bar (side bars) and As_top (top flexural steel) are optional
+CHECK_COLUMNS = DESIGN_COLUMNS + ["stirrup_bar", "stirrup_spacing"]
+CHECK_OPTIONAL = {"mid_bar": 0.0, "As_top": 0.0}
+# capacity mode: the check's columns without tu (the largest Tu is the result)
+CAPACITY_COLUMNS = [c for c in CHECK_COLUMNS if c != "tu"]
+STATUS_KEYS = ["safe", "demand_exceeds_capacity"]
+DEFAULT_CHUNKSIZE = 100_000
+HASH_COLUMN = "input_hash"
+HASH_NDIGITS = 6
+
+def file_format(path, fmt=None):
+    """'csv' or 'parquet', from fmt if given, else from the file extension."""
+    if fmt:
+        fmt = fmt.lower()
+    else:
+        ext = os.path.splitext(str(path))[1].lower()
+        fmt = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}.get(ext)
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Cannot determine schedule format for {path!r}; use .csv or .parquet")
+    return fmt
+
+def iter_schedule_chunks(path, chunksize=DEFAULT_CHUNKSIZE, fmt=None):
+    """Yield DataFrame chunks of at most chunksize rows from a CSV or Parquet schedule."""
+    if file_format(path, fmt) == "csv":
+        # round_trip parsing gives the same floats as float(text), i.e. the UI's inputs
+        yield from pd.read_csv(path, chunksize=chunksize, float_precision="round_trip")
+    else:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+
+def count_schedule_rows(path, fmt=None):
+    """Number of beams in a schedule (Parquet: from the footer; CSV: one column is parsed)."""
+    if file_format(path, fmt) == "csv":
+        return sum(len(chunk) for chunk in pd.read_csv(path, usecols=[0], chunksize=DEFAULT_CHUNKSIZE))
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(path).metadata.num_rows
+
+def result_keys(mode):
+    """Result columns written per row: the UI's results-table keys plus status flags."""
+    if mode == "analysis":
+        keys = [k for k in RESULTS_TABLE_KEYS if k in ("b", "h", "tf", "Acp", "Pcp", "Aoh", "Ph", "Ao", "phiTcr", "Tth")]
+        return keys + ["safe"]
+    if mode == "check":
+        return CHECK_KEYS
+    if mode == "capacity":
+        return CAPACITY_KEYS
+    return RESULTS_TABLE_KEYS + STATUS_KEYS
+
+def mode_columns(mode):
+    """Required schedule columns of a mode ("design", "analysis", "check" or "capacity")."""
+    if mode not in ("design", "analysis", "check", "capacity"):
+        raise ValueError(f"Unknown schedule mode {mode!r}")
+    return {"analysis": ANALYSIS_COLUMNS, "check": CHECK_COLUMNS, "capacity": CAPACITY_COLUMNS}.get(mode, DESIGN_COLUMNS)
+
+def check_columns(chunk, mode="design"):
+    required = mode_columns(mode)
+    missing = [c for c in required if c not in chunk]
+    if missing:
+        raise ValueError(f"Schedule is missing column(s): {', '.join(missing)}")
+
+def compute_chunk(chunk, mode="design"):
+    """Validate one schedule chunk and return the full batch result frame for it."""
+    check_columns(chunk, mode)
+    if mode == "analysis":
+        return analysis_batch_frame(chunk)
+    if mode == "check":
+        return check_batch_frame(chunk)
+    if mode == "capacity":
+        return torsion_capacity_frame(chunk)
+    return design_batch_frame(chunk)
+
+def input_hashes(chunk, mode="design"):
+    """
+    uint64 hash per row of the inputs the mode reads, normalized so that equal
+    designs hash equal: floats rounded to HASH_NDIGITS decimals (as the result
+    caches round), section names or codes mapped to codes, and tf taken as 0.0
+    where it is blank or unused (rectangular sections).
+    """
+    check_columns(chunk, mode)
+    codes = section_codes(chunk["section"].to_numpy())
+    columns = {"section": codes}
+    for key in mode_columns(mode)[1:]:
+        columns[key] = np.round(chunk[key].to_numpy(dtype=float), HASH_NDIGITS) + 0.0  # + 0.0: no -0.0
+    if mode in ("check", "capacity"):
+        for key, default in CHECK_OPTIONAL.items():
+            values = chunk[key].to_numpy(dtype=float) if key in chunk else np.full(len(chunk), default)
+            columns[key] = np.round(np.where(np.isnan(values), default, values), HASH_NDIGITS) + 0.0
+    tf = chunk["tf"].to_numpy(dtype=float) if "tf" in chunk else np.zeros(len(chunk))
+    columns["tf"] = np.where(np.isnan(tf) | (codes == SECTION_RECT), 0.0, np.round(tf, HASH_NDIGITS) + 0.0)
+    return pd.util.hash_pandas_object(pd.DataFrame(columns), index=False).to_numpy()
+
+def output_frame(chunk, results, mode="design"):
+    """
+    Input columns followed by the result columns. Input columns that are also result
+    keys (b, h, tf) are kept once; a missing or blank tf becomes 0.0, as in
+    compute_section_geometry.
+    """
+    out = chunk.copy()
+    out["tf"] = chunk["tf"].astype(float).fillna(0.0) if "tf" in chunk else 0.0
+    for key in result_keys(mode):
+        if key not in out:
+            out[key] = results[key].to_numpy()
+    return out
+
+def run_chunk(chunk, mode="design"):
+    """Run one schedule chunk; see output_frame for the columns."""
+    return output_frame(chunk, compute_chunk(chunk, mode), mode)
+
+# result keys only present in a scalar design dict when the section was designed
+_DESIGNED_KEYS = ["Al", "Vn", "Vs", "Ats", "Atsmin", "stirrup_bar", "stirrup_spacing", "req_bottom", "req_mid", "req_top",
+                  "num_bottom_bars_needed", "num_top_bars_needed", "mid_bar", "area_mid",
+                  "provided_bottom_by_user", "provided_top_by_user"]
+_CHECKED_KEYS = ["demand", "Vc", "phiVc", "capacity"]
+_GEOMETRY_KEYS = ["Acp", "Pcp", "Aoh", "Ph", "Ao", "bf"]
+_RESULT_KEYS = _GEOMETRY_KEYS + ["phiTcr", "Tth", "safe", "demand_exceeds_capacity", "Almin_governs"] + _CHECKED_KEYS + _DESIGNED_KEYS
+_INPUT_KEYS = ["b", "h", "fc", "fy", "fyt", "tu", "vu", "nl", "bar_l", "nt", "bar_top", "As_flexure"]
+_INPUT_DEFAULTS = {"fy": 60.0, "fyt": 60.0, "nl": 0, "bar_l": 3, "nt": 0, "bar_top": 3, "As_flexure": 0.0}
+
+def beam_records(chunk, results, mode="design"):
+    """
+    Yield (BeamInput, BeamResult) per row: inputs uses the UI's last_inputs keys and
+    merged mirrors the UI's merge_results(geometry, results), so only the fields the
+    scalar functions would have set are present.
+    """
+    # one Python list per column (no per-row dicts); fields are set straight onto the records
+    n = len(chunk)
+    inputs_cols = {k: chunk[k].tolist() if k in chunk else [_INPUT_DEFAULTS.get(k)] * n for k in _INPUT_KEYS}
+    sections = chunk["section"].tolist()
+    tfs = chunk["tf"].tolist() if "tf" in chunk else [None] * n
+    b_col, h_col = chunk["b"].tolist(), chunk["h"].tolist()
+    keys = BATCH_ANALYSIS_KEYS if mode == "analysis" else _RESULT_KEYS
+    res = {k: results[k].tolist() for k in keys}
+    ui_mode = mode.capitalize()
+    for i in range(n):
+        tf = tfs[i]
+        tf = None if tf is None or tf != tf else float(tf)
+        inputs = BeamInput(tf=tf, section=sections[i], mode=ui_mode)
+        for k, col in inputs_cols.items():
+            setattr(inputs, k, col[i])
+        merged = BeamResult(b=float(b_col[i]), h=float(h_col[i]), cover=0.75, tf=tf if tf is not None else 0.0)
+        if mode == "analysis":
+            rect = sections[i] in ("Rectangular Section", SECTION_RECT)
+            for k in BATCH_ANALYSIS_KEYS:
+                if not (rect and k in ("b_total", "x")):
+                    setattr(merged, k, res[k][i])
+        else:
+            for k in _GEOMETRY_KEYS:
+                setattr(merged, k, res[k][i])
+            merged.phiTcr = res["phiTcr"][i]
+            merged.Tth = res["Tth"][i]
+            if res["safe"][i]:
+                merged.safe = True
+            else:
+                for k in _CHECKED_KEYS:
+                    setattr(merged, k, res[k][i])
+                if res["demand_exceeds_capacity"][i]:
+                    merged.demand_exceeds_capacity = True
+                else:
+                    if res["Almin_governs"][i]:
+                        merged.Almin_governs = True
+                    for k in _DESIGNED_KEYS:
+                        setattr(merged, k, res[k][i])
+        yield inputs, merged
+
+class ScheduleWriter:
+    """Append-only CSV/Parquet writer (pyarrow); the first chunk fixes the header / schema."""
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = file_format(path, fmt)
+        self._writer = None
+        self._schema = None
+        self.rows = 0
+
+    def write(self, df):
+        import pyarrow as pa
+
+        if self._writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._schema = table.schema
+            if self.fmt == "csv":
+                import pyarrow.csv as pa_csv
+
+                self._writer = pa_csv.CSVWriter(self.path, table.schema)
+            else:
+                import pyarrow.parquet as pq
+
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        self._writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def summarize_chunk(out, summary):
+    """Accumulate row / chunk / status counts into the summary dict."""
+    summary["rows"] += len(out)
+    summary["chunks"] += 1
+    for key in STATUS_KEYS:
+        if key in out:
+            summary[key] += int(np.count_nonzero(out[key].to_numpy()))
+    if "adequate" in out:  # check mode
+        summary["inadequate"] = summary.get("inadequate", 0) + int(np.count_nonzero(~out["adequate"].to_numpy()))
+    return summary
+
+def run_schedule(input_path, output_path, mode="design", chunksize=DEFAULT_CHUNKSIZE, input_format=None, output_format=None):
+    """
+    Stream a whole schedule from input_path to output_path chunk by chunk.
+    Returns a summary dict with row, chunk, safe and demand_exceeds_capacity counts.
+    """
+    summary = {"rows": 0, "chunks": 0, "safe": 0, "demand_exceeds_capacity": 0}
+    with ScheduleWriter(output_path, output_format) as writer:
+        for chunk in iter_schedule_chunks(input_path, chunksize, input_format):
+            first_row = summary["rows"]
+            try:
+                out = run_chunk(chunk, mode)
+            except ValueError as e:
+                raise ValueError(f"Rows {first_row}-{first_row + len(chunk) - 1}: {e}") from e
+            writer.write(out)
+            summarize_chunk(out, summary)
+    return summary
@@ -0,0 +1,211 @@
+"""
+Along-span station design and stirrup zones.
+
+design_* sizes one stirrup for the whole member from a single (Vu, Tu). Here
+each beam carries Vu(x) / Tu(x) at any number of stations: design_stations
+runs the design at every station in one vectorized pass (section_terms once
+per beam, as for load combinations), and stirrup_zones merges the stations into
+practical zones, each detailed with the stirrup selection logic for the
+largest Ats it covers. A zone covers the intervals from each of its stations to
+the next, so the next zone's first station counts too: demand can rise all the
+way to it.
+
+    stations, zones = span_frame(beams, station_table)       # explicit Vu(x), Tu(x)
+    beam, x, vu, tu = linear_stations(L, 41, vu_start, vu_end, tu_start, tu_end)
+
+x is in inches, like the section dimensions and stirrup spacings. Zones tile each
+beam from its first to its last station; a zone shorter than min_zone_length is
+merged into the more demanding neighbour, and neighbours that end up with the same
+bar and spacing are joined.
+"""
+import numpy as np
+
+from .batch import SECTION_T, select_stirrup_and_spacing_batch
+from .combos import design_combinations
+from .records import columns_frame
+
+MIN_ZONE_LENGTH = 24.0
+STATION_KEYS = ["beam", "x", "safe", "demand", "capacity", "demand_exceeds_capacity", "Vs", "Ats", "Atsmin",
+                "stirrup_bar", "stirrup_spacing"]
+ZONE_KEYS = ["beam", "start", "end", "length", "n_stations", "demand_exceeds_capacity", "Ats",
+             "stirrup_bar", "stirrup_spacing", "n_stirrups"]
+
+def linear_stations(length, n_stations, vu_start, vu_end, tu_start, tu_end):
+    """
+    (beam, x, vu, tu) for n_stations equally spaced stations per beam, with Vu and Tu
+    varying linearly between signed end values (e.g. +V / -V for a uniform load); the
+    design values are their magnitudes. Arguments are scalars or per-beam arrays.
+    """
+    length, vu_start, vu_end, tu_start, tu_end = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(v, dtype=float)) for v in (length, vu_start, vu_end, tu_start, tu_end)])
+    if n_stations < 2:
+        raise ValueError("linear_stations needs at least 2 stations per beam.")
+    beam = np.repeat(np.arange(length.shape[0]), n_stations)
+    t = np.tile(np.linspace(0.0, 1.0, n_stations), length.shape[0])
+    x = length[beam] * t
+    vu = np.abs(vu_start[beam] + (vu_end - vu_start)[beam] * t)
+    tu = np.abs(tu_start[beam] + (tu_end - tu_start)[beam] * t)
+    return beam, x, vu, tu
+
+def design_stations(section_type, b, h, tf, fc, fy, fyt, beam, x, tu_ft, vu):
+    """
+    Design at every station: beam arguments as for design_batch (one entry per beam),
+    beam / x / tu_ft / vu one entry per station. Returns (stations, terms): stations
+    is a dict of STATION_KEYS arrays sorted by (beam, x); terms the per-beam section_terms.
+    """
+    beam = np.asarray(beam, dtype=np.int64)
+    x = np.asarray(x, dtype=float)
+    order = np.lexsort((x, beam))
+    beam, x = beam[order], x[order]
+    tu_ft = np.broadcast_to(np.asarray(tu_ft, dtype=float), order.shape)[order]
+    vu = np.broadcast_to(np.asarray(vu, dtype=float), order.shape)[order]
+    # longitudinal inputs do not change Ats or the stirrups
+    rows, terms = design_combinations(section_type, b, h, tf, fc, fy, fyt, 0, 0, 0.0, 0, 0, beam, tu_ft, vu)
+    stations = {k: rows[k] for k in STATION_KEYS if k in rows}
+    stations["x"] = x
+    return stations, terms
+
+def _runs(beam, key_arrays):
+    """Start flags of runs of equal keys within each beam (arrays in beam order)."""
+    start = np.ones(beam.shape, dtype=bool)
+    start[1:] = beam[1:] != beam[:-1]
+    for arr in key_arrays:
+        same = (arr[1:] == arr[:-1]) | (np.isnan(arr[1:]) & np.isnan(arr[:-1])) if arr.dtype.kind == "f" \
+            else arr[1:] == arr[:-1]
+        start[1:] |= ~same
+    return start
+
+def _detail(zones, terms):
+    """(Re)select each zone's stirrup from its governing Ats (0 for a zone below Tth throughout)."""
+    Ph = terms["Ph"][zones["beam"]]
+    dup = terms["codes"][zones["beam"]] == SECTION_T
+    bar, spacing = select_stirrup_and_spacing_batch(Ph, np.nan_to_num(zones["Ats"], nan=0.0), dup=dup)
+    exceeds = zones["demand_exceeds_capacity"]
+    zones["stirrup_bar"] = np.where(exceeds, 0, bar).astype(np.int64)
+    zones["stirrup_spacing"] = np.where(exceeds, np.nan, spacing)
+
+def _join(zones, start):
+    """Join zones into the runs flagged by start (per-zone arrays in beam order)."""
+    first = np.flatnonzero(start)
+    ends = np.append(first[1:], start.size) - 1
+    return {"beam": zones["beam"][first], "start": zones["start"][first], "end": zones["end"][ends],
+            "n_stations": np.add.reduceat(zones["n_stations"], first),
+            "demand_exceeds_capacity": np.logical_or.reduceat(zones["demand_exceeds_capacity"], first),
+            "Ats": np.fmax.reduceat(zones["Ats"], first)}
+
+def stirrup_zones(stations, terms, min_zone_length=MIN_ZONE_LENGTH):
+    """
+    Merge design_stations output into stirrup zones (dict of ZONE_KEYS arrays, in beam
+    order). A zone runs from its first station to the next zone's first station, and
+    its Ats and demand_exceeds_capacity include that station.
+    """
+    beam = stations["beam"]
+    exceeds = stations["demand_exceeds_capacity"]
+    Ats = np.where(stations["safe"], 0.0, stations["Ats"])
+    # each station stands for the interval up to the next station of its beam, governed by both ends
+    inner = np.flatnonzero(beam[1:] == beam[:-1])
+    exceeds = exceeds.copy()
+    exceeds[inner] |= exceeds[inner + 1]
+    Ats = Ats.copy()
+    Ats[inner] = np.fmax(Ats[inner], Ats[inner + 1])
+    Ats = np.where(exceeds, np.nan, Ats)
+    # one zone per station, then runs of equal bar / spacing
+    zones = {"beam": beam, "start": stations["x"], "end": stations["x"], "n_stations": np.ones(beam.shape, np.int64),
+             "demand_exceeds_capacity": exceeds, "Ats": Ats}
+    _detail(zones, terms)
+    zones = _join(zones, _runs(beam, [zones["stirrup_bar"], zones["stirrup_spacing"], exceeds]))
+    _detail(zones, terms)
+
+    while zones["beam"].size:
+        zb = zones["beam"]
+        last = np.ones(zb.shape, dtype=bool)
+        last[:-1] = zb[1:] != zb[:-1]
+        first = np.ones(zb.shape, dtype=bool)
+        first[1:] = zb[1:] != zb[:-1]
+        end = np.where(last, zones["end"], np.append(zones["start"][1:], 0.0))
+        length = end - zones["start"]
+        short = (length < min_zone_length) & ~(first & last)
+        if not short.any():
+            break
+        # per beam, the shortest short zone merges into its more demanding neighbour
+        seg_start = np.flatnonzero(first)
+        ranked = np.where(short, length, np.inf)
+        best = np.minimum.reduceat(ranked, seg_start)
+        hits = np.flatnonzero(ranked == np.repeat(best, np.diff(np.append(seg_start, zb.size))))
+        pick = hits[np.searchsorted(hits, seg_start[np.isfinite(best)])]
+        # a zone over capacity counts as the most demanding
+        prev_ats = np.where(first[pick], -np.inf, np.nan_to_num(zones["Ats"][pick - 1], nan=np.inf))
+        next_ats = np.where(last[pick], -np.inf, np.nan_to_num(zones["Ats"][np.minimum(pick + 1, zb.size - 1)],
+                                                                nan=np.inf))
+        into_prev = ~first[pick] & (last[pick] | (prev_ats >= next_ats))
+        # the merged pair is the run starting at its earlier zone
+        start = np.ones(zb.shape, dtype=bool)
+        start[np.where(into_prev, pick, pick + 1)] = False
+        zones = _join(zones, start)
+        _detail(zones, terms)
+        zones = _join(zones, _runs(zones["beam"], [zones["stirrup_bar"], zones["stirrup_spacing"],
+                                                   zones["demand_exceeds_capacity"]]))
+        _detail(zones, terms)
+
+    zb = zones["beam"]
+    last = np.ones(zb.shape, dtype=bool)
+    last[:-1] = zb[1:] != zb[:-1]
+    zones["end"] = np.where(last, zones["end"], np.append(zones["start"][1:], 0.0))
+    zones["length"] = zones["end"] - zones["start"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        n_stirrups = np.ceil(zones["length"] / zones["stirrup_spacing"])
+    zones["n_stirrups"] = np.where(np.isfinite(n_stirrups), n_stirrups, 0).astype(np.int64)
+    return zones
+
+def span_frame(beams, stations, id_column="beam_id", x_column="x", min_zone_length=MIN_ZONE_LENGTH):
+    """
+    DataFrame front-end: beams has one row per beam (section, b, h, tf, fc, fy, fyt,
+    id_column), stations one row per station (id_column, x_column, vu, tu). Returns
+    (stations, zones) DataFrames with the beam id in place of the beam position.
+    """
+    import pandas as pd
+
+    missing = [c for c in ("section", "b", "h", "fc", "fy", "fyt", id_column) if c not in beams]
+    missing += [c for c in (id_column, x_column, "vu", "tu") if c not in stations]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(dict.fromkeys(missing))}")
+    ids = pd.Index(beams[id_column])
+    if ids.has_duplicates:
+        raise ValueError(f"Duplicate {id_column!r} values in the beam table.")
+    beam = ids.get_indexer(stations[id_column])
+    if np.any(beam < 0):
+        unknown = sorted({str(v) for v in stations[id_column].to_numpy()[beam < 0]})
+        raise ValueError(f"Stations for unknown beam(s): {', '.join(unknown[:10])}")
+
+    tf = beams["tf"].to_numpy(dtype=float) if "tf" in beams else None
+    out, terms = design_stations(beams["section"].to_numpy(), beams["b"].to_numpy(), beams["h"].to_numpy(), tf,
+                                 beams["fc"].to_numpy(), beams["fy"].to_numpy(), beams["fyt"].to_numpy(),
+                                 beam, stations[x_column].to_numpy(), stations["tu"].to_numpy(),
+                                 stations["vu"].to_numpy())
+    zones = stirrup_zones(out, terms, min_zone_length)
+    id_values = ids.to_numpy()
+    out[id_column] = id_values[out["beam"]]
+    zones[id_column] = id_values[zones["beam"]]
+    return (columns_frame(out, keys=[id_column] + STATION_KEYS[1:]),
+            columns_frame(zones, keys=[id_column] + ZONE_KEYS[1:]))
+
+def run_span(beams_path, stations_path, output_path, rows_path=None, input_format=None, output_format=None,
+             id_column="beam_id", min_zone_length=MIN_ZONE_LENGTH):
+    """
+    Station design for a beam table and its station table (CSV / Parquet, read whole):
+    writes the stirrup zones to output_path and, if given, every station's results to
+    rows_path. Returns a summary dict (beams, stations, zones, demand_exceeds_capacity).
+    """
+    from .combos import read_table
+    from .schedule import ScheduleWriter
+
+    beams = read_table(beams_path, input_format)
+    stations, zones = span_frame(beams, read_table(stations_path, input_format), id_column,
+                                 min_zone_length=min_zone_length)
+    with ScheduleWriter(output_path, output_format) as writer:
+        writer.write(zones)
+    if rows_path:
+        with ScheduleWriter(rows_path, output_format) as writer:
+            writer.write(stations)
+    return {"beams": len(beams), "stations": len(stations), "zones": len(zones),
+            "demand_exceeds_capacity": int(zones.groupby(id_column)["demand_exceeds_capacity"].any().sum())}
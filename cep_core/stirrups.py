@@ -0,0 +1,82 @@
+"""Stirrup bar / spacing selection."""
+import bisect
+import math
+
+from .bars import ASTM_BARS, area_of_bar, area_of_bar_explicit
+
+# ---------------------------
+# Stirrup selection helper (duplicated)
+# ---------------------------
+def select_stirrup_and_spacing(Ph, Ats):
+    bar_options = [3,4,5,6,7,8]
+    selected_bar = None
+    final_spacing = None
+    if Ats <= 0 or Ph <= 0:
+        return 3, max(4.0, min(12.0, Ph/8 if Ph>0 else 12.0))
+    for bar in bar_options:
+        Av = area_of_bar(bar)
+        if Ats == 0:
+            continue
+        s = (2 * Av) / Ats
+        if s <= min(Ph / 8, 12) and s >= 4:
+            selected_bar = bar
+            final_spacing = math.floor(s * 2) / 2
+            break
+    if selected_bar is None:
+        selected_bar = 3
+        s = min(Ph / 8, 12)
+        final_spacing = math.floor(s * 2) / 2
+    return selected_bar, final_spacing
+
+def select_stirrup_and_spacing_dup(Ph, Ats):
+    # duplicate variant to keep code verbose
+    bar_options = [3, 4, 5, 6, 7, 8]
+    if Ats <= 0:
+        return 3, max(4.0, min(12.0, Ph/8 if Ph>0 else 12.0))
+    for bar in bar_options:
+        Av = area_of_bar_explicit(bar)
+        if Ats == 0:
+            continue
+        s = (2 * Av) / Ats
+        if 4 <= s <= min(Ph / 8 if Ph>0 else 12.0, 12.0):
+            return bar, math.floor(s * 2) / 2
+    return 3, math.floor(min(Ph / 8 if Ph>0 else 12.0, 12.0) * 2) / 2
+
+# ---------------------------
+# Precomputed selection index
+# The loops above try bars in order and take the first with 4 <= s <= limit,
+# s = 2 Av / Ats. s grows with the bar, so that bar is the first whose s >= 4
+# (a bisect over 2 Av), provided its s is within the limit; otherwise no bar is.
+# ---------------------------
+STIRRUP_BARS = (3, 4, 5, 6, 7, 8)
+STIRRUP_TWO_AV = tuple(2 * ASTM_BARS.area(bar) for bar in STIRRUP_BARS)
+
+def first_stirrup_index(Ats):
+    """Index into STIRRUP_BARS of the first bar with (2 Av) / Ats >= 4 (len if none); Ats > 0."""
+    k = bisect.bisect_left(STIRRUP_TWO_AV, 4 * Ats)
+    # 2 Av >= 4 Ats and 2 Av / Ats >= 4 can round differently; settle on the loops' test
+    if k < len(STIRRUP_TWO_AV) and STIRRUP_TWO_AV[k] / Ats < 4:
+        k += 1
+    elif k > 0 and STIRRUP_TWO_AV[k - 1] / Ats >= 4:
+        k -= 1
+    return k
+
+def _lookup(limit, Ats):
+    k = first_stirrup_index(Ats)
+    if k < len(STIRRUP_BARS):
+        s = STIRRUP_TWO_AV[k] / Ats
+        if s <= limit:
+            return STIRRUP_BARS[k], math.floor(s * 2) / 2
+    return 3, math.floor(limit * 2) / 2
+
+def lookup_stirrup_and_spacing(Ph, Ats):
+    """select_stirrup_and_spacing via the precomputed index (same results)."""
+    if Ats <= 0 or Ph <= 0:
+        return 3, max(4.0, min(12.0, Ph/8 if Ph>0 else 12.0))
+    return _lookup(min(Ph / 8, 12), Ats)
+
+def lookup_stirrup_and_spacing_dup(Ph, Ats):
+    """select_stirrup_and_spacing_dup via the precomputed index (same results)."""
+    if Ats <= 0:
+        return 3, max(4.0, min(12.0, Ph/8 if Ph>0 else 12.0))
+    return _lookup(min(Ph / 8 if Ph>0 else 12.0, 12.0), Ats)
@@ -0,0 +1,265 @@
+"""
+Persistent results store: a Hive-partitioned Parquet dataset (pyarrow).
+
+    <root>/mode=design/project=Tower-A/run-000001.parquet   first full run
+    <root>/mode=design/project=Tower-A/run-000002.parquet   later append: only the beams rerun
+    <root>/mode=analysis/project=Tower-B/run-000001.parquet
+
+Every row carries the beam's beam_id (as a string), _run, the sequence number
+of the append that wrote it, and input_hash (schedule.input_hashes) when the
+rows include the schedule inputs. A beam written again by a later append supersedes its
+older rows: reads return only the newest row per (project, beam_id), so an append
+never rewrites earlier files. compact() folds a project back into one file.
+
+Files are written chunk by chunk with min / max statistics on every column, each
+row group sorted by beam_id. Filters on project / mode prune whole directories;
+filters on beam_id or any result column (demand_exceeds_capacity, stirrup_bar,
+Tth, ...) are pushed down to skip row groups.
+
+    from cep_core.store import ResultsStore
+    store = ResultsStore("results_store")
+    store.append(results_frame, project="Tower-A")
+    store.query(project="Tower-A", filters=[("demand_exceeds_capacity", "==", True)])
+    store.query(filters=[("stirrup_bar", "==", 5), ("stirrup_spacing", "==", 4.0)])
+    store.get("Tower-A", ["B12", "B13"])
+"""
+import os
+import re
+from urllib.parse import quote, unquote
+
+from .schedule import DEFAULT_CHUNKSIZE, HASH_COLUMN, input_hashes, iter_schedule_chunks
+
+ROW_GROUP_SIZE = 64 * 1024
+RUN_COLUMN = "_run"
+ID_COLUMN = "beam_id"
+_RUN_FILE = re.compile(r"^run-(\d+)\.parquet$")
+# schedule inputs with a fixed type, whatever the source file inferred
+_FLOAT_INPUTS = ("b", "h", "tf", "fc", "fy", "fyt", "tu", "vu", "As_flexure", "As_top", "stirrup_spacing")
+_INT_INPUTS = ("bar_l", "nl", "nt", "bar_top")
+
+def _to_expression(filters):
+    import pyarrow.parquet as pq
+
+    if filters is None or not isinstance(filters, (list, tuple)):
+        return filters  # None or a pyarrow.compute.Expression
+    return pq.filters_to_expression(filters)
+
+class StoreWriter:
+    """
+    Streams one append (one run file) into a ResultsStore; see ResultsStore.writer.
+    The file is written under a hidden name and renamed into place on close, so
+    readers never see a partial run.
+    """
+
+    def __init__(self, directory, run, id_column=ID_COLUMN, mode="design"):
+        self.directory = directory
+        self.run = run
+        self.id_column = id_column
+        self.mode = mode
+        self.path = os.path.join(directory, f"run-{run:06d}.parquet")
+        self._tmp = os.path.join(directory, f".run-{run:06d}.parquet.tmp")
+        self._writer = None
+        self.rows = 0
+
+    def _table(self, df, first_row):
+        import numpy as np
+        import pyarrow as pa
+
+        df = df.copy()
+        if HASH_COLUMN not in df:
+            # lets a later incremental run reuse these rows
+            try:
+                df[HASH_COLUMN] = input_hashes(df, self.mode)
+            except ValueError:
+                pass  # not a full set of schedule inputs; rows are never reused
+        if self.id_column in df:
+            ids = df.pop(self.id_column)
+        else:
+            ids = np.arange(first_row, first_row + len(df))
+        df.insert(0, ID_COLUMN, [str(v) for v in ids])
+        for key in _FLOAT_INPUTS:
+            if key in df:
+                df[key] = df[key].astype(float)
+        for key in _INT_INPUTS:
+            if key in df:
+                df[key] = df[key].astype(np.int64)
+        df[RUN_COLUMN] = np.int64(self.run)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return table.sort_by(ID_COLUMN)
+
+    def write(self, df, first_row=None):
+        """Append a results chunk; rows without an id column are numbered from first_row."""
+        import pyarrow.parquet as pq
+
+        table = self._table(df, self.rows if first_row is None else first_row)
+        if self._writer is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._writer = pq.ParquetWriter(self._tmp, table.schema, write_statistics=True)
+        elif table.schema != self._writer.schema:
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table, row_group_size=ROW_GROUP_SIZE)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._tmp, self.path)
+
+    def abort(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+class ResultsStore:
+    """Partitioned Parquet store of schedule results under root; see the module docstring."""
+
+    def __init__(self, root):
+        self.root = str(root)
+
+    # ---------------------------
+    # Layout
+    # ---------------------------
+    def _project_dir(self, project, mode):
+        return os.path.join(self.root, f"mode={quote(mode, safe='')}", f"project={quote(str(project), safe='')}")
+
+    def projects(self, mode="design"):
+        base = os.path.join(self.root, f"mode={quote(mode, safe='')}")
+        if not os.path.isdir(base):
+            return []
+        return sorted(unquote(name[len("project="):]) for name in os.listdir(base) if name.startswith("project="))
+
+    def runs(self, project, mode="design"):
+        """Run numbers written for a project, oldest first."""
+        directory = self._project_dir(project, mode)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(int(m.group(1)) for m in map(_RUN_FILE.match, os.listdir(directory)) if m)
+
+    def _files(self, project=None, mode="design"):
+        projects = self.projects(mode) if project is None else [project]
+        return [os.path.join(self._project_dir(p, mode), f"run-{run:06d}.parquet")
+                for p in projects for run in self.runs(p, mode)]
+
+    # ---------------------------
+    # Writing
+    # ---------------------------
+    def writer(self, project, mode="design", id_column=ID_COLUMN):
+        """A StoreWriter for the project's next run (a context manager)."""
+        runs = self.runs(project, mode)
+        return StoreWriter(self._project_dir(project, mode), (runs[-1] + 1) if runs else 1, id_column, mode)
+
+    def append(self, frame, project, mode="design", id_column=ID_COLUMN):
+        """Store one results frame (e.g. schedule.run_chunk output) as a new run; returns its number."""
+        with self.writer(project, mode, id_column) as writer:
+            writer.write(frame, first_row=0)
+        return writer.run
+
+    def append_file(self, path, project, mode="design", id_column=ID_COLUMN, fmt=None, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Stream a results file (CSV / Parquet, or a directory of part files) into a new
+        run; returns (run, rows).
+        """
+        if os.path.isdir(path):
+            paths = sorted(os.path.join(path, name) for name in os.listdir(path) if name.startswith("part-"))
+        else:
+            paths = [path]
+        with self.writer(project, mode, id_column) as writer:
+            for part in paths:
+                for chunk in iter_schedule_chunks(part, chunksize, fmt):
+                    writer.write(chunk)
+        return writer.run, writer.rows
+
+    # ---------------------------
+    # Reading
+    # ---------------------------
+    def dataset(self, project=None, mode="design"):
+        """pyarrow Dataset over the project's (or every project's) run files, or None if empty."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        files = self._files(project, mode)
+        if not files:
+            return None
+        # footers only; int / float drift between runs (e.g. an extra CSV column) is promoted
+        schema = pa.unify_schemas([pq.read_schema(f) for f in files], promote_options="permissive")
+        # hive segments are URI-decoded, matching the quote() in _project_dir
+        partitioning = ds.HivePartitioning(pa.schema([("mode", pa.string()), ("project", pa.string())]))
+        schema = pa.unify_schemas([schema, partitioning.schema])
+        return ds.dataset(files, schema=schema, format="parquet", partitioning=partitioning,
+                          partition_base_dir=self.root)
+
+    def table(self, filters=None, project=None, beam_ids=None, columns=None, mode="design", latest=True):
+        """
+        pyarrow Table of stored results. filters is a pyarrow.compute Expression or
+        a DNF list of (column, op, value) tuples as for pyarrow.parquet; project and
+        beam_ids narrow it further. With latest (the default) a superseded row never
+        matches, even if the beam's newer row fails the filter.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        dataset = self.dataset(project, mode)
+        if dataset is None:
+            return pa.table({})
+        expr = _to_expression(filters)
+        if beam_ids is not None:
+            ids_expr = pc.field(ID_COLUMN).isin([str(v) for v in beam_ids])
+            expr = ids_expr if expr is None else expr & ids_expr
+        keys = ["project", ID_COLUMN, RUN_COLUMN]
+        read_columns = None if columns is None else list(dict.fromkeys(keys + list(columns)))
+        table = dataset.to_table(columns=read_columns, filter=expr)
+        projects = [project] if project is not None else self.projects(mode)
+        if latest and table.num_rows and any(len(self.runs(p, mode)) > 1 for p in projects):
+            table = self._newest_rows(dataset, table)
+        return table.sort_by([("project", "ascending"), (ID_COLUMN, "ascending")])
+
+    def _newest_rows(self, dataset, table):
+        import pyarrow.compute as pc
+
+        # the newest run of each matched beam, from the three key columns only
+        ids = pc.unique(table[ID_COLUMN])
+        keys = dataset.to_table(columns=["project", ID_COLUMN, RUN_COLUMN],
+                                filter=pc.field(ID_COLUMN).isin(ids)
+                                & pc.field("project").isin(pc.unique(table["project"])))
+        newest = keys.group_by(["project", ID_COLUMN]).aggregate([(RUN_COLUMN, "max")])
+        newest = newest.rename_columns([RUN_COLUMN if c == f"{RUN_COLUMN}_max" else c for c in newest.column_names])
+        names = table.column_names
+        return table.join(newest, keys=["project", ID_COLUMN, RUN_COLUMN], join_type="inner").select(names)
+
+    def query(self, filters=None, project=None, beam_ids=None, columns=None, mode="design", latest=True):
+        """table() as a DataFrame."""
+        return self.table(filters, project, beam_ids, columns, mode, latest).to_pandas()
+
+    def get(self, project, beam_ids, mode="design", columns=None):
+        """Newest stored results for the given beam ids of one project, as a DataFrame."""
+        return self.query(project=project, beam_ids=beam_ids, columns=columns, mode=mode)
+
+    def compact(self, project, mode="design"):
+        """Rewrite a project's runs as one run holding only the newest row per beam."""
+        import pyarrow.parquet as pq
+
+        runs = self.runs(project, mode)
+        if len(runs) <= 1:
+            return
+        table = self.table(project=project, mode=mode).drop_columns(["mode", "project"])
+        directory = self._project_dir(project, mode)
+        tmp = os.path.join(directory, ".compact.parquet.tmp")
+        pq.write_table(table, tmp, row_group_size=ROW_GROUP_SIZE, write_statistics=True)
+        # the compacted file replaces the newest run, so later appends still supersede it and
+        # a reader in between sees the compacted rows win over the older runs
+        os.replace(tmp, os.path.join(directory, f"run-{runs[-1]:06d}.parquet"))
+        for run in runs[:-1]:
+            os.remove(os.path.join(directory, f"run-{run:06d}.parquet"))
@@ -0,0 +1,160 @@
+"""
+Parametric sweeps / design charts over the batch design and analysis.
+
+sweep() takes named 1-D ranges (any of SWEEP_PARAMS), evaluates their full
+Cartesian grid with design_batch or analysis_batch in flat chunks, and returns
+one N-D array per output, shaped like the grid. Points are generated from flat
+indices (np.unravel_index), so no per-point Python objects are built and memory
+is the output arrays plus one chunk of work.
+
+    from cep_core.sweep import sweep, sweep_frame, sweep_chart
+    res = sweep("T Section", {"tu": np.linspace(0, 60, 121), "h": np.arange(12, 37, 2),
+                              "fc": [3000, 4000, 5000]}, fixed={"b": 12, "tf": 4})
+    res["values"]["Al"].shape        # (121, 13, 3)
+    sweep_frame(res)                 # long DataFrame on a (tu, h, fc) MultiIndex
+    sweep_chart(res, "Al", x="tu", hue="h", at={"fc": 4000})
+
+Rows outside a result's branch follow the batch conventions: Al / Ats are NaN
+where the section is safe (Tu < Tth) or demand exceeds capacity, and every
+design output is NaN where d = h - 2.5 <= 0.
+"""
+import numpy as np
+
+from .batch import (BATCH_ANALYSIS_KEYS, BATCH_DESIGN_KEYS, BATCH_INT_KEYS, analysis_batch, design_batch,
+                    section_codes)
+
+SWEEP_PARAMS = ["b", "h", "tf", "fc", "fy", "fyt", "tu", "vu", "bar_l", "nl", "As_flexure", "nt", "bar_top"]
+ANALYSIS_PARAMS = ["b", "h", "tf", "fc", "tu"]
+SWEEP_DEFAULTS = {"b": 12.0, "h": 24.0, "tf": 4.0, "fc": 4000.0, "fy": 60.0, "fyt": 60.0, "tu": 20.0, "vu": 20.0,
+                  "bar_l": 6, "nl": 2, "As_flexure": 0.5, "nt": 0, "bar_top": 6}
+DEFAULT_OUTPUTS = ["phiTcr", "Tth", "Al", "Ats"]
+DEFAULT_CHUNK = 250_000
+_BOOL_KEYS = ("safe", "demand_exceeds_capacity", "Almin_governs")
+
+def _dtype(key):
+    return bool if key in _BOOL_KEYS else np.int64 if key in BATCH_INT_KEYS else float
+
+def sweep(section, axes, mode="design", outputs=None, fixed=None, chunk_size=DEFAULT_CHUNK):
+    """
+    Evaluate the grid spanned by axes ({name: 1-D values}, in order) for one section.
+
+    fixed overrides SWEEP_DEFAULTS for the parameters that are not swept. Returns
+    {"section", "mode", "axes": {name: array}, "fixed": {...}, "values": {output: N-D array}}.
+    """
+    section_code = int(section_codes(section))
+    params = ANALYSIS_PARAMS if mode == "analysis" else SWEEP_PARAMS
+    keys = BATCH_ANALYSIS_KEYS if mode == "analysis" else BATCH_DESIGN_KEYS
+    outputs = list(outputs or (["phiTcr", "Tth", "safe"] if mode == "analysis" else DEFAULT_OUTPUTS))
+    unknown = [k for k in axes if k not in params] + [k for k in (fixed or {}) if k not in params]
+    if unknown:
+        raise ValueError(f"Cannot sweep {', '.join(unknown)}; choose from {', '.join(params)}")
+    bad = [k for k in outputs if k not in keys]
+    if bad:
+        raise ValueError(f"Unknown output(s) {', '.join(bad)} for mode {mode!r}")
+
+    axes = {name: np.atleast_1d(np.asarray(values)) for name, values in axes.items()}
+    fixed = {k: SWEEP_DEFAULTS[k] for k in params if k not in axes} | {k: v for k, v in (fixed or {}).items()
+                                                                         if k not in axes}
+    shape = tuple(len(v) for v in axes.values())
+    size = int(np.prod(shape))
+    values = {k: np.empty(size, dtype=_dtype(k)) for k in outputs}
+
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        m = stop - start
+        coords = np.unravel_index(np.arange(start, stop), shape)
+        p = {name: ax[c] for (name, ax), c in zip(axes.items(), coords)}
+        p.update({k: np.broadcast_to(np.asarray(v), (m,)) for k, v in fixed.items()})
+        if mode == "analysis":
+            out = analysis_batch(section_code, p["b"], p["h"], p["tf"], p["fc"], p["tu"])
+            for k in outputs:
+                values[k][start:stop] = out[k]
+            continue
+        # design_batch rejects d <= 0; evaluate the valid points only
+        valid = np.asarray(p["h"], dtype=float) - 2.5 > 0
+        if not valid.all():
+            p = {k: np.asarray(v)[valid] for k, v in p.items()}
+        out = design_batch(section_code, p["b"], p["h"], p["tf"], p["fc"], p["fy"], p["fyt"], p["tu"], p["vu"],
+                           p["bar_l"], p["nl"], p["As_flexure"], p["nt"], p["bar_top"]) if valid.any() else None
+        for k in outputs:
+            dst = values[k][start:stop]
+            if valid.all():
+                dst[:] = out[k]
+            else:
+                dst[:] = False if dst.dtype == bool else 0 if dst.dtype.kind == "i" else np.nan
+                if out is not None:
+                    dst[valid] = out[k]
+
+    return {"section": section, "mode": mode, "axes": axes, "fixed": fixed,
+            "values": {k: v.reshape(shape) for k, v in values.items()}}
+
+def sweep_frame(result, outputs=None):
+    """Long DataFrame: one row per grid point on a MultiIndex of the axes, one column per output."""
+    import pandas as pd
+
+    index = pd.MultiIndex.from_product(list(result["axes"].values()), names=list(result["axes"]))
+    outputs = outputs or list(result["values"])
+    return pd.DataFrame({k: result["values"][k].reshape(-1) for k in outputs}, index=index)
+
+def _held_index(result, name, at):
+    """Grid index nearest to at[name] (default 0) for an axis that is held fixed."""
+    if not at or name not in at:
+        return 0
+    return int(np.abs(np.asarray(result["axes"][name], dtype=float) - at[name]).argmin())
+
+def sweep_slice(result, output, keep, at=None):
+    """
+    Values of output over the axes named in keep (in that order); every other axis is
+    held at the grid value nearest to at[name] (default: its first value).
+    """
+    names = list(result["axes"])
+    index = [slice(None) if name in keep else _held_index(result, name, at) for name in names]
+    arr = result["values"][output][tuple(index)]
+    kept = [n for n in names if n in keep]
+    return np.transpose(arr, [kept.index(n) for n in keep])
+
+def sweep_chart(result, output, x, hue=None, at=None, kind="line", backend="matplotlib"):
+    """
+    Design chart of output against axis x: one line per value of hue (kind="line"), or a
+    filled contour / heat map over (x, hue) (kind="contour"). Other axes are held as in
+    sweep_slice. Returns a matplotlib Figure or an Altair Chart.
+    """
+    keep = [x] if hue is None else [x, hue]
+    data = sweep_slice(result, output, keep, at)
+    xs = result["axes"][x]
+    held = {n: result["axes"][n][_held_index(result, n, at)] for n in result["axes"] if n not in keep}
+    title = f"{output} — {result['section']}" + (" (" + ", ".join(f"{k}={v:g}" for k, v in held.items()) + ")"
+                                                 if held else "")
+    if backend == "altair":
+        import altair as alt
+        import pandas as pd
+
+        if hue is None:
+            df = pd.DataFrame({x: xs, output: data})
+            return alt.Chart(df, title=title).mark_line().encode(x=x, y=output)
+        hs = result["axes"][hue]
+        df = pd.DataFrame({x: np.repeat(xs, len(hs)), hue: np.tile(hs, len(xs)), output: data.reshape(-1)})
+        if kind == "contour":
+            return alt.Chart(df, title=title).mark_rect().encode(x=f"{x}:O", y=f"{hue}:O", color=f"{output}:Q")
+        return alt.Chart(df, title=title).mark_line().encode(x=x, y=output, color=f"{hue}:N")
+
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    if hue is None:
+        ax.plot(xs, data)
+    elif kind == "contour":
+        hs = result["axes"][hue]
+        cs = ax.contourf(xs, hs, np.asarray(data, dtype=float).T, levels=20)
+        fig.colorbar(cs, ax=ax, label=output)
+        ax.set_ylabel(hue)
+    else:
+        for j, hv in enumerate(result["axes"][hue]):
+            ax.plot(xs, data[:, j], label=f"{hue} = {hv:g}")
+        ax.legend(fontsize=8)
+    ax.set_xlabel(x)
+    if kind != "contour" or hue is None:
+        ax.set_ylabel(output)
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+    return fig
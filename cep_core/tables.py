@@ -0,0 +1,103 @@
+"""Row layouts and descriptions shared by the results table and the PDF report."""
+
+# keys shown (when present) in the UI's "Calculated results" table, in order
+RESULTS_TABLE_KEYS = ["b","h","tf","Acp","Pcp","Aoh","Ph","Ao","phiTcr","Tth","Vc","phiVc","capacity","Al","Ats","Atsmin",
+                      "stirrup_bar","stirrup_spacing","req_bottom","req_mid","req_top","num_bottom_bars_needed","num_top_bars_needed","mid_bar"]
+
+# ordered inputs list (description, symbol, units, key in the inputs dict)
+INPUT_ROWS = [
+    ("Shear force (ultimate)", "Vu", "kips", "vu"),
+    ("Torsion applied", "Tu", "kips-ft", "tu"),
+    ("Concrete compressive strength", "f'c", "psi", "fc"),
+    ("Steel yield strength", "fy", "ksi", "fy"),
+    ("Tensile strength used for stirrups", "fyt", "ksi", "fyt"),
+    ("Beam overall depth", "h", "in", "h"),
+    ("Beam/web width", "b", "in", "b"),
+    ("Flange thickness (for T/L sections)", "tf", "in", "tf"),
+    ("No. of bottom longitudinal bars (Nl)", "Nl", "", "nl"),
+    ("Bottom bar size (bottom)", "bar_l", "#", "bar_l"),
+    ("No. of top longitudinal bars (Nt)", "Nt", "", "nt"),
+    ("Top bar size (top)", "bar_top", "#", "bar_top"),
+    ("Area of steel required for flexure", "As_flexure", "in^2", "As_flexure"),
+]
+
+# param_info map: key -> (description, symbol, units)
+PARAM_INFO = {
+    "Vu": ("Shear force (ultimate)", "Vu", "kips"),
+    "Tu": ("Torsion applied", "Tu", "kips-ft"),
+    "fc": ("Concrete compressive strength", "f'c", "psi"),
+    "fy": ("Steel yield strength", "fy", "ksi"),
+    "fyt": ("Tensile strength used for stirrups", "fyt", "ksi"),
+    "h": ("Beam overall depth", "h", "in"),
+    "b": ("Beam/web width", "b", "in"),
+    "tf": ("Flange thickness (for T/L sections)", "tf", "in"),
+    "Acp": ("Gross area of section", "Acp", "in^2"),
+    "Pcp": ("Perimeter of gross section", "Pcp", "in"),
+    "Aoh": ("Hollow/clear area available", "Aoh", "in^2"),
+    "Ph": ("Perimeter of hollow/clear area", "Ph", "in"),
+    "Ao": ("Effective area for torsion calculation (0.85*Aoh)", "Ao", "in^2"),
+    "phiTcr": ("Factored cracking torsion (phi * Tcr)", "phiTcr", "kips-ft"),
+    "Tth": ("Threshold torsion (Tth)", "Tth", "kips-ft"),
+    "Vc": ("Shear strength (unfactored)", "Vc", "kips"),
+    "phiVc": ("Factored shear strength (phi*Vc)", "phiVc", "kips"),
+    "capacity": ("Combined capacity metric", "capacity", "kips"),
+    "Al": ("Required longitudinal area for torsion", "Al", "in^2"),
+    "Ats": ("Required area of transverse reinforcement", "Ats", "in^2"),
+    "Atsmin": ("Minimum transverse area required", "Atsmin", "in^2"),
+    "stirrup_bar": ("Selected stirrup bar size", "stirrup_bar", "#"),
+    "stirrup_spacing": ("Stirrup spacing (c/c)", "stirrup_spacing", "in"),
+    "req_bottom": ("Required bottom steel for flexure+torsion", "req_bottom", "in^2"),
+    "req_mid": ("Required mid steel", "req_mid", "in^2"),
+    "req_top": ("Required top steel", "req_top", "in^2"),
+    "num_bottom_bars_needed": ("No. of bottom bars needed (est.)", "num_bottom_bars_needed", ""),
+    "num_top_bars_needed": ("No. of top bars needed (est.)", "num_top_bars_needed", ""),
+    "mid_bar": ("Estimated mid bar size", "mid_bar", "#"),
+    "safe": ("Section safe in torsion (boolean)", "safe", ""),
+    "demand_exceeds_capacity": ("Demand exceeds capacity (boolean)", "demand_exceeds_capacity", ""),
+    "demand": ("Demand metric used for check", "demand", ""),
+}
+
+# preferred order for the calculations table; the input symbols are always reported
+REPORT_KEY_ORDER = ["Vu","Tu","fc","fy","fyt","h","b","tf",
+                    "Acp","Pcp","Aoh","Ph","Ao","phiTcr","Tth","Vc","phiVc","capacity",
+                    "Al","Ats","Atsmin","stirrup_bar","stirrup_spacing","req_bottom","req_mid","req_top",
+                    "num_bottom_bars_needed","num_top_bars_needed","mid_bar","safe","demand_exceeds_capacity","demand"]
+REPORT_INPUT_KEYS = {"Vu": "vu", "Tu": "tu", "fc": "fc", "fy": "fy", "fyt": "fyt", "h": "h", "b": "b", "tf": "tf"}
+
+def format_value(v):
+    """Table formatting: floats to 4 decimals, everything else via str()."""
+    try:
+        if isinstance(v, float):
+            return f"{v:.4f}"
+        else:
+            return str(v)
+    except:
+        return str(v)
+
+def results_table_rows(merged):
+    """(key, value) rows for the keys of RESULTS_TABLE_KEYS present in merged (BeamResult or dict)."""
+    return [(k, merged[k]) for k in RESULTS_TABLE_KEYS if k in merged]
+
+def inputs_table(inputs):
+    """(description, symbol, units, value) rows for the report's inputs table."""
+    rows = []
+    for desc, sym, units, key in INPUT_ROWS:
+        val = inputs.get(key)
+        if key == "tf" and val is None:
+            val = 0.0
+        rows.append((desc, sym, units, val))
+    return rows
+
+def calculation_rows(merged, inputs):
+    """(description, symbol, units, value) rows for the report's calculations table."""
+    rows = []
+    for key in REPORT_KEY_ORDER:
+        if key in merged:
+            val = merged.get(key, "-")
+        elif key in REPORT_INPUT_KEYS:
+            val = inputs.get(REPORT_INPUT_KEYS[key], "-")
+        else:
+            continue
+        desc, sym, units = PARAM_INFO.get(key, (key, key, ""))
+        rows.append((desc, sym, units, val))
+    return rows
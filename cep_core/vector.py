@@ -0,0 +1,199 @@
+"""
+Vector backends for section scenes (see scene.py): reportlab canvas primitives
+for the PDF report and standalone SVG for the browser. Neither path rasterizes,
+so the report needs no PNG encode / decode round-trip and stays sharp when zoomed.
+
+Line widths and font sizes in a scene are matplotlib points for the scene's
+figsize; both backends rescale them so the drawing keeps the proportions of the
+PNG produced by drawing.render_scene.
+"""
+import math
+from xml.sax.saxutils import escape
+
+FONT = "Helvetica"
+# default matplotlib subplot box (left .125 .. right .9, bottom .11 .. top .88)
+_AXES_FRACTION = (0.775, 0.77)
+# '->' / '<->' head size for matplotlib's default mutation scale (10 pt)
+_HEAD_LENGTH = 4.0
+_HEAD_WIDTH = 2.0
+_DIM_COLOR = "black"
+_CALLOUT_COLOR = "red"
+
+def _extent(scene):
+    (x0, x1), (y0, y1) = scene["xlim"], scene["ylim"]
+    return x0, y0, x1 - x0, y1 - y0
+
+def points_per_unit(scene):
+    """Matplotlib's points per drawing unit for the scene's figsize (aspect 'equal')."""
+    _, _, dx, dy = _extent(scene)
+    fw, fh = scene["figsize"]
+    return min(fw * 72 * _AXES_FRACTION[0] / dx, fh * 72 * _AXES_FRACTION[1] / dy)
+
+def _rgb(color):
+    named = {"black": "#000000", "white": "#ffffff", "red": "#ff0000"}
+    color = named.get(color, color).lstrip("#")
+    return tuple(int(color[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+
+def _label_lines(item):
+    """(x, y, text, size, ha, va, rot, boxed) for text-bearing items."""
+    kind = item["kind"]
+    if kind == "text":
+        return [(item["x"], item["y"], item["text"], item["size"], item["ha"], item["va"], item["rot"], False)]
+    if kind == "dimension":
+        tx = (item["x1"] + item["x2"]) / 2 + item["txt_offset"][0]
+        ty = (item["y1"] + item["y2"]) / 2 + item["txt_offset"][1]
+        return [(tx, ty, item["text"], 9, "center", "center", item["rot"], True)]
+    if kind == "callout":
+        return [(item["tail_x"] + item["tail_offset"][0], item["tail_y"] + item["tail_offset"][1], item["label"],
+                 10, "left", "baseline", 0, False)]
+    return []
+
+def _arrow(item):
+    """(head_x, head_y, tail_x, tail_y, style, color, lw) for arrow-bearing items."""
+    kind = item["kind"]
+    if kind == "arrow":
+        return item["x1"], item["y1"], item["x2"], item["y2"], item["style"], item["color"], item["lw"]
+    if kind == "dimension":
+        return item["x1"], item["y1"], item["x2"], item["y2"], "<->", _DIM_COLOR, 1.1
+    if kind == "callout":
+        return item["head_x"], item["head_y"], item["tail_x"], item["tail_y"], "->", _CALLOUT_COLOR, 1.6
+    return None
+
+# ---------------------------
+# reportlab
+# ---------------------------
+def draw_scene_on_canvas(c, scene, x, y, width, height):
+    """
+    Draw a scene into the (x, y, width, height) box of a reportlab canvas, scaled to
+    fit with equal aspect and aligned to the top of the box.
+    """
+    x0, y0, dx, dy = _extent(scene)
+    s = min(width / dx, height / dy)
+    ox = x + (width - dx * s) / 2 - x0 * s
+    oy = y + height - dy * s - y0 * s
+    pt = s / points_per_unit(scene)
+
+    def px(u):
+        return ox + u * s
+
+    def py(v):
+        return oy + v * s
+
+    c.saveState()
+    for item in scene["items"]:
+        kind = item["kind"]
+        if kind == "box":
+            c.setStrokeColorRGB(*_rgb(item["edge"]))
+            c.setFillColorRGB(*_rgb(item["face"]))
+            c.setLineWidth(item["lw"] * pt)
+            if item["rounded"]:
+                c.roundRect(px(item["x"]), py(item["y"]), item["w"] * s, item["h"] * s, 2 * s, stroke=1, fill=1)
+            else:
+                c.rect(px(item["x"]), py(item["y"]), item["w"] * s, item["h"] * s, stroke=1, fill=1)
+        elif kind == "circle":
+            c.setStrokeColorRGB(*_rgb(item["edge"]))
+            c.setFillColorRGB(*_rgb(item["face"]))
+            c.setLineWidth(item["lw"] * pt)
+            c.circle(px(item["cx"]), py(item["cy"]), item["r"] * s, stroke=1, fill=1)
+        arrow = _arrow(item)
+        if arrow:
+            hx, hy, tx, ty, style, color, lw = arrow
+            c.setStrokeColorRGB(*_rgb(color))
+            c.setLineWidth(lw * pt)
+            c.line(px(tx), py(ty), px(hx), py(hy))
+            _canvas_head(c, px(tx), py(ty), px(hx), py(hy), pt)
+            if style == "<->":
+                _canvas_head(c, px(hx), py(hy), px(tx), py(ty), pt)
+        for lx, ly, text, size, ha, va, rot, boxed in _label_lines(item):
+            _canvas_text(c, px(lx), py(ly), text, size * pt, ha, va, rot, boxed)
+    c.restoreState()
+
+def _canvas_head(c, tx, ty, hx, hy, pt):
+    """Open '->' head at (hx, hy) for a shaft coming from (tx, ty)."""
+    length = math.hypot(hx - tx, hy - ty)
+    if length == 0:
+        return
+    ux, uy = (hx - tx) / length, (hy - ty) / length
+    hl, hw = _HEAD_LENGTH * pt, _HEAD_WIDTH * pt
+    bx, by = hx - ux * hl, hy - uy * hl
+    c.line(hx, hy, bx - uy * hw, by + ux * hw)
+    c.line(hx, hy, bx + uy * hw, by - ux * hw)
+
+def _canvas_text(c, x, y, text, size, ha, va, rot, boxed):
+    c.saveState()
+    c.translate(x, y)
+    if rot:
+        c.rotate(rot)
+    text_w = c.stringWidth(text, FONT, size)
+    left = {"center": -text_w / 2, "right": -text_w}.get(ha, 0.0)
+    base = -0.35 * size if va == "center" else 0.0
+    if boxed:
+        pad = 0.12 * size
+        c.setFillColorRGB(1, 1, 1)
+        c.roundRect(left - pad, base - 0.25 * size - pad, text_w + 2 * pad, 1.1 * size + 2 * pad, pad, stroke=0, fill=1)
+    c.setFillColorRGB(0, 0, 0)
+    c.setFont(FONT, size)
+    c.drawString(left, base, text)
+    c.restoreState()
+
+# ---------------------------
+# SVG
+# ---------------------------
+def scene_to_svg(scene, width_px=None):
+    """
+    Standalone SVG document for a scene. Coordinates stay in drawing units (y flipped);
+    width_px sets the rendered width, default the scene's figsize at 100 px/in.
+    """
+    x0, y0, dx, dy = _extent(scene)
+    y_top = y0 + dy
+    unit = 1.0 / points_per_unit(scene)  # drawing units per point
+    width_px = width_px or scene["figsize"][0] * 100
+    height_px = width_px * dy / dx
+
+    def fy(v):
+        return y_top - v
+
+    def num(v):
+        return f"{v:.2f}"
+
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{num(width_px)}" height="{num(height_px)}" '
+           f'viewBox="{num(x0)} 0 {num(dx)} {num(dy)}" font-family="{FONT}, Arial, sans-serif">',
+           "<defs>"]
+    for color in (_DIM_COLOR, _CALLOUT_COLOR):
+        out.append(f'<marker id="head-{color}" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="{num(_HEAD_LENGTH * unit)}" '
+                   f'markerHeight="{num(2 * _HEAD_WIDTH * unit)}" markerUnits="userSpaceOnUse" orient="auto-start-reverse">'
+                   f'<path d="M0,0 L10,5 L0,10" fill="none" stroke="{color}" stroke-width="1.5"/></marker>')
+    out.append("</defs>")
+    for item in scene["items"]:
+        kind = item["kind"]
+        if kind == "box":
+            rx = f' rx="{num(2)}"' if item["rounded"] else ""
+            out.append(f'<rect x="{num(item["x"])}" y="{num(fy(item["y"] + item["h"]))}" width="{num(item["w"])}" '
+                       f'height="{num(item["h"])}"{rx} fill="{item["face"]}" stroke="{item["edge"]}" '
+                       f'stroke-width="{num(item["lw"] * unit)}"/>')
+        elif kind == "circle":
+            out.append(f'<circle cx="{num(item["cx"])}" cy="{num(fy(item["cy"]))}" r="{num(item["r"])}" '
+                       f'fill="{item["face"]}" stroke="{item["edge"]}" stroke-width="{num(item["lw"] * unit)}"/>')
+        arrow = _arrow(item)
+        if arrow:
+            hx, hy, tx, ty, style, color, lw = arrow
+            marker_color = color if color in (_DIM_COLOR, _CALLOUT_COLOR) else _DIM_COLOR
+            start = f' marker-start="url(#head-{marker_color})"' if style == "<->" else ""
+            out.append(f'<line x1="{num(tx)}" y1="{num(fy(ty))}" x2="{num(hx)}" y2="{num(fy(hy))}" stroke="{color}" '
+                       f'stroke-width="{num(lw * unit)}" marker-end="url(#head-{marker_color})"{start}/>')
+        for lx, ly, text, size, ha, va, rot, boxed in _label_lines(item):
+            size_u = size * unit
+            anchor = {"center": "middle", "right": "end"}.get(ha, "start")
+            baseline = ' dominant-baseline="central"' if va == "center" else ""
+            transform = f' transform="rotate({num(-rot)} {num(lx)} {num(fy(ly))})"' if rot else ""
+            if boxed:
+                text_w = 0.55 * size_u * len(text)
+                pad = 0.12 * size_u
+                left = {"middle": -text_w / 2, "end": -text_w}.get(anchor, 0.0)
+                out.append(f'<rect x="{num(lx + left - pad)}" y="{num(fy(ly) - 0.6 * size_u - pad)}" '
+                           f'width="{num(text_w + 2 * pad)}" height="{num(1.2 * size_u + 2 * pad)}" rx="{num(pad)}" '
+                           f'fill="white"{transform}/>')
+            out.append(f'<text x="{num(lx)}" y="{num(fy(ly))}" font-size="{num(size_u)}" text-anchor="{anchor}"'
+                       f'{baseline}{transform}>{escape(text)}</text>')
+    out.append("</svg>")
+    return "\n".join(out)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the tests import cep_core from the repository root, as the app does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,43 @@
+"""analysis_batch / analysis_batch_frame against analysis_rectangular / _T / _L, bit for bit."""
+import numpy as np
+import pandas as pd
+
+from cep_core import analysis_L, analysis_rectangular, analysis_T
+from cep_core.batch import BATCH_ANALYSIS_KEYS, SECTION_CODES, analysis_batch, analysis_batch_frame
+
+def random_members(n, seed=2):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"section": rng.choice(list(SECTION_CODES), n),
+                         "b": rng.choice([6.0, 8.0, 12.0, 18.0, 24.0], n) + rng.random(n),
+                         "h": rng.choice([8.0, 12.0, 20.0, 30.0, 36.0], n) + rng.random(n),
+                         "tf": rng.choice([2.0, 4.0, 5.0, 6.0, 40.0], n),
+                         "fc": rng.choice([3000.0, 4000.0, 5000.0], n), "tu": rng.uniform(0, 40, n)})
+
+def scalar_analysis(row):
+    if row.section == "Rectangular Section":
+        return analysis_rectangular(row.b, row.h, row.fc, row.tu)
+    return (analysis_T if row.section == "T Section" else analysis_L)(row.b, row.h, row.tf, row.fc, row.tu)
+
+def test_analysis_batch_matches_scalar():
+    df = random_members(3000)
+    out = analysis_batch(df["section"].to_numpy(), df["b"], df["h"], df["tf"], df["fc"], df["tu"])
+    seen = set()
+    for i, row in enumerate(df.itertuples()):
+        res = scalar_analysis(row)
+        for key, value in res.items():
+            assert out[key][i] == value, (i, key, value, out[key][i])
+        if row.section == "Rectangular Section":
+            assert out["b_total"][i] == row.b and out["x"][i] == 0
+        seen.add((row.section, bool(res["safe"])))
+    assert len(seen) == 6
+
+def test_frame_and_int_codes_match():
+    df = random_members(500, seed=4)
+    by_name = analysis_batch(df["section"].to_numpy(), df["b"], df["h"], df["tf"], df["fc"], df["tu"])
+    codes = df["section"].map(SECTION_CODES).to_numpy()
+    by_code = analysis_batch(codes, df["b"], df["h"], df["tf"], df["fc"], df["tu"])
+    frame = analysis_batch_frame(df)
+    assert list(frame.columns) == BATCH_ANALYSIS_KEYS
+    for key in BATCH_ANALYSIS_KEYS:
+        np.testing.assert_array_equal(by_code[key], by_name[key], err_msg=key)
+        np.testing.assert_array_equal(frame[key].to_numpy(), by_name[key], err_msg=key)
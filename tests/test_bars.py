@@ -0,0 +1,60 @@
+"""Rebar catalog values and the vectorized lookups."""
+import numpy as np
+import pytest
+
+from cep_core.bars import ASTM_BARS, ASTM_METRIC_BARS, CATALOGS, CSA_BARS, EN_BARS, area_of_bar, get_catalog
+
+MM2 = 1 / 25.4 ** 2
+# published nominal areas (mm^2) and masses (kg/m)
+EN_AREAS = {8: 50.3, 10: 78.5, 12: 113.1, 16: 201.1, 20: 314.2, 25: 490.9, 32: 804.2, 40: 1256.6}
+EN_MASSES = {8: 0.395, 12: 0.888, 16: 1.58, 25: 3.85, 40: 9.86}
+CSA_AREAS = {10: 100, 15: 200, 20: 300, 25: 500, 30: 700, 35: 1000, 45: 1500, 55: 2500}
+LB_FT_PER_KG_M = 0.671969
+
+def test_astm_values():
+    assert ASTM_BARS.area(4) == 0.19635 and ASTM_BARS.area(8) == 0.785398
+    assert ASTM_BARS.weight(4) == pytest.approx(0.668, rel=2e-3)
+    assert ASTM_BARS.weight(8) == pytest.approx(2.670, rel=2e-3)
+    assert ASTM_BARS.label(5) == "#5" and 12 not in ASTM_BARS
+
+def test_astm_metric_is_the_same_bars():
+    assert list(ASTM_METRIC_BARS.areas) == list(ASTM_BARS.areas)
+    assert ASTM_METRIC_BARS.area(13) == ASTM_BARS.area(4) and ASTM_METRIC_BARS.area(57) == ASTM_BARS.area(18)
+
+@pytest.mark.parametrize("bar, area", EN_AREAS.items())
+def test_en_areas(bar, area):
+    # published areas are rounded to 0.1 mm^2
+    assert EN_BARS.area(bar) == pytest.approx(area * MM2, rel=2e-3)
+
+@pytest.mark.parametrize("bar, mass", EN_MASSES.items())
+def test_en_masses(bar, mass):
+    assert EN_BARS.weight(bar) == pytest.approx(mass * LB_FT_PER_KG_M, rel=5e-3)
+
+@pytest.mark.parametrize("bar, area", CSA_AREAS.items())
+def test_csa_areas(bar, area):
+    assert CSA_BARS.area(bar) == pytest.approx(area * MM2, rel=1e-2)
+    assert CSA_BARS.label(bar) == f"{bar}M"
+
+@pytest.mark.parametrize("name", list(CATALOGS))
+def test_vectorized_lookups_match_scalar(name):
+    catalog = CATALOGS[name]
+    # every known id plus gaps, negatives and ids past the dense tables
+    ids = np.array(list(catalog.ids) + [-5, -1, 0, 1, 2, 7, 11, 13, 99, 10_000])
+    for scalar, vector in ((catalog.area, catalog.areas_of), (catalog.diameter, catalog.diameters_of),
+                           (catalog.weight, catalog.weights_of)):
+        expected = [scalar(int(i)) for i in ids]
+        np.testing.assert_array_equal(vector(ids), expected)
+        np.testing.assert_array_equal(vector(np.stack([ids, ids[::-1]])), [expected, expected[::-1]])
+    frame = catalog.frame()
+    np.testing.assert_array_equal(frame["area"], catalog.areas_of(frame["id"]))
+    assert list(frame["label"]) == [catalog.label(i) for i in catalog.ids]
+
+def test_legacy_helpers_and_ranges():
+    for bar in (*ASTM_BARS.ids, 2, 12):
+        assert area_of_bar(bar) == ASTM_BARS.area(bar)
+    assert ASTM_BARS.between(0.375, 0.625) == [3, 4, 5]
+    assert EN_BARS.first_with_area(EN_BARS.area(16)) == 16
+    assert EN_BARS.first_with_area(100.0) is None
+    assert get_catalog("EN") is EN_BARS
+    with pytest.raises(ValueError):
+        get_catalog("BS")
@@ -0,0 +1,93 @@
+"""design_batch / design_batch_frame against the scalar design_* functions, bit for bit."""
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cep_core import compute_section_geometry, design_L, design_T, design_rectangular
+from cep_core.batch import BATCH_DESIGN_KEYS, SECTION_CODES, design_batch, design_batch_frame
+
+COLUMNS = ["section", "b", "h", "tf", "fc", "fy", "fyt", "tu", "vu", "bar_l", "nl", "As_flexure", "nt", "bar_top"]
+
+def random_rows(n, seed=1):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        section = rng.choice(list(SECTION_CODES))
+        rows.append((section,
+                     rng.choice([6, 8, 10, 12, 14, 18, 24]) + rng.random(),
+                     rng.choice([8, 12, 16, 20, 24, 30, 36]) + rng.random(),
+                     None if section == "Rectangular Section" else rng.choice([2, 4, 5, 6]),
+                     rng.choice([3000.0, 4000.0, 5000.0, 6000.0]), rng.choice([40.0, 60.0]), rng.choice([40.0, 60.0]),
+                     rng.uniform(0, 80), rng.uniform(0, 120), rng.choice(range(3, 11)), rng.randint(0, 6),
+                     rng.uniform(0, 4), rng.randint(0, 4), rng.choice(range(3, 11))))
+    return rows
+
+def scalar_design(row):
+    section, b, h, tf = row[:4]
+    if section == "Rectangular Section":
+        return design_rectangular(b, h, *row[4:])
+    return (design_T if section == "T Section" else design_L)(b, h, tf, *row[4:])
+
+def batch_design(rows):
+    cols = list(zip(*rows))
+    tf = np.array([np.nan if t is None else t for t in cols[3]])
+    return design_batch(np.array(cols[0]), cols[1], cols[2], tf, *cols[4:])
+
+def branch(res):
+    if res.get("safe", False):
+        return "safe"
+    if res.get("demand_exceeds_capacity", False):
+        return "exceeds"
+    return "almin" if res.get("Almin_governs", False) else "designed"
+
+@pytest.fixture(scope="module")
+def rows():
+    return random_rows(4000)
+
+def test_design_batch_matches_scalar(rows):
+    out = batch_design(rows)
+    seen = set()
+    for i, row in enumerate(rows):
+        res = scalar_design(row)
+        geometry = compute_section_geometry(row[1], row[2], row[0], row[3])
+        for key in ("Acp", "Pcp", "Aoh", "Ph", "Ao", "bf"):
+            assert out[key][i] == geometry[key], (i, key)
+        for key, value in res.items():
+            # == and the scalar's own type: bit-equal floats, ints as ints
+            assert out[key][i] == value and type(value)(out[key][i]) == value, (i, key, value, out[key][i])
+        for flag in ("safe", "demand_exceeds_capacity", "Almin_governs"):
+            assert bool(out[flag][i]) == res.get(flag, False), (i, flag)
+        # keys the scalar leaves unset are NaN / 0 in the batch
+        for key in set(BATCH_DESIGN_KEYS) - set(res) - {"Acp", "Pcp", "Aoh", "Ph", "Ao", "bf"}:
+            value = out[key][i]
+            assert (not value) or (isinstance(value, float) and np.isnan(value)), (i, key, value)
+        seen.add(branch(res))
+    assert seen == {"safe", "exceeds", "almin", "designed"}
+
+@pytest.mark.parametrize("section", list(SECTION_CODES))
+def test_each_section_type_covers_every_branch(rows, section):
+    branches = {branch(scalar_design(row)) for row in rows if row[0] == section}
+    assert branches == {"safe", "exceeds", "almin", "designed"}
+
+def test_design_batch_frame_matches_design_batch(rows):
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    frame = design_batch_frame(df)
+    out = batch_design(rows)
+    assert list(frame.columns) == BATCH_DESIGN_KEYS
+    for key in BATCH_DESIGN_KEYS:
+        np.testing.assert_array_equal(frame[key].to_numpy(), out[key], err_msg=key)
+
+def test_int_section_codes_match_names(rows):
+    cols = list(zip(*rows))
+    codes = np.array([SECTION_CODES[s] for s in cols[0]])
+    tf = np.array([np.nan if t is None else t for t in cols[3]])
+    by_code = design_batch(codes, cols[1], cols[2], tf, *cols[4:])
+    by_name = batch_design(rows)
+    for key in BATCH_DESIGN_KEYS:
+        np.testing.assert_array_equal(by_code[key], by_name[key], err_msg=key)
+
+def test_nonpositive_depth_raises():
+    with pytest.raises(ValueError):
+        design_batch("Rectangular Section", 10, 2.0, None, 4000, 60, 60, 10, 10, 5, 2, 0.5, 0, 3)
@@ -0,0 +1,70 @@
+"""capacity_rows against check_rows: every Tu below Tu_capacity is adequate; utilization reaches 1 at Tu_max."""
+import numpy as np
+import pytest
+
+from cep_core.batch import section_codes, section_terms
+from cep_core.capacity import capacity_rows, torsion_capacity_batch
+from cep_core.check import check_batch, check_rows
+
+def one(v, dtype=float):
+    return np.array([v], dtype=dtype)
+
+CASES = [
+    # (section, b, h, tf), (vu, bar_l, nl, As_flexure, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar), governs
+    (("T Section", 12, 24, 4), (40, 8, 3, 1.2, 2, 6, 4, 6, 5), "transverse"),
+    (("T Section", 12, 24, 4), (40, 8, 3, 1.2, 2, 6, 5, 4, 5), "longitudinal"),
+    (("Rectangular Section", 10, 16, np.nan), (20, 10, 4, 0.5, 4, 10, 5, 4, 8), "stress"),
+    (("L Section", 12, 30, 5), (40, 8, 3, 1.2, 2, 6, 3, 6, 5), "transverse"),
+]
+
+@pytest.mark.parametrize("section, steel, governs", CASES)
+def test_utilization_is_one_at_tu_max(section, steel, governs):
+    name, b, h, tf = section
+    vu, bar_l, nl, As_flexure, nt, bar_top, stirrup_bar, stirrup_spacing, mid_bar = steel
+    terms = section_terms(section_codes(name, 1), one(b), one(h), one(tf), one(4000), one(60), one(60))
+    bar_l, nl, nt, bar_top, stirrup_bar, mid_bar = (one(v, np.int64)
+                                                    for v in (bar_l, nl, nt, bar_top, stirrup_bar, mid_bar))
+    args = (one(vu), bar_l, nl, one(As_flexure), nt, bar_top, stirrup_bar, one(stirrup_spacing), mid_bar, one(0.0))
+    cap = capacity_rows(terms, *args)
+    Tu = cap["Tu_max"][0]
+    assert Tu > cap["Tth"][0]
+
+    at = check_rows(terms, one(Tu), *args)
+    assert at["utilization"][0] == pytest.approx(1.0, rel=1e-9)
+    assert at["governs"][0] == governs
+    assert check_rows(terms, one(Tu * (1 - 1e-9)), *args)["adequate"][0]
+    assert not check_rows(terms, one(Tu * (1 + 1e-6)), *args)["adequate"][0]
+
+def test_almin_gap_holds_capacity_at_tth():
+    # the module docstring's member: its bars are short of Almin from Tth up to Tu_almin
+    steel = dict(vu=40, bar_l=8, nl=3, As_flexure=1.2, nt=2, bar_top=6, stirrup_bar=4, stirrup_spacing=6, mid_bar=5)
+    cap = torsion_capacity_batch("T Section", 12, 24, 4, 4000, 60, 60, **steel)
+    assert cap["Tth"][0] < cap["Tu_almin"][0] < cap["Tu_max"][0]
+    assert cap["Tu_capacity"][0] == cap["Tth"][0] and cap["governs"][0] == "longitudinal"
+    inside = check_batch("T Section", 12, 24, 4, 4000, 60, 60, 6.0, **steel)
+    assert not inside["adequate"][0] and inside["governs"][0] == "longitudinal"
+    # the steel carries Tu_almin to Tu_max
+    band = check_batch("T Section", 12, 24, 4, 4000, 60, 60,
+                       np.linspace(cap["Tu_almin"][0], cap["Tu_max"][0], 50)[1:-1], **steel)
+    assert band["adequate"].all()
+
+def test_adequate_everywhere_below_capacity():
+    rng = np.random.default_rng(17)
+    n = 3000
+    members = (rng.choice(["Rectangular Section", "T Section", "L Section"], n),
+               rng.choice([10.0, 12.0, 14.0, 18.0], n),
+               rng.choice([16.0, 20.0, 24.0, 30.0], n), rng.choice([3.0, 4.0, 5.0], n),
+               rng.choice([3000.0, 4000.0, 5000.0], n), rng.choice([40.0, 60.0], n), rng.choice([40.0, 60.0], n))
+    steel = dict(vu=rng.uniform(0, 80, n), bar_l=rng.integers(5, 11, n), nl=rng.integers(2, 6, n),
+                 As_flexure=rng.uniform(0, 2, n), nt=rng.integers(0, 5, n), bar_top=rng.integers(4, 9, n),
+                 stirrup_bar=rng.integers(3, 6, n), stirrup_spacing=rng.choice([4.0, 6.0, 8.0, 10.0], n),
+                 mid_bar=rng.choice([0, 4, 5, 6], n))
+    cap = torsion_capacity_batch(*members, **steel)
+    Tu_capacity = cap["Tu_capacity"]
+    # the sample has members carried past Tth, and members held at Tth by an Almin gap
+    assert np.any(Tu_capacity > cap["Tth"]) and np.any((cap["Tu_max"] > cap["Tth"]) & (Tu_capacity == cap["Tth"]))
+    for fraction in np.linspace(0.0, 1.0, 80, endpoint=False)[1:]:
+        check = check_batch(*members, Tu_capacity * fraction, **steel)
+        assert check["adequate"].all(), fraction
+    above = check_batch(*members, Tu_capacity * (1 + 1e-6), **steel)
+    assert not above["adequate"][Tu_capacity > 0].any()
@@ -0,0 +1,37 @@
+"""check_batch on the steel design_batch provides."""
+import numpy as np
+
+from cep_core.bars import ASTM_BARS
+from cep_core.batch import design_batch
+from cep_core.check import check_batch
+
+def random_designs(n, seed=5):
+    rng = np.random.default_rng(seed)
+    section = rng.choice(["Rectangular Section", "T Section", "L Section"], n)
+    args = (section, rng.choice([8.0, 10.0, 12.0, 16.0, 24.0], n) + rng.random(n),
+            rng.choice([16.0, 20.0, 24.0, 30.0, 36.0], n) + rng.random(n), rng.choice([3.0, 4.0, 6.0], n),
+            rng.choice([3000.0, 4000.0, 5000.0], n), rng.choice([40.0, 60.0], n), rng.choice([40.0, 60.0], n),
+            rng.uniform(0, 80, n), rng.uniform(0, 120, n))
+    As_flexure = rng.uniform(0, 3, n)
+    nt = rng.integers(0, 4, n)
+    res = design_batch(*args, 8, 0, As_flexure, nt, 6)
+    return args, As_flexure, nt, res
+
+def test_designed_steel_checks_adequate():
+    args, As_flexure, nt, res = random_designs(20000)
+    designed = ~res["safe"] & ~res["demand_exceeds_capacity"]
+    # where no bar fits between 4 in and the spacing limit the design falls back to #3 at the limit,
+    # which is short of Ats: that is a real shortfall and check_batch must report it
+    Av = ASTM_BARS.areas_of(np.where(designed, res["stirrup_bar"], 3))
+    stirrups_fit = 2 * Av / res["stirrup_spacing"] >= res["Ats"]
+    # the design's top bars are the user's nt #6 plus num_top_bars_needed #6 for Al / 3, so the
+    # check sees the user's bars as the top flexural steel
+    check = check_batch(*args, 8, res["num_bottom_bars_needed"], As_flexure, res["num_top_bars_needed"], 6,
+                        res["stirrup_bar"], res["stirrup_spacing"], res["mid_bar"], As_top=res["provided_top_by_user"])
+    ok = designed & stirrups_fit
+    assert ok.sum() > 10000 and (designed & ~stirrups_fit).any()
+    assert np.all(check["adequate"][ok]) and np.all(check["utilization"][ok] <= 1)
+    for key in ("util_stress", "util_long", "util_spacing"):
+        assert np.all(check[key][designed] <= 1), key
+    assert np.all(check["util_trans"][designed & ~stirrups_fit] > 1)
+    assert np.all(check["utilization"][res["safe"]] == 0)
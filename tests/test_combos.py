@@ -0,0 +1,89 @@
+"""governing_rows / envelope against a per-beam pandas groupby().idxmax() reference."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from cep_core.combos import GOVERNED, _take, design_combinations, envelope, governing_rows
+
+nan = np.nan
+
+def reference_rows(values, beam, n_beams):
+    """Per beam, the first row of its largest non-NaN value; -1 if none."""
+    df = pd.DataFrame({"beam": beam, "value": values}).dropna()
+    idx = df.groupby("beam")["value"].idxmax()
+    return idx.reindex(range(n_beams), fill_value=-1).to_numpy(dtype=np.int64)
+
+def test_governing_rows_edges():
+    # beam 0: tie (first row wins), beam 1: all NaN, beam 2: none, beam 3: NaN then max, beam 4: single row
+    beam = np.array([0, 1, 3, 0, 1, 0, 3, 3, 4])
+    values = np.array([2.0, nan, nan, 5.0, nan, 5.0, 1.0, 7.0, -3.0])
+    expected = np.array([3, -1, -1, 7, 8])
+    np.testing.assert_array_equal(governing_rows(values, beam, 5), expected)
+    np.testing.assert_array_equal(reference_rows(values, beam, 5), expected)
+
+def test_governing_rows_all_nan_and_empty():
+    np.testing.assert_array_equal(governing_rows(np.full(4, nan), np.array([0, 0, 1, 1]), 3), [-1, -1, -1])
+    np.testing.assert_array_equal(governing_rows(np.array([]), np.array([], dtype=np.int64), 3), [-1, -1, -1])
+
+def test_take_fills_the_sentinel():
+    rows = np.array([1, -1, 0])
+    np.testing.assert_array_equal(_take(np.array([1.5, 2.5]), rows), [2.5, nan, 1.5])
+    np.testing.assert_array_equal(_take(np.array([4, 7]), rows), [7, 0, 4])
+    np.testing.assert_array_equal(_take(np.array([True, True]), rows), [True, False, True])
+    np.testing.assert_array_equal(_take(np.array([]), np.array([-1, -1])), [nan, nan])
+
+def test_random_values_with_ties_match_groupby():
+    rng = np.random.default_rng(3)
+    n_beams = 300
+    beam = rng.integers(0, n_beams, 5000)
+    # few distinct values for ties, some NaN; beams 0-9 all NaN, beams >= 290 without rows
+    values = rng.integers(0, 4, beam.size).astype(float)
+    values[rng.random(beam.size) < 0.3] = nan
+    values[beam < 10] = nan
+    beam = np.where(beam >= 290, beam - 100, beam)
+    np.testing.assert_array_equal(governing_rows(values, beam, n_beams), reference_rows(values, beam, n_beams))
+
+@pytest.fixture(scope="module")
+def combinations():
+    rng = np.random.default_rng(7)
+    n_beams = 200
+    sections = rng.choice(["Rectangular Section", "T Section", "L Section"], n_beams)
+    beams = dict(section_type=sections, b=rng.choice([8.0, 12.0, 16.0, 24.0], n_beams),
+                 h=rng.choice([16.0, 24.0, 30.0], n_beams), tf=rng.choice([4.0, 6.0], n_beams),
+                 fc=rng.choice([3000.0, 4000.0, 5000.0], n_beams), fy=60.0, fyt=60.0,
+                 bar_l=rng.integers(5, 10, n_beams), nl=rng.integers(2, 5, n_beams),
+                 As_flexure=rng.uniform(0, 2, n_beams), nt=2, bar_top=6)
+    # beams 190-199 have no combinations, 180-189 only safe ones (an all-NaN ratio);
+    # loads on a coarse grid so beams tie across combinations
+    beam = rng.integers(0, 190, 3000)
+    tu = np.where(beam >= 180, 0.0, rng.choice([0.0, 5.0, 20.0, 40.0, 80.0], beam.size))
+    vu = rng.choice([0.0, 20.0, 60.0], beam.size)
+    rows, terms = design_combinations(*beams.values(), beam, tu, vu)
+    return rows, terms, n_beams
+
+def test_envelope_matches_groupby(combinations):
+    rows, terms, n_beams = combinations
+    env = envelope(rows, terms)
+    beam = rows["beam"]
+    assert np.all(env["n_combos"][190:] == 0)
+    for key, governed in GOVERNED.items():
+        chosen = reference_rows(rows[key], beam, n_beams)
+        np.testing.assert_array_equal(env[f"{key}_combo"], chosen, err_msg=key)
+        assert np.all(chosen[190:] == -1)
+        for k in [key] + governed:
+            fill = {"b": False, "i": 0}.get(rows[k].dtype.kind, nan)
+            expected = np.where(chosen >= 0, rows[k][np.maximum(chosen, 0)], fill)
+            np.testing.assert_array_equal(env[k], expected, err_msg=k)
+
+def test_envelope_flags(combinations):
+    rows, terms, n_beams = combinations
+    env = envelope(rows, terms)
+    df = pd.DataFrame({"beam": rows["beam"], "safe": rows["safe"], "exceeds": rows["demand_exceeds_capacity"]})
+    grouped = df.groupby("beam")
+    np.testing.assert_array_equal(env["safe"], grouped["safe"].all().reindex(range(n_beams), fill_value=False))
+    np.testing.assert_array_equal(env["demand_exceeds_capacity"],
+                                  grouped["exceeds"].any().reindex(range(n_beams), fill_value=False))
+    # every case the envelope has to handle is present: all-safe beams and ties
+    assert env["safe"][180:190].all() and np.all(env["demand_capacity_ratio_combo"][180:190] == -1)
+    ties = pd.DataFrame({"beam": rows["beam"], "Al": rows["Al"]}).dropna()
+    assert (ties.groupby("beam")["Al"].transform("max") == ties["Al"]).groupby(ties["beam"]).sum().max() > 1
@@ -0,0 +1,80 @@
+"""flexural_design equilibrium and strength, and design_beam_batch against design_batch."""
+import numpy as np
+import pytest
+
+from cep_core.batch import BATCH_DESIGN_KEYS, design_batch, design_rows, section_codes, section_terms
+from cep_core.flexure import PHI_FLEXURE, design_beam_batch, flexural_design
+
+SECTIONS = ["Rectangular Section", "T Section", "L Section"]
+
+def random_beams(n, seed=23):
+    rng = np.random.default_rng(seed)
+    return dict(section_type=rng.choice(SECTIONS, n), b=rng.choice([10.0, 12.0, 14.0, 18.0], n),
+                h=rng.choice([18.0, 24.0, 30.0, 36.0], n), tf=rng.choice([3.0, 4.0, 6.0], n),
+                fc=rng.choice([3000.0, 4000.0, 5000.0, 8000.0], n), fy=rng.choice([40.0, 60.0], n),
+                mu=rng.uniform(0, 900, n))
+
+@pytest.fixture(scope="module")
+def beams():
+    return random_beams(20000)
+
+def test_equilibrium_and_strength(beams):
+    out = flexural_design(*[beams[k] for k in ("section_type", "b", "h", "tf", "fc", "fy", "mu")])
+    codes = section_codes(beams["section_type"])
+    b, tf, fc, d, bf, a = beams["b"], beams["tf"], beams["fc"], out["d"], out["bf"], out["a"]
+    fy_psi = beams["fy"] * 1000
+    M = beams["mu"] * 12000
+    designed = ~out["flexure_exceeds"] & (M > 0)
+    web = out["web_compression"]
+    # compression: the flange overhangs over tf plus the web over a, or the block over bf
+    Cf = np.where(web, 0.85 * fc * (bf - b) * tf, 0.0)
+    Cw = 0.85 * fc * np.where(web, b, bf) * a
+    phiMn = PHI_FLEXURE * (Cf * (d - tf / 2) + Cw * (d - a / 2))
+    floored = out["As_flexure"] == out["As_min"]
+    strength = designed & ~floored
+    np.testing.assert_allclose(out["As_flexure"][strength] * fy_psi[strength], (Cf + Cw)[strength], rtol=1e-12)
+    np.testing.assert_allclose(phiMn[strength], M[strength], rtol=1e-9)
+    # As_min floor: the floored rows need no more than As_min
+    assert np.all((Cf + Cw)[designed & floored] / fy_psi[designed & floored] <= out["As_min"][designed & floored])
+    assert np.all(out["eps_t"][designed] >= 0.005)
+    assert np.all(out["As_flexure"][M == 0] == 0)
+    # every branch is exercised per section type
+    for code, name in enumerate(SECTIONS):
+        rows = strength & (codes == code)
+        assert rows.any() and (designed & floored & (codes == code)).any(), name
+        assert (out["flexure_exceeds"] & (codes == code)).any(), name
+        if code:
+            assert (rows & web).any() and (rows & ~web).any(), name
+            np.testing.assert_array_equal(a[rows & ~web] <= tf[rows & ~web], True)
+        else:
+            assert not web[codes == code].any()
+
+def test_exceeds_rows_are_nan(beams):
+    out = design_beam_batch(beams["section_type"], beams["b"], beams["h"], beams["tf"], beams["fc"], beams["fy"], 60.0,
+                            beams["mu"], 30.0, 40.0, 8, 2, 2, 6, mu_top=beams["mu"] / 2)
+    exceeds = out["flexure_exceeds"]
+    assert exceeds.any()
+    flexure_failed = np.isnan(out["As_flexure"])
+    assert np.all(np.isnan(out["req_bottom"][flexure_failed]))
+    assert np.all(out["num_bottom_bars_needed"][flexure_failed] == 0)
+    top_failed = np.isnan(out["As_top"])
+    assert np.all(np.isnan(out["req_top"][top_failed])) and np.all(out["num_top_bars_needed"][top_failed] == 0)
+    np.testing.assert_array_equal(exceeds, flexure_failed | top_failed)
+
+@pytest.mark.parametrize("with_top", [False, True])
+def test_design_beam_batch_matches_design_batch(beams, with_top):
+    args = [beams[k] for k in ("section_type", "b", "h", "tf", "fc", "fy")]
+    tu = np.linspace(0, 60, beams["b"].size)
+    mu_top = beams["mu"] / 2 if with_top else None
+    out = design_beam_batch(*args, 60.0, beams["mu"], tu, 40.0, 8, 2, 2, 6, mu_top=mu_top)
+    As = np.nan_to_num(out["As_flexure"])
+    if with_top:
+        terms = section_terms(section_codes(args[0]), *args[1:], np.full(As.size, 60.0))
+        ref = design_rows(terms, tu, np.full(As.size, 40.0), np.full(As.size, 8), np.full(As.size, 2), As,
+                          np.full(As.size, 2), np.full(As.size, 6), As_top=np.nan_to_num(out["As_top"]))
+    else:
+        ref = design_batch(*args, 60.0, tu, 40.0, 8, 2, As, 2, 6)
+    ok = ~out["flexure_exceeds"]
+    assert ok.sum() > 10000 and (ok & ~out["safe"]).any()
+    for key in BATCH_DESIGN_KEYS:
+        np.testing.assert_array_equal(out[key][ok], ref[key][ok], err_msg=key)
@@ -0,0 +1,72 @@
+"""Incremental runs reuse unchanged beams and write the same output as a full run."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import cep_core.incremental as incremental
+from cep_core.incremental import run_schedule_incremental
+from cep_core.schedule import run_schedule
+from cep_core.store import ResultsStore
+
+def schedule(n, seed=17):
+    rng = np.random.default_rng(seed)
+    section = rng.choice(["Rectangular Section", "T Section", "L Section"], n)
+    return pd.DataFrame({"beam_id": [f"B{i:03d}" for i in range(n)], "section": section,
+                         "b": rng.choice([10.0, 12.0, 14.0], n), "h": rng.choice([18.0, 24.0, 30.0], n),
+                         "tf": np.where(section == "Rectangular Section", np.nan, rng.choice([4.0, 5.0], n)),
+                         "fc": 4000.0, "fy": 60.0, "fyt": 60.0, "tu": rng.uniform(0, 60, n).round(3),
+                         "vu": rng.uniform(0, 80, n).round(3), "bar_l": 8, "nl": rng.integers(2, 5, n),
+                         "As_flexure": rng.uniform(0, 2, n).round(3), "nt": 2, "bar_top": 6})
+
+@pytest.fixture
+def recomputed(monkeypatch):
+    """Number of rows compute_chunk is asked for during incremental runs."""
+    calls = []
+    compute_chunk = incremental.compute_chunk
+
+    def counting(chunk, mode):
+        calls.append(len(chunk))
+        return compute_chunk(chunk, mode)
+
+    monkeypatch.setattr(incremental, "compute_chunk", counting)
+    return calls
+
+def run_both(tmp_path, df, store, name):
+    path = tmp_path / f"{name}.csv"
+    df.to_csv(path, index=False)
+    summary = run_schedule_incremental(path, tmp_path / f"{name}-incremental.csv", store, "Tower-A", chunksize=16)
+    run_schedule(path, tmp_path / f"{name}-full.csv", chunksize=16)
+    assert (tmp_path / f"{name}-incremental.csv").read_text() == (tmp_path / f"{name}-full.csv").read_text()
+    return summary
+
+def test_incremental_runs_match_full_runs(tmp_path, recomputed):
+    store = ResultsStore(tmp_path / "store")
+    df = schedule(60)
+    first = run_both(tmp_path, df, store, "first")
+    assert (first["recomputed"], first["reused"], first["dropped"], first["run"]) == (60, 0, 0, 1)
+
+    # edit five beams, nudge one below the hash rounding, drop two and add three
+    edited = df.copy()
+    edited.loc[[3, 17, 18, 40, 59], "tu"] += 5.0
+    edited.loc[7, "vu"] += 1e-9
+    edited = edited.drop(index=[10, 11])
+    edited = pd.concat([edited, schedule(3, seed=4).assign(beam_id=["N1", "N2", "N3"])], ignore_index=True)
+    recomputed.clear()
+    second = run_both(tmp_path, edited, store, "second")
+    assert (second["recomputed"], second["reused"], second["dropped"], second["run"]) == (8, 53, 2, 2)
+    assert sum(recomputed) == 8
+
+    recomputed.clear()
+    third = run_both(tmp_path, edited, store, "third")
+    assert (third["recomputed"], third["reused"], third["run"]) == (0, 61, None)
+    assert recomputed == [] and store.runs("Tower-A") == [1, 2]
+    # the edited beams' newest rows are the recomputed ones
+    got = store.get("Tower-A", ["B003", "N1", "B004"])
+    assert dict(zip(got["beam_id"], got["_run"])) == {"B003": 2, "B004": 1, "N1": 2}
+
+def test_duplicate_ids_are_rejected(tmp_path):
+    df = schedule(4).assign(beam_id=["A", "B", "A", "C"])
+    path = tmp_path / "dup.csv"
+    df.to_csv(path, index=False)
+    with pytest.raises(ValueError, match="unique"):
+        run_schedule_incremental(path, tmp_path / "out.csv", ResultsStore(tmp_path / "store"), "P")
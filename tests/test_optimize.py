@@ -0,0 +1,57 @@
+"""optimize_design against design_batch / check_batch and a brute-forced grid."""
+import itertools
+
+import numpy as np
+import pytest
+
+from cep_core.bars import ASTM_BARS
+from cep_core.batch import design_batch
+from cep_core.check import check_batch
+from cep_core.optimize import COVER, MIN_CLEAR_SPACING, optimize_design
+
+LOADS = dict(fc=4000, fy=60, fyt=60, tu=25, vu=40, As_flexure=1.2)
+GRID = dict(b=[10, 12, 14, 16], h=[18, 20, 22, 24], tf=[4, 5])
+BOTTOM, TOP, STIRRUPS = [6, 7, 8], [4, 5, 6], [3, 4]
+COUNTS = range(2, 7)
+SPACINGS = np.arange(4.0, 12.5, 0.5)
+
+@pytest.fixture(scope="module")
+def result():
+    return optimize_design("T Section", **LOADS, **GRID, bottom_bars=BOTTOM, top_bars=TOP, stirrup_bars=STIRRUPS)
+
+def test_best_passes_design_and_check(result):
+    best = result["best"]
+    res = design_batch("T Section", best["b"], best["h"], best["tf"], 4000, 60, 60, 25, 40, 8, 0, 1.2, 0, 6)
+    assert not res["safe"][0] and not res["demand_exceeds_capacity"][0]
+    assert best["num_bottom"] * ASTM_BARS.area(int(best["bottom_bar"])) >= res["req_bottom"][0]
+    assert best["num_top"] * ASTM_BARS.area(int(best["top_bar"])) >= res["req_top"][0]
+    assert 2 * best["Av_s"] >= res["Ats"][0]
+    assert 4 <= best["stirrup_spacing"] <= min(res["Ph"][0] / 8, 12)
+    check = check_batch("T Section", best["b"], best["h"], best["tf"], 4000, 60, 60, 25, 40, int(best["bottom_bar"]),
+                        int(best["num_bottom"]), 1.2, int(best["num_top"]), int(best["top_bar"]),
+                        int(best["stirrup_bar"]), best["stirrup_spacing"], int(best["mid_bar"]))
+    assert check["adequate"][0] and check["utilization"][0] <= 1
+
+def fits(width, count, bar, stirrup_bar):
+    room = width - 2 * COVER - 2 * ASTM_BARS.diameter(stirrup_bar) - count * ASTM_BARS.diameter(bar)
+    return room / (count - 1) >= max(MIN_CLEAR_SPACING, ASTM_BARS.diameter(bar))
+
+def test_best_is_cheapest_on_brute_forced_grid(result):
+    assert result["stats"]["safe"] == 0
+    layouts = list(itertools.product(BOTTOM, COUNTS, TOP, COUNTS, STIRRUPS, SPACINGS))
+    bottom_bar, nl, top_bar, nt, stirrup_bar, spacing = (np.array(v) for v in zip(*layouts))
+    cheapest = np.inf
+    for b, h, tf in itertools.product(GRID["b"], GRID["h"], GRID["tf"]):
+        design = design_batch("T Section", b, h, tf, 4000, 60, 60, 25, 40, 8, 0, 1.2, 0, 6)
+        if design["demand_exceeds_capacity"][0]:
+            continue
+        mid_bar = int(design["mid_bar"][0])
+        check = check_batch("T Section", b, h, tf, 4000, 60, 60, 25, 40, bottom_bar, nl, 1.2, nt, top_bar,
+                            stirrup_bar, spacing, mid_bar)
+        volume = 12 * (nl * ASTM_BARS.areas_of(bottom_bar) + nt * ASTM_BARS.areas_of(top_bar) + design["area_mid"][0]
+                       + ASTM_BARS.areas_of(stirrup_bar) / spacing * design["Ph"][0])
+        ok = check["adequate"] & np.array([fits(b, c, bar, s) and fits(b, ct, top, s) for c, bar, ct, top, s
+                                           in zip(nl, bottom_bar, nt, top_bar, stirrup_bar)])
+        if ok.any():
+            cheapest = min(cheapest, volume[ok].min())
+    assert result["best"]["steel_volume"] == pytest.approx(cheapest, rel=1e-12)
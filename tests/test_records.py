@@ -0,0 +1,67 @@
+"""Record mapping behaviour and zero-copy columnar conversion."""
+import numpy as np
+import pytest
+
+from cep_core import compute_section_geometry, design_T
+from cep_core.records import (BeamInput, BeamResult, SectionGeometry, columns_frame, columns_table, merge_results,
+                              records_frame)
+
+def test_mapping_over_set_fields():
+    r = BeamResult(Acp=10.0, safe=False)
+    assert r["Acp"] == 10.0 and "safe" in r and "Al" not in r
+    assert list(r) == ["Acp", "safe"] and len(r) == 2
+    assert r.get("Al") is None and r.get("Al", 1) == 1
+    with pytest.raises(KeyError):
+        r["Al"]
+    r["Al"] = 0.5
+    assert list(r) == ["Acp", "safe", "Al"] and dict(r) == {"Acp": 10.0, "safe": False, "Al": 0.5}
+    del r["Al"]
+    assert "Al" not in r
+    with pytest.raises(KeyError):
+        del r["Al"]
+    assert r.pop("safe") is False and r.setdefault("Tth", 2.0) == 2.0 and r["Tth"] == 2.0
+
+def test_unknown_fields_raise_keyerror():
+    with pytest.raises(KeyError):
+        BeamResult(not_a_field=1)
+    r = BeamInput(section="T Section")
+    with pytest.raises(KeyError):
+        r["copy"] = 1
+    with pytest.raises(KeyError):
+        r.update({"nope": 1})
+    # methods are not fields
+    assert "copy" not in r and r.get("items") is None
+    assert not hasattr(r, "__dict__")
+
+def test_none_is_a_value():
+    r = BeamInput(section="Rectangular Section", tf=None)
+    assert "tf" in r and r["tf"] is None and "fc" not in r
+
+def test_dict_compatibility():
+    geometry = compute_section_geometry(12, 24, "T Section", 4)
+    results = design_T(12, 24, 4, 4000, 60, 60, 25, 40, 8, 3, 1.2, 2, 6)
+    assert isinstance(geometry, SectionGeometry) and isinstance(results, BeamResult)
+    merged = merge_results(geometry, results)
+    assert merged == {**geometry, **results}
+    assert merged.to_dict() == {**dict(geometry), **dict(results)}
+    copy = merged.copy()
+    copy["Al"] = -1.0
+    assert merged["Al"] == results["Al"] and type(copy) is BeamResult
+    assert BeamResult(merged.items()) == merged
+
+def test_records_frame():
+    records = [BeamResult(Acp=1.0, safe=True), BeamResult(Acp=2.0, Al=0.3)]
+    frame = records_frame(records)
+    assert list(frame.columns) == ["Acp", "safe", "Al"]
+    assert frame["Al"].isna().tolist() == [True, False] and frame["safe"].tolist() == [True, None]
+
+def test_columns_frame_and_table_do_not_copy():
+    columns = {"x": np.linspace(0, 1, 7), "n": np.arange(7), "flag": np.arange(7) % 2 == 0}
+    frame = columns_frame(columns, keys=["x", "n", "flag"])
+    for key, arr in columns.items():
+        assert np.shares_memory(frame[key].to_numpy(), arr), key
+    table = columns_table(columns, keys=["x", "n"])
+    for key in ("x", "n"):
+        assert table.column(key).chunk(0).buffers()[1].address == columns[key].ctypes.data, key
+    assert table.column("x").null_count == 0
+    assert columns_table({"x": np.array([np.nan])}).column("x").null_count == 0
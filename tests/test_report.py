@@ -0,0 +1,37 @@
+"""Peak memory of the multi-beam report as the beam count grows."""
+import copy
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from cep_core.parallel import schedule_report_records
+from cep_core.report import write_batch_report
+
+@pytest.fixture(scope="module")
+def record(tmp_path_factory):
+    path = tmp_path_factory.mktemp("schedule") / "one.csv"
+    pd.DataFrame([dict(beam_id="B1", section="T Section", b=12, h=24, tf=4, fc=4000, fy=60, fyt=60, tu=25, vu=40,
+                       bar_l=8, nl=3, As_flexure=1.2, nt=2, bar_top=6)]).to_csv(path, index=False)
+    return next(schedule_report_records(path))
+
+def peak_memory(record, n, out):
+    def records():
+        for i in range(n):
+            inputs, merged, scene = copy.deepcopy(record)
+            inputs["beam_id"] = f"B{i}"
+            yield inputs, merged, scene
+
+    tracemalloc.start()
+    try:
+        assert write_batch_report(records(), out) == n
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_memory_grows_by_a_bounded_amount_per_beam(record, tmp_path):
+    small = peak_memory(record, 5, str(tmp_path / "small.pdf"))
+    large = peak_memory(record, 25, str(tmp_path / "large.pdf"))
+    per_beam = (large - small) / 20
+    # reportlab keeps every page until save(): growth is linear, about 50 KB a beam
+    assert 0 < per_beam < 96 * 1024
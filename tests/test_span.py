@@ -0,0 +1,51 @@
+"""Stirrup zones cover the Ats at both ends of every station interval."""
+import numpy as np
+
+from cep_core.bars import ASTM_BARS
+from cep_core.span import design_stations, linear_stations, stirrup_zones
+
+def zones_for(n_beams, n_stations, seed=11):
+    rng = np.random.default_rng(seed)
+    section = rng.choice(["Rectangular Section", "T Section", "L Section"], n_beams)
+    b = rng.choice([12.0, 14.0, 16.0, 18.0], n_beams)
+    h = rng.choice([20.0, 24.0, 30.0], n_beams)
+    vu_start, tu_start = rng.uniform(0, 60, n_beams), rng.uniform(0, 40, n_beams)
+    # asymmetric spans, so demand rises towards zone ends as well as falls
+    beam, x, vu, tu = linear_stations(rng.uniform(120, 360, n_beams), n_stations, vu_start,
+                                      -vu_start * rng.uniform(0.2, 1.5, n_beams), tu_start,
+                                      -tu_start * rng.uniform(0.2, 1.5, n_beams))
+    stations, terms = design_stations(section, b, h, 4.0, 4000, 60, 60, beam, x, tu, vu)
+    return stations, stirrup_zones(stations, terms)
+
+def test_every_interval_is_covered():
+    stations, zones = zones_for(300, 101)
+    beam, x = stations["beam"], stations["x"]
+    Ats = np.where(stations["safe"], 0.0, stations["Ats"])
+    exceeds = stations["demand_exceeds_capacity"]
+    inner = np.flatnonzero(beam[1:] == beam[:-1])
+    # the zone covering [x_j, x_j+1): the last zone of the beam starting at or before x_j
+    keys = zones["beam"] * 1e6 + zones["start"]
+    zone = np.searchsorted(keys, beam[inner] * 1e6 + x[inner], side="right") - 1
+    assert np.all(zones["beam"][zone] == beam[inner])
+    assert np.all((zones["start"][zone] <= x[inner]) & (x[inner + 1] <= zones["end"][zone]))
+
+    either_exceeds = exceeds[inner] | exceeds[inner + 1]
+    assert np.all(zones["demand_exceeds_capacity"][zone][either_exceeds])
+    designed = ~zones["demand_exceeds_capacity"][zone]
+    need = np.maximum(Ats[inner], Ats[inner + 1])[designed]
+    zone = zone[designed]
+    assert np.all(need <= zones["Ats"][zone])
+    provided = 2 * ASTM_BARS.areas_of(zones["stirrup_bar"][zone]) / zones["stirrup_spacing"][zone]
+    # #3 at the spacing limit is the selector's fallback where no bar fits; everywhere else it covers
+    fits = provided >= zones["Ats"][zone]
+    assert fits.mean() > 0.95
+    assert np.all(need[fits] <= provided[fits])
+
+def test_zones_tile_each_beam():
+    stations, zones = zones_for(50, 41)
+    for b in np.unique(stations["beam"]):
+        z = zones["beam"] == b
+        x = stations["x"][stations["beam"] == b]
+        assert zones["start"][z][0] == x[0] and zones["end"][z][-1] == x[-1]
+        np.testing.assert_array_equal(zones["start"][z][1:], zones["end"][z][:-1])
+        assert zones["n_stations"][z].sum() == x.size
@@ -0,0 +1,48 @@
+"""The precomputed stirrup index and its vectorized form against the scalar selectors."""
+import math
+
+import numpy as np
+import pytest
+
+from cep_core.batch import select_stirrup_and_spacing_batch
+from cep_core.stirrups import (STIRRUP_TWO_AV, lookup_stirrup_and_spacing, lookup_stirrup_and_spacing_dup,
+                               select_stirrup_and_spacing, select_stirrup_and_spacing_dup)
+
+def ats_grid():
+    values = list(np.linspace(0.0, 0.3, 1501)) + [-0.01, 1.0, 5.0]
+    for two_av in STIRRUP_TWO_AV:
+        # s = 2 Av / Ats exactly 4 (the minimum spacing) and either side of it
+        edge = two_av / 4
+        values += [edge, math.nextafter(edge, 0), math.nextafter(edge, 1), edge * 0.999, edge * 1.001]
+        # s exactly at the spacing limits 12 and Ph / 8 of the Ph grid
+        values += [two_av / limit for limit in (12.0, 6.0, 5.5, 4.5)]
+    return values
+
+# Ph <= 0, limits of Ph / 8 below 4, at 4, between 4 and 12, at 12 and capped at 12
+PH_GRID = [-8.0, 0.0, 16.0, 31.9, 32.0, 36.0, 44.0, 48.0, 60.0, 95.9, 96.0, 96.1, 140.0]
+
+@pytest.mark.parametrize("scalar, lookup, dup", [
+    (select_stirrup_and_spacing, lookup_stirrup_and_spacing, False),
+    (select_stirrup_and_spacing_dup, lookup_stirrup_and_spacing_dup, True),
+])
+def test_index_matches_scalar_selector(scalar, lookup, dup):
+    ats = ats_grid()
+    for Ph in PH_GRID:
+        expected = [scalar(Ph, a) for a in ats]
+        assert [lookup(Ph, a) for a in ats] == expected, Ph
+        bars, spacings = select_stirrup_and_spacing_batch(np.full(len(ats), Ph), np.array(ats), dup=dup)
+        assert [(int(bar), float(s)) for bar, s in zip(bars, spacings)] == expected, Ph
+
+def test_grid_reaches_every_outcome():
+    outcomes = set()
+    for Ph in PH_GRID:
+        for a in ats_grid():
+            bar, s = select_stirrup_and_spacing(Ph, a)
+            if a <= 0 or Ph <= 0:
+                outcomes.add("no steel")
+            elif bar == 3 and STIRRUP_TWO_AV[0] / a > min(Ph / 8, 12):
+                # no bar fits between 4 in and the spacing limit: #3 at the limit
+                outcomes.add("spacing limit")
+            else:
+                outcomes.add(f"bar {bar}")
+    assert {"no steel", "spacing limit", "bar 3", "bar 8"} <= outcomes
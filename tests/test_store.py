@@ -0,0 +1,48 @@
+"""ResultsStore: the newest run of a beam wins after re-appends and compaction."""
+import pandas as pd
+import pytest
+
+from cep_core.store import ResultsStore
+
+def results(ids, al, bar):
+    return pd.DataFrame({"beam_id": ids, "Al": al, "stirrup_bar": bar, "demand_exceeds_capacity": [False] * len(ids)})
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(tmp_path / "store")
+    assert store.append(results(["B1", "B2", "B3", "B4"], [1.0, 2.0, 3.0, 4.0], [3, 3, 4, 4]), "Tower-A") == 1
+    assert store.append(results(["B2", "B4"], [20.0, 40.0], [5, 5]), "Tower-A") == 2
+    # B2 re-appended again, and a second project with the same ids
+    assert store.append(results(["B2"], [200.0], [6]), "Tower-A") == 3
+    store.append(results(["B1", "B2"], [-1.0, -2.0], [3, 3]), "Tower B/2")
+    return store
+
+def latest(frame):
+    return dict(zip(frame["beam_id"], frame["Al"]))
+
+def test_newest_run_wins(store):
+    assert store.runs("Tower-A") == [1, 2, 3]
+    assert latest(store.query(project="Tower-A")) == {"B1": 1.0, "B2": 200.0, "B3": 3.0, "B4": 40.0}
+    assert latest(store.query(project="Tower B/2")) == {"B1": -1.0, "B2": -2.0}
+    assert store.projects() == ["Tower B/2", "Tower-A"]
+    got = store.get("Tower-A", ["B2", "B4"])
+    assert latest(got) == {"B2": 200.0, "B4": 40.0} and got["_run"].tolist() == [3, 2]
+    assert len(store.query(project="Tower-A", latest=False)) == 7
+
+def test_superseded_rows_never_match_a_filter(store):
+    # B2's run-1 and run-2 rows have stirrup_bar 3 / 5; its newest row has 6
+    old = store.query(project="Tower-A", filters=[("stirrup_bar", "in", [3, 5])])
+    assert sorted(old["beam_id"]) == ["B1", "B4"]
+    assert latest(store.query(project="Tower-A", filters=[("stirrup_bar", "==", 6)])) == {"B2": 200.0}
+    every = store.query(filters=[("stirrup_bar", "==", 3)])
+    assert sorted(zip(every["project"], every["beam_id"])) == [("Tower B/2", "B1"), ("Tower B/2", "B2"),
+                                                               ("Tower-A", "B1")]
+
+def test_compact_keeps_newest_and_later_appends_still_win(store):
+    before = store.query(project="Tower-A")
+    store.compact("Tower-A")
+    assert store.runs("Tower-A") == [3]
+    after = store.query(project="Tower-A")
+    pd.testing.assert_frame_equal(after, before)
+    store.append(results(["B3"], [30.0], [7]), "Tower-A")
+    assert latest(store.query(project="Tower-A")) == {"B1": 1.0, "B2": 200.0, "B3": 30.0, "B4": 40.0}
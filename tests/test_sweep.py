@@ -0,0 +1,55 @@
+"""sweep() against design_batch / design_T and analysis_batch, point by point."""
+import itertools
+
+import numpy as np
+import pytest
+
+from cep_core import design_T
+from cep_core.batch import BATCH_ANALYSIS_KEYS, BATCH_DESIGN_KEYS, analysis_batch, design_batch
+from cep_core.sweep import SWEEP_DEFAULTS, sweep
+
+# h first, so the leading chunks hold only h <= 2.5 points; 7 does not divide the grid
+AXES = {"h": [2.0, 2.5, 14.0, 24.0], "tu": [0.0, 5.0, 25.0, 60.0, 200.0], "b": [10.0, 14.0], "fc": [3000.0, 5000.0]}
+FIXED = {"tf": 4.0, "vu": 30.0, "As_flexure": 1.0, "nt": 2}
+
+@pytest.mark.parametrize("chunk_size", [7, 40, 10_000])
+def test_grid_matches_design_batch_and_scalar(chunk_size):
+    res = sweep("T Section", AXES, outputs=BATCH_DESIGN_KEYS, fixed=FIXED, chunk_size=chunk_size)
+    shape = tuple(len(v) for v in AXES.values())
+    params = SWEEP_DEFAULTS | FIXED
+    seen = set()
+    for index in itertools.product(*[range(n) for n in shape]):
+        point = params | {name: AXES[name][i] for name, i in zip(AXES, index)}
+        got = {k: res["values"][k][index] for k in BATCH_DESIGN_KEYS}
+        if point["h"] - 2.5 <= 0:
+            for k, v in got.items():
+                # the batch fill values: NaN floats, 0 ints, False flags
+                assert np.isnan(v) if isinstance(v, np.floating) else not v, (index, k)
+            seen.add("invalid")
+            continue
+        args = [point[k] for k in ("b", "h", "tf", "fc", "fy", "fyt", "tu", "vu", "bar_l", "nl", "As_flexure", "nt",
+                                   "bar_top")]
+        ref = design_batch("T Section", *args)
+        for k in BATCH_DESIGN_KEYS:
+            np.testing.assert_array_equal(got[k], ref[k][0], err_msg=f"{index} {k}")
+        scalar = design_T(*args)
+        for k, v in scalar.items():
+            assert got[k] == v, (index, k)
+        seen.add("safe" if scalar.get("safe") else "exceeds" if scalar.get("demand_exceeds_capacity") else "designed")
+    assert seen == {"invalid", "safe", "exceeds", "designed"}
+    assert all(v.shape == shape for v in res["values"].values())
+
+def test_chunking_does_not_change_results():
+    whole = sweep("T Section", AXES, outputs=BATCH_DESIGN_KEYS, fixed=FIXED, chunk_size=10_000)
+    for chunk_size in (1, 3, 16):
+        part = sweep("T Section", AXES, outputs=BATCH_DESIGN_KEYS, fixed=FIXED, chunk_size=chunk_size)
+        for k in BATCH_DESIGN_KEYS:
+            np.testing.assert_array_equal(part["values"][k], whole["values"][k], err_msg=k)
+
+def test_analysis_grid_matches_analysis_batch():
+    axes = {"b": [10.0, 12.0, 16.0], "tu": [0.0, 4.0, 30.0], "h": [14.0, 24.0, 36.0]}
+    res = sweep("L Section", axes, mode="analysis", outputs=BATCH_ANALYSIS_KEYS, fixed={"tf": 5.0}, chunk_size=5)
+    B, T, H = (g.ravel() for g in np.meshgrid(*axes.values(), indexing="ij"))
+    ref = analysis_batch("L Section", B, H, 5.0, SWEEP_DEFAULTS["fc"], T)
+    for k in BATCH_ANALYSIS_KEYS:
+        np.testing.assert_array_equal(res["values"][k].ravel(), ref[k], err_msg=k)